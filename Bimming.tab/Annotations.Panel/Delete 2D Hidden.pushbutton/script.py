@@ -38,7 +38,10 @@ from Snippets._bimcore_groups import *
 from Snippets._bimcore_collect import *
 from Snippets._bimcore_export import *
 from Snippets._bimcore_functions import *
+from Snippets._bimcore_categories import get_tag_categories
+from Snippets._bimcore_bulk import delete_elements
 import sys
+from itertools import chain
 
 # VARIABLES
 #==================================================
@@ -75,120 +78,89 @@ if not res:
     sys.exit()
 
 # 1️⃣Collecting elements
-# DETAIL GROUPS
-collector_detail_groups_all = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_IOSDetailGroups).WhereElementIsNotElementType().ToElements()
-
-exclusion_list_groups_members = []
-for detail_group in collector_detail_groups_all:
-    members = collect_all_group_members(doc, detail_group)
-    for member in members:
-        exclusion_list_groups_members.append(member.Id)
-
-collector_detail_groups = []
-for detail_group in collector_detail_groups_all:
-    if detail_group.Id not in exclusion_list_groups_members:
-        collector_detail_groups.append(detail_group)
-
-# DIMENSIONS
-cats_01 =  [BuiltInCategory.OST_Dimensions,
-            BuiltInCategory.OST_SpotElevations,
-            BuiltInCategory.OST_SpotCoordinates,
-            BuiltInCategory.OST_SpotSlopes]
-List_cats = List[BuiltInCategory](cats_01)
-multi_cat_filter = ElementMulticategoryFilter(List_cats)
-collector_dimensions_all         = FilteredElementCollector(doc).WherePasses(multi_cat_filter).ToElements()
-collector_dimensions             = [e for e in collector_dimensions_all if e.Id not in exclusion_list_groups_members]
-
-# DETAIL - DETAIL LINES
-collector_detail_lines_all       = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_Lines).WhereElementIsNotElementType().ToElements()
-collector_detail_lines           = [e for e in collector_detail_lines_all if e.Id not in exclusion_list_groups_members]
-
-# DETAIL - COMPONENTS, FILLED REGIONS AND MASK REGIONS
-collector_detail_items_all       = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_DetailComponents).WhereElementIsNotElementType().ToElementIds()
-exclusion_detail_item_nested     = get_nested_detail_items(doc) # DB.ElementId of elements nested in Detail Items
-
-collector_detail_items = []
-for e in collector_detail_items_all:
-    if e in exclusion_detail_item_nested: continue
-    if e in exclusion_list_groups_members: continue
-    collector_detail_items.append(doc.GetElement(e))
-
-# DETAIL - INSULATION
-collector_insulation_lines_all   = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_InsulationLines).WhereElementIsNotElementType().ToElements()
-collector_insulation_lines       = [e for e in collector_insulation_lines_all if e.Id not in exclusion_list_groups_members]
-
-# TEXT
-collector_text_notes_all         = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_TextNotes).WhereElementIsNotElementType().ToElements()
-collector_text_notes             = [e for e in collector_text_notes_all if e.Id not in exclusion_list_groups_members]
-
-# TAGS
-all_built_in_categories = list(System.Enum.GetValues(BuiltInCategory))
-cats_02 = []
-for bic in all_built_in_categories:
-    if 'tag' in str(bic).lower():
-        cats_02.append(bic)
-List_cats = List[BuiltInCategory](cats_02)
-multi_cat_filter                 = ElementMulticategoryFilter(List_cats)
-collector_tags_all               = FilteredElementCollector(doc).WherePasses(multi_cat_filter).ToElements()
-collector_tags                   = [e for e in collector_tags_all if e.Id not in exclusion_list_groups_members]
-
-# COLLECTOR
+# CATEGORIES PER OPTION
+cats_tags = get_tag_categories()  # cached per Revit version
+
+option_categories = [
+    ('Detail Groups',      [BuiltInCategory.OST_IOSDetailGroups]),
+    ('Dimensions',         [BuiltInCategory.OST_Dimensions,
+                            BuiltInCategory.OST_SpotElevations,
+                            BuiltInCategory.OST_SpotCoordinates,
+                            BuiltInCategory.OST_SpotSlopes]),
+    ('Detail Lines',       [BuiltInCategory.OST_Lines]),
+    ('Detail Components (Components, Filled and Mask Regions)', [BuiltInCategory.OST_DetailComponents]),
+    ('Insulation Lines',   [BuiltInCategory.OST_InsulationLines]),
+    ('Text Notes',         [BuiltInCategory.OST_TextNotes]),
+    ('Tags',               cats_tags),
+]
+selected_buckets = [(option, cats) for option, cats in option_categories if option in res]
+
+# EXCLUSIONS (integer ids in a set: constant-time membership instead of a list scan per element)
+exclusion_ids = set()
+
+# Members of detail groups are deleted with their group
+group_index = GroupHierarchyIndex(doc)  # detail group hierarchy, walked once for the whole run
+exclusion_ids.update(group_index.grouped_ids())
+
+# Elements nested in Detail Items are deleted with their host
+if 'Detail Components (Components, Filled and Mask Regions)' in res:
+    for nested_id in get_nested_detail_items(doc):
+        exclusion_ids.add(nested_id.IntegerValue)
+
+# SINGLE PASS OVER ALL SELECTED CATEGORIES (view-specific elements only)
+buckets = classify_view_specific_elements(doc, selected_buckets, exclusion_ids)
+
+# COLLECTOR (in the order the options were selected)
 collector = []
-for e in res:
-    if     e == 'Dimensions': collector.extend(list(collector_dimensions))
-    elif   e == 'Detail Lines': collector.extend(list(collector_detail_lines))
-    elif   e == 'Detail Components (Components, Filled and Mask Regions)': collector.extend(list(collector_detail_items))
-    elif   e == 'Insulation Lines': collector.extend(list(collector_insulation_lines))
-    elif   e == 'Text Notes': collector.extend(list(collector_text_notes))
-    elif   e == 'Tags': collector.extend(list(collector_tags))
-    elif   e == 'Detail Groups': collector.extend(list(collector_detail_groups))
+for option in res:
+    collector.extend(buckets[option])
 
 
 # 2️⃣Extracting data
 elements_to_delete = []
 info_report = [[],["DATA"],['CATEGORY', 'ELEMENT ID', 'FAMILLY NAME', 'TYPE NAME','SHEET INFO', 'VIEW TYPE', 'VIEW TYPE NAME', 'VIEW NAME', 'IS HIDDEN']]
+view_cache = ViewInfoCache(doc)  # each owner view is resolved once
 for e in collector:
-    if e.ViewSpecific:
-        # Info Start
-        cat = e.Category.Name
-        element_id = e.Id.IntegerValue
-        type_name = Element.Name.GetValue(e)
-        if type_name == 'Detail Filled Region': type_name = Element.Name.GetValue(doc.GetElement(e.GetTypeId()))
-        view = doc.GetElement(e.OwnerViewId)
-        view_type = doc.GetElement(view.GetTypeId()).FamilyName
-        view_type_name = get_view_type_name(doc,view)
-        view_name = view.Name
-        sheet_info = view.get_Parameter(BuiltInParameter.VIEW_SHEET_VIEWPORT_INFO).AsString()
-
-        if type_name == 'Masking Region':
-            family_name = 'Masking Region'
-        else:
-            try: family_name = doc.GetElement(e.GetTypeId()).FamilyName
-            except: family_name = e.Id.IntegerValue
-        # Info Ends
-
-        if is_detail_group(e):
-            is_hidden = True
-            #group_members = e.GetMemberIds()
-            group_members = collect_all_group_members(doc, e)
-            for member in group_members:
-                # member = doc.GetElement(member_id)
-                # print(member_id)
-                if is_detail_group(member): continue
-                if is_revision_cloud(member):
-                    is_hidden = False
-                    break
-                if is_element_hidden_permanent(view,member):
-                    continue
-                else:
-                    is_hidden = False
-                    break
-        else:
-            is_hidden = e.IsHidden(doc.GetElement(e.OwnerViewId))
-
-        if is_hidden:
-            elements_to_delete.append(e.Id)
-            info_report.append([cat, element_id, family_name, type_name, sheet_info, view_type, view_type_name, view_name, is_hidden])
+    # Info Start
+    cat = e.Category.Name
+    element_id = e.Id.IntegerValue
+    type_name = Element.Name.GetValue(e)
+    if type_name == 'Detail Filled Region': type_name = Element.Name.GetValue(doc.GetElement(e.GetTypeId()))
+    view_info = view_cache.get(e.OwnerViewId)
+    view = view_info["view"]
+    view_type = view_info["view_type"]
+    view_type_name = view_info["view_type_name"]
+    view_name = view_info["name"]
+    sheet_info = view_info["sheet_info"]
+
+    if type_name == 'Masking Region':
+        family_name = 'Masking Region'
+    else:
+        try: family_name = doc.GetElement(e.GetTypeId()).FamilyName
+        except: family_name = e.Id.IntegerValue
+    # Info Ends
+
+    if is_detail_group(e):
+        is_hidden = True
+        group_members = group_index.members(e)
+        for member in group_members:
+            # member = doc.GetElement(member_id)
+            # print(member_id)
+            if is_detail_group(member): continue
+            if is_revision_cloud(member):
+                is_hidden = False
+                break
+            if is_element_hidden_permanent(view,member):
+                continue
+            else:
+                is_hidden = False
+                break
+    else:
+        is_hidden = e.IsHidden(view)
+
+    if is_hidden:
+        elements_to_delete.append(e.Id)
+        info_report.append([cat, element_id, family_name, type_name, sheet_info, view_type, view_type_name, view_name, is_hidden])
 
 # Check if there are elements to be deleted
 if not elements_to_delete:
@@ -219,17 +191,16 @@ if res == "Delete the instances and save an Excel Report" or res == "Don't delet
     # Create the full file path with the .csv extension
     csv_file_path = os.path.join(directory, report_name[0] + ".csv")
 
-    data = project_info + info_report
-    export_to_csv(csv_file_path, data)
+    export_to_csv(csv_file_path, chain(project_info, info_report))
 
-# problems_to_delete = []
 if res == "Delete the instances and save an Excel Report":
-    with Transaction(doc, TRANSACTION_NAME) as t:
-        t.Start()
-        for element_id in elements_to_delete:
-            try: doc.Delete(element_id)
-            except: pass #problems_to_delete.append(element_id)
-        t.Commit()  # Commit the transaction
-
-    message = '{} Elements have been deleted'.format(len(elements_to_delete))
+    result = delete_elements(doc, elements_to_delete, transaction_name=TRANSACTION_NAME)
+
+    message = '{} Elements have been deleted'.format(len(result.deleted))
+    if result.cascaded:
+        message += '\n{} dependent elements were deleted with them'.format(len(result.cascaded))
+    if result.failed:
+        message += '\n{} elements could not be deleted'.format(len(result.failed))
+    if result.cancelled:
+        message += '\nCancelled: the remaining elements were not deleted'
     forms.alert(message,'title', warn_icon=False)
\ No newline at end of file
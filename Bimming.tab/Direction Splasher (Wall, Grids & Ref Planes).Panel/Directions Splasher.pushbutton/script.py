@@ -2,6 +2,10 @@
 __title__ = "Directions\nSplasher"
 __doc__ = """Colors elements in the active view based on their alignment. Walls, reference planes, and grids that are parallel or perpendicular to each other are highlighted in the same color. Each unique alignment is represented by a different color.
 
+Shift+Click:
+Batch mode. The directions of every wall, reference plane and grid of the model are computed once,
+then the selected plan views are colored and an Excel report of the directions is exported.
+
 Author: Máximo Cubero"""
 
 __min_revit_ver__ = 2021
@@ -18,9 +22,18 @@ TRANSACTION_NAME = "Bimming-Directions Splasher"
 # Custom Libraries
 from Snippets._bimcore_graphics_override import *
 from Snippets._bimcore_vectors import *
+from Snippets._bimcore_directions import *
+from Snippets._bimcore_splash_registry import register_splashed_ids
 from Snippets._bimcore_lists import *
+from Snippets._bimcore_export import *
+from Snippets._bimcore_functions import *
+from Snippets._bimcore_pyrevit import dump2
 # Regular + Autodesk
 from Autodesk.Revit.DB import *
+import os
+from collections import OrderedDict
+# pyRevit
+from pyrevit import forms, EXEC_PARAMS
 
 # VARIABLES
 #==================================================
@@ -30,6 +43,7 @@ app   = __revit__.Application
 
 # MAIN
 #==================================================
+batch = EXEC_PARAMS.config_mode  # Shift+Click
 
 lst_dict = {}
 for e in range(1,12):
@@ -44,53 +58,97 @@ number_of_decimals = forms.ask_for_one_item(
 if not number_of_decimals:
     sys.exit()
 
-# 3️⃣COLLECTING WALLS, GRIDS AND REFERENCE PLANES IN THE ACTIVE VIEW
-all_walls        = FilteredElementCollector(doc, doc.ActiveView.Id).OfClass(Wall).ToElements()
-all_grids        = FilteredElementCollector(doc, doc.ActiveView.Id).OfCategory(BuiltInCategory.OST_Grids).WhereElementIsNotElementType().ToElements()
-all_ref_planes   = FilteredElementCollector(doc, doc.ActiveView.Id).OfClass(ReferencePlane).ToElements()
-
-collector = list(all_walls) + list(all_grids) + list(all_ref_planes)
+# 2️⃣VIEWS TO SPLASH
+if batch:
+    views = forms.select_views(title='Bimming-Directions Splasher',
+                               multiple=True,
+                               filterfunc=lambda v: v.ViewType in DIRECTION_PLAN_VIEW_TYPES)
+    if not views:
+        sys.exit()
+else:
+    views = [doc.ActiveView]
+
+# 3️⃣COLLECTING WALLS, GRIDS AND REFERENCE PLANES
+# The direction of an element does not depend on the view: in batch mode every element
+# of the model is clustered once and each view only looks up its visible elements
+if batch:
+    collector = collect_direction_elements(doc)
+else:
+    collector = collect_direction_elements(doc, doc.ActiveView.Id)
 
 # 4️⃣GROUPING THE ELEMENTS
-elements_tuple = []
-
-for element in collector:
-    direction   = get_direction(element)
-    if not direction:
-        continue
-    vector_X    = XYZ(1,0,0)
-    angle  = get_angle_to_vector(direction, vector_X, scaled_decimal(1, lst_dict[number_of_decimals]))[0]
-    # print ('Angle to Axis X: {}'.format(angle))
-    angle_decimal = Decimal(angle)
-    quadrant = get_vector_quadrant(direction)
-    if angle_decimal == 0 or angle_decimal == 90 or angle_decimal == 180:
-        angle = '%.12f' % (0)
-    elif quadrant == 'Quadrant 1':
-        angle = angle
-    elif quadrant == 'Quadrant 2':
-        angle = '%.12f' % (angle_decimal - 90)
-    elif quadrant == 'Quadrant 3':
-        angle = '%.12f' % (180 - angle_decimal)
-    elif quadrant == 'Quadrant 4':
-        angle = '%.12f' % (90 - angle_decimal)
-    # print ('Angle to Axis X: {}'.format(angle))
-    elements_tuple.append(tuple((element, angle)))
-
-grouped_dict = group_by_second_arg(elements_tuple)
-
-grouped_list = list(grouped_dict.values())
+# Parallel and perpendicular elements are grouped when their angles are within the tolerance
+tolerance = angle_step(lst_dict[number_of_decimals])
+clusters = cluster_directions(collector, tolerance)
+
+cluster_by_id = {}  # element id -> cluster index
+for i, cluster in enumerate(clusters):
+    for el in cluster.elements:
+        cluster_by_id[el.Id.IntegerValue] = i
 
 # 5️⃣OVERRIDING THE ELEMENTS
-colors = generate_random_colors(len(grouped_list))
+colors = generate_random_colors(len(clusters))
 
 t = Transaction(doc, TRANSACTION_NAME)
 t.Start()
 
 solid_fill_pattern = FillPatternElement.GetFillPatternElementByName(doc, FillPatternTarget.Drafting, '<Solid Fill>').Id
 
-for group, color in zip(grouped_list, colors):
-    settings = set_graphics_override_direction(line_weight=5, color_lines=color, color_surfaces=lighten_color(color,0.45), fill_pattern_id=solid_fill_pattern)
-    for el in group:
-        doc.ActiveView.SetElementOverrides(el.Id, settings)
+# One OverrideGraphicSettings per cluster, shared by every view
+styles = [set_graphics_override_direction(line_weight=5, color_lines=color, color_surfaces=lighten_color(color,0.45), fill_pattern_id=solid_fill_pattern)
+          for color in colors]
+patterns = PatternLookup(doc)
+
+for view in views:
+    # Elements of the view by cluster
+    view_groups = {}
+    for element_id in (collect_direction_element_ids(doc, view.Id) if batch else [el.Id for el in collector]):
+        i = cluster_by_id.get(element_id.IntegerValue)
+        if i is not None:
+            view_groups.setdefault(i, []).append(element_id)
+
+    # Elements already splashed with the same style are skipped
+    applier = OverrideApplier(doc, view, patterns)
+    for i, element_ids in view_groups.items():
+        applier.add_style(i, styles[i])
+        applier.apply(element_ids, i)
+
+    # Remember what was colored, so Reset Splasher only reverts these elements
+    register_splashed_ids(view, [element_id for element_ids in view_groups.values() for element_id in element_ids])
 
 t.Commit()
+
+# 6️⃣REPORTING THE ELEMENTS OFF THE MAIN ANGLE OF THEIR DIRECTION
+off_axis = [cluster for cluster in clusters if cluster.outliers]
+if off_axis and not batch:  # in batch mode they are listed in the report
+    details = []
+    for cluster in off_axis:
+        details.append("{:.{}f}° - {} elements, spread {:.3e}°".format(cluster.reference, cluster.decimals, len(cluster), cluster.spread))
+        for element, deviation in cluster.outliers:
+            details.append("    {} [{}] off by {:+.3e}°".format(element.Id, element.Category.Name, deviation))
+
+    forms.alert("{} directions found. {} of them have elements slightly off their main angle."
+                .format(len(clusters), len(off_axis)),
+                sub_msg='See details for the elements off the main angle and by how much',
+                expanded="\n".join(details),
+                warn_icon=False)
+
+# 7️⃣EXPORTING THE DIRECTIONS REPORT (BATCH MODE)
+if batch:
+    project_info = get_project_info(doc, app)
+    file_name = list_to_dict(project_info)['File Name']
+    report_name = generate_report_name(file_name)[0]
+
+    directory = create_report_directory('Bimming_Directions_Splasher')
+    xlsx_file_path = os.path.join(directory, report_name + ".xlsx")
+
+    report = OrderedDict()
+    report["Directions"] = cluster_report_rows(clusters, colors)
+    report["Elements"]   = cluster_element_rows(clusters)
+    report["Views"]      = [["View Name", "View Type"]] + [[v.Name, str(v.ViewType)] for v in views]
+    dump2(xlsx_file_path, report, streaming=True)
+
+    forms.alert("{} views splashed. {} directions found, {} of them with elements slightly off their main angle."
+                .format(len(views), len(clusters), len(off_axis)),
+                sub_msg='Report saved in:\n{}'.format(xlsx_file_path),
+                warn_icon=False)
@@ -17,6 +17,8 @@ TRANSACTION_NAME = "Bimming-One Direction Splasher"
 from Snippets._bimcore_graphics_override import *
 from Snippets._bimcore_selection import *
 from Snippets._bimcore_vectors import *
+from Snippets._bimcore_directions import *
+from Snippets._bimcore_splash_registry import register_splashed_ids
 # Regular + Autodesk
 from Autodesk.Revit.DB import *
 from Autodesk.Revit.UI.Selection import ObjectType
@@ -77,23 +79,9 @@ direction = get_direction(sel_elem)
 if direction == None:
     forms.alert('The element has not the attribute direction. Select a linear one.', exitscript=True)
 
-# 2️⃣"Reversing" and "Rotating" vectors to have them all in the first quadrant to read the angle against X axis
-sel_angle = get_angle_to_vector(direction, XYZ(1,0,0), scaled_decimal(1, lst_dict[number_of_decimals]))[0]
-# print ('Angle to Axis X: {}'.format(sel_angle))
-sel_angle_decimal = Decimal(sel_angle)
-sel_quadrant = get_vector_quadrant(direction)
-if sel_angle_decimal == 0 or sel_angle_decimal == 90 or sel_angle_decimal == 180:
-    sel_angle = '%.12f' % (0)
-elif sel_quadrant == 'Quadrant 1':
-    sel_angle = sel_angle
-elif sel_quadrant == 'Quadrant 2':
-    sel_angle = '%.12f' % (sel_angle_decimal - 90)
-elif sel_quadrant == 'Quadrant 3':
-    sel_angle = '%.12f' % (180 - sel_angle_decimal)
-elif sel_quadrant == 'Quadrant 4':
-    sel_angle = '%.12f' % (90 - sel_angle_decimal)
-# print ('Angle in the first quadrant - sel_angle: {}'.format(sel_angle))
-# print ('Type: {}'.format(type(sel_angle)))
+# 2️⃣Folding the direction into [0°, 90°) to compare it with the rest (parallel or perpendicular)
+decimals = lst_dict[number_of_decimals]
+sel_key = direction_key(direction, decimals)
 
 # 3️⃣COLLECTING WALLS, GRIDS AND REFERENCE PLANES IN THE ACTIVE VIEW
 all_walls        = FilteredElementCollector(doc, doc.ActiveView.Id).OfClass(Wall).ToElements()
@@ -107,32 +95,11 @@ items_group_1 = [] # Group that includes the elements which are parallel or perp
 items_group_2 = [] # Group for the rest of the elements
 
 for element in collector:
-    direction   = get_direction(element)
-    if not direction:
+    key = element_direction_key(element, decimals)
+    if key is None:
         continue
-    vector_X    = XYZ(1,0,0)
-    angle  = get_angle_to_vector(direction, vector_X, scaled_decimal(1, lst_dict[number_of_decimals]))[0]
-    # print ('Angle to Axis X: {}'.format(angle))
-    angle_decimal = Decimal(angle)
-    quadrant = get_vector_quadrant(direction)
-    if angle_decimal == 0 or angle_decimal == 90 or angle_decimal == 180:
-        angle = '%.12f' % (0)
-        case = 'case 1'
-    elif quadrant == 'Quadrant 1':
-        angle = angle
-        case = 'case 2'
-    elif quadrant == 'Quadrant 2':
-        angle = '%.12f' % (angle_decimal - 90)
-        case = 'case 3'
-    elif quadrant == 'Quadrant 3':
-        angle = '%.12f' % (180 - angle_decimal)
-        case = 'case 4'
-    elif quadrant == 'Quadrant 4':
-        angle = '%.12f' % (90 - angle_decimal)
-        case = 'case 5'
-    # print ('Angle in the first quadrant: {} - {}'.format(angle, case))
-
-    if  angle == sel_angle:
+
+    if key == sel_key:
         items_group_1.append(element)
     else:
         items_group_2.append(element)
@@ -146,12 +113,15 @@ t.Start()
 
 solid_fill_pattern = FillPatternElement.GetFillPatternElementByName(doc, FillPatternTarget.Drafting, '<Solid Fill>').Id
 
-for element in items_group_1:
-    settings = set_graphics_override_direction(line_weight=5, color_lines=color_green, color_surfaces=lighten_color(color_green,0.45), fill_pattern_id=solid_fill_pattern)
-    doc.ActiveView.SetElementOverrides(element.Id, settings)
+# One OverrideGraphicSettings per color; elements already splashed with it are skipped
+applier = OverrideApplier(doc, doc.ActiveView)
+applier.add_style("green", set_graphics_override_direction(line_weight=5, color_lines=color_green, color_surfaces=lighten_color(color_green,0.45), fill_pattern_id=solid_fill_pattern))
+applier.add_style("red",   set_graphics_override_direction(line_weight=5, color_lines=color_red,   color_surfaces=lighten_color(color_red,0.45),   fill_pattern_id=solid_fill_pattern))
+
+applier.apply([element.Id for element in items_group_1], "green")
+applier.apply([element.Id for element in items_group_2], "red")
 
-for element in items_group_2:
-    settings = set_graphics_override_direction(line_weight=5, color_lines=color_red, color_surfaces=lighten_color(color_red,0.45), fill_pattern_id=solid_fill_pattern)
-    doc.ActiveView.SetElementOverrides(element.Id, settings)
+# Remember what was colored, so Reset Splasher only reverts these elements
+register_splashed_ids(doc.ActiveView, [element.Id for element in items_group_1 + items_group_2])
 
 t.Commit()
@@ -2,6 +2,9 @@
 __title__ = "Reset\nSplasher"
 __doc__ = """Resets graphic overrides for walls, reference planes, and grids in the active view.
 
+Only the elements colored by the splashers in the view are reverted. If the view has
+no record of them, the walls, grids and ref. planes of the view are checked instead.
+
 Author: Máximo Cubero"""
 
 __min_revit_ver__ = 2021
@@ -15,6 +18,7 @@ TRANSACTION_NAME = "Bimming-Reset Splash"
 #==================================================
 # Custom Libraries
 from Snippets._bimcore_graphics_override import *
+from Snippets._bimcore_splash_registry import read_splashed_ids, clear_splashed_ids
 
 # Regular + Autodesk
 from Autodesk.Revit.DB import *
@@ -28,19 +32,28 @@ app   = __revit__.Application
 # MAIN
 #==================================================
 
-#1️⃣ Select Wall, Grid or Ref Planes
-all_walls        = FilteredElementCollector(doc).OfClass(Wall).ToElements()
-all_grids        = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_Grids).WhereElementIsNotElementType().ToElements()
-all_ref_planes   = FilteredElementCollector(doc, doc.ActiveView.Id).OfClass(ReferencePlane).ToElements()
+#1️⃣ Elements colored by the splashers in the active view
+view = doc.ActiveView
+collector_ids = read_splashed_ids(view)
+
+if not collector_ids:
+    # Nothing registered (e.g. splashed before the registry existed): walls, grids and
+    # ref planes of the active view; the applier skips the ones without overrides
+    all_walls        = FilteredElementCollector(doc, view.Id).OfClass(Wall).ToElementIds()
+    all_grids        = FilteredElementCollector(doc, view.Id).OfCategory(BuiltInCategory.OST_Grids).WhereElementIsNotElementType().ToElementIds()
+    all_ref_planes   = FilteredElementCollector(doc, view.Id).OfClass(ReferencePlane).ToElementIds()
 
-collector = list(all_walls) + list(all_grids) + list(all_ref_planes)
+    collector_ids = list(all_walls) + list(all_grids) + list(all_ref_planes)
 
-# RESET GRAPHICS FOR ALL THE ELEMENTS
+# RESET GRAPHICS FOR THOSE ELEMENTS
 t = Transaction(doc, TRANSACTION_NAME)
 t.Start()
 
-for el in collector:
-    settings = set_graphics_override_direction()
-    doc.ActiveView.SetElementOverrides(el.Id, settings)
+# Elements without overrides are skipped
+applier = OverrideApplier(doc, view)
+applier.add_style("reset", set_graphics_override_direction())
+applier.apply(collector_ids, "reset")
+
+clear_splashed_ids(view)
 
-t.Commit()
\ No newline at end of file
+t.Commit()
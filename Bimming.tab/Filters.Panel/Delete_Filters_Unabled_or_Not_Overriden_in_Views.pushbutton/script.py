@@ -26,7 +26,10 @@ from Snippets._bimcore_groups import *
 from Snippets._bimcore_collect import *
 from Snippets._bimcore_export import *
 from Snippets._bimcore_functions import *
+from Snippets._bimcore_bulk import run_in_batches
+from Snippets._bimcore_filters import FilterAudit
 import sys
+from itertools import chain
 
 # VARIABLES
 #==================================================
@@ -34,125 +37,6 @@ doc   = __revit__.ActiveUIDocument.Document
 uidoc = __revit__.ActiveUIDocument
 app   = __revit__.Application
 
-# FUNCTIONS
-#==================================================
-
-def filters_is_overidden(view, filter_id):
-    aux = []
-
-    overrides = view.GetFilterOverrides(filter_id)
-
-    ########################################### VISIBILITY ###########################################
-
-    is_visible = view.GetFilterVisibility(filter_id)
-    aux.append(not(is_visible))
-
-    ########################################### PROJECTION OVERRIDES ###########################################
-    # LINE
-    # Projection Line Pattern
-    projection_line_pattern = doc.GetElement(overrides.ProjectionLinePatternId)
-    aux.append(projection_line_pattern.Name if projection_line_pattern else None)
-
-    # Projection Line Color
-    try:
-        color = overrides.ProjectionLineColor
-        aux.append([color.Red, color.Green, color.Blue])
-    except:
-        aux.append(None)
-
-    # Projection Line Weight
-    weight = overrides.ProjectionLineWeight
-    aux.append(None if weight == -1 else weight)
-
-    # PATTERN
-    # Projection Patterns Foreground Visible
-    aux.append(not (overrides.IsSurfaceForegroundPatternVisible))
-
-    # Projection Patterns - Foreground Pattern
-    projection_foreground_pattern = doc.GetElement(overrides.SurfaceForegroundPatternId)
-    aux.append(projection_foreground_pattern.Name if projection_foreground_pattern else None)
-
-    # Projection Patterns - Foreground Color
-    try:
-        color = overrides.SurfaceForegroundPatternColor
-        aux.append([color.Red, color.Green, color.Blue])
-    except:
-        aux.append(None)
-
-    # Projection Patterns Background Visible
-    aux.append(not (overrides.IsSurfaceBackgroundPatternVisible))
-
-    # Projection Patterns - Background Pattern
-    projection_background_pattern = doc.GetElement(overrides.SurfaceBackgroundPatternId)
-    aux.append(projection_foreground_pattern.Name if projection_foreground_pattern else None)
-
-    # Projection Patterns - Background Color
-    try:
-        color = overrides.SurfaceBackgroundPatternColor
-        aux.append([color.Red, color.Green, color.Blue])
-    except:
-        aux.append(None)
-
-    #TRANSPARENCY
-    # Projection Transparency
-    projection_transparency = overrides.Transparency
-    aux.append(projection_transparency)
-
-    ########################################### CUT OVERRIDES ###########################################
-    # LINE
-    # Cut Line Pattern
-    Cut_line_pattern = doc.GetElement(overrides.CutLinePatternId)
-    aux.append(Cut_line_pattern.Name if Cut_line_pattern else None)
-
-    # Cut Line Color
-    try:
-        color = overrides.CutLineColor
-        aux.append([color.Red, color.Green, color.Blue])
-    except:
-        aux.append(None)
-
-    # Cut Line Weight
-    weight = overrides.CutLineWeight
-    aux.append(None if weight == -1 else weight)
-
-    # PATTERN
-    # Cut Patterns Foreground Visible
-    aux.append(not (overrides.IsCutForegroundPatternVisible))
-
-    # Cut Patterns - Foreground Pattern
-    Cut_foreground_pattern = doc.GetElement(overrides.CutForegroundPatternId)
-    aux.append(Cut_foreground_pattern.Name if Cut_foreground_pattern else None)
-
-    # Cut Patterns - Foreground Color
-    try:
-        color = overrides.CutForegroundPatternColor
-        aux.append([color.Red, color.Green, color.Blue])
-    except:
-        aux.append(None)
-
-    # Cut Patterns Background Visible
-    aux.append(not (overrides.IsCutBackgroundPatternVisible))
-
-    # Cut Patterns - Background Pattern
-    Cut_background_pattern = doc.GetElement(overrides.CutBackgroundPatternId)
-    aux.append(Cut_foreground_pattern.Name if Cut_foreground_pattern else None)
-
-    # Cut Patterns - Background Color
-    try:
-        color = overrides.CutBackgroundPatternColor
-        aux.append([color.Red, color.Green, color.Blue])
-    except:
-        aux.append(None)
-
-    ########################################### HALTONE ###########################################
-
-    is_halftone = overrides.Halftone
-    aux.append(is_halftone)
-
-    ###############################################################################################
-
-    return any(aux)
-
 # MAIN
 #==================================================
 
@@ -166,33 +50,9 @@ elements_to_delete = []
 info_report = [['View Name', 'View Type', 'Filter Name', 'Description']]
 
 # 2️⃣IDENTIFY VIEWS TO CHECK
-
-for view in views:
-    try:
-        filter_ids = view.GetFilters()
-
-        if view.IsTemplate:
-            views_to_check.append(view)
-
-        elif view.ViewTemplateId == ElementId(-1):
-            views_to_check.append(view)
-
-        else:
-            # 1. Parameter to check
-            param_id_to_check = ElementId(BuiltInParameter.VIS_GRAPHICS_FILTERS)
-
-            # 2. Get the list of non-controlled parameters
-            view_template = doc.GetElement(view.ViewTemplateId)
-            non_controlled_param_ids = view_template.GetNonControlledTemplateParameterIds()
-
-            # 3. Check if the parameter is NOT in the non_controlled_param_ids list
-            is_included = param_id_to_check not in non_controlled_param_ids
-
-            if not is_included:
-                views_to_check.append(view)
-    except:
-        pass
-        # print(view.Name)
+# Views whose filters are controlled by a template are cleaned through the template
+audit = FilterAudit(doc)
+views_to_check = [view for view in views if audit.controls_own_filters(view)]
 
 # 3️⃣CHECK FILTERS IN EACH VIEW
 
@@ -203,27 +63,18 @@ for v in views_to_check:
     else:
          try: view_type = doc.GetElement(v.GetTypeId()).FamilyName
          except: view_type = "Unknown"
-    filter_ids = v.GetFilters()
-    # print(filter_ids)
 
-    for filter_id in filter_ids:
-        is_enabled = v.GetIsFilterEnabled(filter_id)
-        filter_elem = doc.GetElement(filter_id)
-        filter_elem_name = filter_elem.Name
-        # print("NAME: {}".format(filter_elem_name))
-        # print("ENABLE: {}".format(str(is_enabled)))
-        # print("OVERRIDEN: {}".format(str(filters_is_overidden(v, filter_id))))
-        # print("############################")
-        if not is_enabled:
+    for f in audit.filter_states(v):
+        filter_id = f["id"]
+        filter_elem_name = f["name"]
+        if not f["enabled"]:
             info_report.append([v.Name, view_type, filter_elem_name, "The filter is not enabled."])
             elements_to_delete.append((v, filter_id))
             continue
-        elif is_enabled and not filters_is_overidden(v, filter_id):
+        elif not audit.is_overriding(v, filter_id):
             info_report.append([v.Name, view_type, filter_elem_name, "The filter is not overriding the graphics."])
             elements_to_delete.append((v, filter_id))
             continue
-        else:
-            pass
 
 # 4️⃣EXIT EARLY IF ANYTHING TO CLEAN
 
@@ -259,18 +110,15 @@ if res == option_1 or res == option_2:
     # Export the report
     # Create the full file path with the .csv extension
     csv_file_path = os.path.join(directory, report_name[0] + ".csv")
-    data = project_info + info_report
-    export_to_csv(csv_file_path, data)
+    export_to_csv(csv_file_path, chain(project_info, info_report))
 
 if res == option_1:
-    with Transaction(doc, TRANSACTION_NAME) as t:
-        t.Start()
-        for element in elements_to_delete:
-            try:
-                print(element)
-                element[0].RemoveFilter(element[1])
-            except: pass #problems_to_delete.append(element_id)
-        t.Commit()  # Commit the transaction
-
-    message = '{} Elements have been deleted'.format(len(info_report))
+    result = run_in_batches(doc, elements_to_delete, lambda element: element[0].RemoveFilter(element[1]),
+                            transaction_name=TRANSACTION_NAME)
+
+    message = '{} Elements have been deleted'.format(len(result.done))
+    if result.failed:
+        message += '\n{} filters could not be removed'.format(len(result.failed))
+    if result.cancelled:
+        message += '\nCancelled: the remaining filters were not removed'
     forms.alert(message,'title', warn_icon=False)
\ No newline at end of file
@@ -2,8 +2,15 @@
 __title__ = "Usage\nReport"
 __doc__ = """Exports a .csv report listing the filters currently in use.
 
+An .arrows copy of the same data (Arrow IPC stream, typed columns) is saved
+next to it, for tools that read Arrow without re-parsing the .csv.
+
 TIP: Use the 'Power BI Template' command to download the template and link the .csv file, allowing you to track where filters are applied in your project.
 
+Shift+Click:
+Incremental export. Only the rows of views whose filters changed since the last export
+are written (with a 'Change' column: added, changed or removed), plus a manifest.
+
 Author: Máximo Cubero"""
 
 __min_revit_ver__ = 2021
@@ -15,10 +22,15 @@ from Autodesk.Revit.DB import *
 import os
 import datetime
 import sys
+from itertools import chain
 from pyrevit import forms
 from Snippets._bimcore_export import *
 from Snippets._bimcore_strings import *
 from Snippets._bimcore_views import *
+from Snippets._bimcore_filters import *
+from Snippets._bimcore_index import get_element_index
+from Snippets._bimcore_arrow import write_arrow_stream
+from pyrevit import EXEC_PARAMS
 
 # VARIABLES
 #==================================================
@@ -26,6 +38,8 @@ doc   = __revit__.ActiveUIDocument.Document
 uidoc = __revit__.ActiveUIDocument
 app   = __revit__.Application
 
+export_arrow = True  # Also write the report data as .arrows (typed, dictionary-encoded columns)
+
 # MAIN
 #==================================================
 # 🫷Check if the model is saved
@@ -37,9 +51,14 @@ if model_path == "":
 
 # 1️⃣Get filter information to be exported
 output_filters, output_views = [], []
+incremental = EXEC_PARAMS.config_mode  # Shift+Click
+rows_by_view = {}                        # view id -> report rows, for the incremental snapshot
 output_data = [["DATA"], ["Filter Id", "Filter Name", "Filter Enable", "Filter Visibility", "View Type", "View Name", "Is View Template", "View Template Name Applied", "Sheet Info"]]
 
-views = FilteredElementCollector(doc).OfClass(View).ToElements()
+views = get_element_index(doc).views()  # collected once until the model changes
+
+# Views controlled by the same template share its filters: they are read once per template
+audit = FilterAudit(doc)
 
 for v in views:
 
@@ -60,25 +79,26 @@ for v in views:
         except:
             vTemplate = "Not View Template Assigned"
 
-    filters_in_view = GetFilterIds(v)
-
-    if filters_in_view:
-        for f in filters_in_view:
-            aux = []
+    view_rows = []
+    for f in audit.filter_states(v):
+        aux = []
 
-            aux.append(f.IntegerValue)              # Filter Id
-            aux.append(doc.GetElement(f).Name)      # Filter Name <string>
-            aux.append(v.GetIsFilterEnabled(f))     # Filter Enable <True/False>
-            aux.append(v.GetFilterVisibility(f))    # Filter Visibility <True/False>
-            aux.append(str(vType))                  # View Type <string>
-            aux.append(v.Name)                      # View Name
-            aux.append(v.IsTemplate)                # IsViewTemplate <True/False>
-            aux.append(vTemplate)                   # Name of the view template assigned to the view <string>
-            aux.append(sheetInfo)                   # Sheet Info <string>
+        aux.append(f["id"].IntegerValue)        # Filter Id
+        aux.append(f["name"])                   # Filter Name <string>
+        aux.append(f["enabled"])                # Filter Enable <True/False>
+        aux.append(f["visible"])                # Filter Visibility <True/False>
+        aux.append(str(vType))                  # View Type <string>
+        aux.append(v.Name)                      # View Name
+        aux.append(v.IsTemplate)                # IsViewTemplate <True/False>
+        aux.append(vTemplate)                   # Name of the view template assigned to the view <string>
+        aux.append(sheetInfo)                   # Sheet Info <string>
 
 
-            output_data.append(aux)
+        output_data.append(aux)
+        view_rows.append(aux)
 
+    if view_rows:
+        rows_by_view[str(v.Id.IntegerValue)] = view_rows
 
 # 2️⃣PROJECT INFO
 output_project_info = [["PROJECT INFO"]]
@@ -138,7 +158,7 @@ user_name = app.Username
 output_project_info.append(("Export by", user_name))
 #print("Export by: " + user_name)
 
-if len(output_data) == 2:
+if len(output_data) == 2 and not incremental:
     forms.alert("No filters are currently applied.\nThe report will not be exported.", exitscript=True)
 
 # 2️⃣Create directory where the report will be saved
@@ -169,9 +189,42 @@ output_project_info.append((("Export Time", now.strftime("%H:%M:%S"))))
 new_file_name = "{}_{}".format(file_name, formatted_datetime)
 
 # 4️⃣Export the report
+# Per-view snapshot of this export, compared by the next incremental export
+snapshot_path = os.path.join(documents_folder, "{}_filters_snapshot.json".format(file_name))
+manifest_path = os.path.join(documents_folder, "{}_filters_manifest.jsonl".format(file_name))
+
+column_kinds = list(FILTER_REPORT_COLUMN_KINDS)
+if incremental:
+    delta, counts = diff_filter_snapshot(load_filter_snapshot(snapshot_path), rows_by_view)
+    header = output_data[1]
+    output_data = [["DATA"], ["Change", "View Id"] + header] + delta
+    column_kinds = ["string", "string"] + column_kinds
+    new_file_name += "_delta"
+
 # Create the full file path with the .csv extension
 csv_file_path = os.path.join(documents_folder, new_file_name + ".csv")
 # print(csv_file_path)
 
-output = output_project_info + output_data
-export_to_csv(csv_file_path, output)
\ No newline at end of file
+if not incremental or delta:
+    export_to_csv(csv_file_path, chain(output_project_info, output_data))
+
+    if export_arrow:
+        arrow_file_path = os.path.join(documents_folder, new_file_name + ".arrows")
+        write_arrow_stream(arrow_file_path, output_data[1], output_data[2:], column_kinds,
+                           dictionary_columns=FILTER_REPORT_DICTIONARY_COLUMNS)
+
+save_filter_snapshot(snapshot_path, rows_by_view)
+
+manifest_entry = {
+    "date": now.strftime("%Y-%m-%d"),
+    "time": now.strftime("%H:%M:%S"),
+    "mode": "incremental" if incremental else "full",
+    "file": os.path.basename(csv_file_path) if (not incremental or delta) else None,
+    "views": len(rows_by_view),
+}
+if incremental:
+    manifest_entry.update(counts)
+append_filter_manifest(manifest_path, manifest_entry)
+
+if incremental and not delta:
+    forms.alert("No filter changes since the last export.", warn_icon=False)
\ No newline at end of file
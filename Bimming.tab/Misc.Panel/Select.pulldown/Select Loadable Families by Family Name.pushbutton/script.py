@@ -18,6 +18,7 @@ import System
 from Autodesk.Revit.DB import *
 from pyrevit import forms
 from System.Collections.Generic import List
+from Snippets._bimcore_categories import get_tag_filter
 
 # VARIABLES
 #==================================================
@@ -56,14 +57,7 @@ model_elements = FilteredElementCollector(doc)\
     .ToElements()
 
 # TAGS
-all_built_in_categories = list(System.Enum.GetValues(BuiltInCategory))
-cats_02 = []
-for bic in all_built_in_categories:
-    if 'tag' in str(bic).lower():
-        cats_02.append(bic)
-List_cats = List[BuiltInCategory](cats_02)
-multi_cat_filter                 = ElementMulticategoryFilter(List_cats)
-collector_tags                   = FilteredElementCollector(doc).WherePasses(multi_cat_filter).WhereElementIsNotElementType().ToElements()
+collector_tags                   = FilteredElementCollector(doc).WherePasses(get_tag_filter()).WhereElementIsNotElementType().ToElements()
 
 # COLLECTOR
 collector = []
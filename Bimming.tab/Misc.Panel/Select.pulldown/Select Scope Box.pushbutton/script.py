@@ -29,16 +29,17 @@ doc    = __revit__.ActiveUIDocument.Document #type:Document
 # CLASS
 #==================================================
 class MyOption(forms.TemplateListItem):
-    def __init__(self, item, el_name, angle, checked=False):
+    def __init__(self, item, el_name, angle, used_by, checked=False):
         self.item = item #Id of the element
         self.el_name = el_name
         self.angle = angle
+        self.used_by = used_by #Number of views and datums using the scope box
         self.checked = checked
 
     @property
     def name(self):
         el_id = str(self.item)
-        return "Angle: {}  |  Name: {}".format(self.angle, self.el_name)
+        return "Angle: {}  |  Name: {}  |  Used by: {}".format(self.angle, self.el_name, self.used_by)
 
 # MAIN
 #==================================================
@@ -51,6 +52,9 @@ scope_boxes_ids = [sb.Id for sb in scope_boxes]
 if not scope_boxes:
     forms.alert("There are not any scope box in the model.", warn_icon=False, exitscript=True)
 
+# Views, levels, grids and reference planes using each scope box
+usage = ScopeBoxUsageIndex(doc)
+
 # Get Scope Boxes - Selected in the model
 sel_el_ids          = uidoc.Selection.GetElementIds()
 sel_elem            = [doc.GetElement(e_id) for e_id in sel_el_ids]
@@ -66,7 +70,8 @@ for sb in scope_boxes_sorted:
         scope_box_checked = True
     else:
         scope_box_checked = False
-    option = MyOption(scope_box_id, scope_box_name, scope_box_angle, scope_box_checked)
+    scope_box_used_by = len(usage.users(sb))
+    option = MyOption(scope_box_id, scope_box_name, scope_box_angle, scope_box_used_by, scope_box_checked)
     scope_box_list.append(option)
 
 res = forms.SelectFromList.show(scope_box_list, title='Scope Boxes List', multiselect=True, button_name='Select Scope Boxes')
@@ -18,6 +18,8 @@ from pyrevit import forms
 import clr
 clr.AddReference('System')
 import sys
+from Snippets._bimcore_scope_boxes import ScopeBoxUsageIndex
+from Snippets._bimcore_bulk import delete_elements
 
 # VARIABLES
 #==================================================
@@ -46,52 +48,12 @@ scope_boxes = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_Volum
 if not scope_boxes:
     forms.alert("There are not any scope box in the model.", warn_icon=False, exitscript=True)
 
-# 2️⃣ Collect all views and elements that might reference scope boxes
-views               = FilteredElementCollector(doc).OfClass(View).ToElements()
-levels              = FilteredElementCollector(doc).OfClass(Level).ToElements()
-grids               = FilteredElementCollector(doc).OfClass(Grid).ToElements()
-reference_planes    = FilteredElementCollector(doc).OfClass(ReferencePlane).ToElements()
-
-# Set to store used scope box IDs
-used_scope_box_ids = set()
+# 2️⃣ Index the views, levels, grids and reference planes that use a scope box
+usage = ScopeBoxUsageIndex(doc)
 
 # 3️⃣ Check which scope boxes are being used
-# Check views
-for view in views:
-    if view.IsTemplate:  # Skip view templates
-        continue
-    try:
-        scope_box_id = view.get_Parameter(BuiltInParameter.VIEWER_VOLUME_OF_INTEREST_CROP).AsElementId()
-        used_scope_box_ids.add(scope_box_id)
-    except:
-        continue
-
-# Check levels
-for level in levels:
-    try:
-        scope_box_id = level.get_Parameter(BuiltInParameter.DATUM_VOLUME_OF_INTEREST).AsElementId()
-        used_scope_box_ids.add(scope_box_id)
-    except:
-        continue
-
-# Check grids
-for grid in grids:
-    try:
-        scope_box_id = grid.get_Parameter(BuiltInParameter.DATUM_VOLUME_OF_INTEREST).AsElementId()
-        used_scope_box_ids.add(scope_box_id)
-    except:
-        continue
-
-# Check reference planes
-for ref_plane in reference_planes:
-    try:
-        scope_box_id = ref_plane.get_Parameter(BuiltInParameter.DATUM_VOLUME_OF_INTEREST).AsElementId()
-        used_scope_box_ids.add(scope_box_id)
-    except:
-        continue
-
 # Unused Scope Boxes
-unused_scope_boxes = [scope_box for scope_box in scope_boxes if scope_box.Id not in used_scope_box_ids]
+unused_scope_boxes = [scope_box for scope_box in scope_boxes if not usage.is_used(scope_box)]
 scope_boxes_sorted = sorted(unused_scope_boxes, key=lambda sb: sb.Name)
 
 if not unused_scope_boxes:
@@ -113,17 +75,18 @@ if not res:
 unused_scope_boxes = [doc.GetElement(i) for i in res]
 
 # 5️⃣ Delete Scope Boxes
-t = Transaction(doc, TRANSACTION_NAME)
-t.Start()
-counter = 0
-for scope_box in unused_scope_boxes:
-    try:
-        print("Scope Box '{scope_box.Name}' has been deleted".format(scope_box=scope_box))
-        scope_box.Pinned = False
-        doc.Delete(scope_box.Id)
-        counter += 1
-    except Exception as e:
-        print("Error deleting Scope Box {scope_box.Name}: {e}".format(scope_box=scope_box, e=e))
-t.Commit()
-
-forms.alert("{} scope boxes deleted successfully.".format(counter), warn_icon=False)
\ No newline at end of file
+scope_box_names = dict((scope_box.Id.IntegerValue, scope_box.Name) for scope_box in unused_scope_boxes)
+
+def unpin(doc, element_ids):
+    for element_id in element_ids:
+        doc.GetElement(element_id).Pinned = False
+
+result = delete_elements(doc, [scope_box.Id for scope_box in unused_scope_boxes],
+                         transaction_name=TRANSACTION_NAME, before_delete=unpin)
+
+for scope_box_id in result.deleted:
+    print("Scope Box '{}' has been deleted".format(scope_box_names[scope_box_id.IntegerValue]))
+for scope_box_id, e in result.failed:
+    print("Error deleting Scope Box {}: {}".format(scope_box_names[scope_box_id.IntegerValue], e))
+
+forms.alert("{} scope boxes deleted successfully.".format(len(result.deleted)), warn_icon=False)
\ No newline at end of file
@@ -23,10 +23,7 @@ from Autodesk.Revit.DB import *
 from Autodesk.Revit.UI import TaskDialog
 from Snippets._bimcore_export import *
 from Snippets._bimcore_functions import *
-
-import clr
-clr.AddReference("Microsoft.Office.Interop.Excel")
-from Microsoft.Office.Interop import Excel
+from Snippets._bimcore_import import excel_read
 
 # VARIABLES
 #==================================================
@@ -36,77 +33,6 @@ uidoc = __revit__.ActiveUIDocument
 # MAIN
 #==================================================
 
-def read_excel_via_com(path, sheet_name="Sheet1", required_col_index=1, stop_on_empty_first_row_col=True):
-    """
-    Reads data from an Excel sheet using the COM interface, returning rows as lists.
-    Allows restricting the number of read columns based on the first row and skipping
-    rows missing required column values.
-
-    Args:
-        path (str): Full file path to the Excel file.
-        sheet_name (str, optional): Name of the sheet to read. Defaults to "Sheet1".
-        required_col_index (int, optional): Column index that must have a value for
-                                            a row to be included. If None, all rows
-                                            are included. Defaults to 1.
-        stop_on_empty_first_row_col (bool, optional): If True, stops reading columns
-                                                      once an empty cell is found
-                                                      in the first row. Determines
-                                                      the effective max column count.
-                                                      Defaults to True.
-
-    Returns:
-        list[list]: A 2D list representing the sheet contents,
-                    where each inner list holds the cell values of a row.
-    """
-
-    excel = Excel.ApplicationClass()
-    excel.Visible = False
-    wb = excel.Workbooks.Open(path)
-
-    try:
-        sheet = wb.Worksheets(sheet_name)
-    except:
-        sheet = wb.ActiveSheet
-
-    used = sheet.UsedRange
-    max_row = used.Rows.Count
-    max_col = used.Columns.Count
-
-    # Determine max column from first row
-    if stop_on_empty_first_row_col:
-        effective_max_col = 0
-        for c in range(1, max_col + 1):
-            v = sheet.Cells(1, c).Value2
-            if v is None or v == "":
-                break
-            effective_max_col = c
-    else:
-        effective_max_col = max_col
-
-    data = []
-
-    for r in range(1, max_row + 1):
-
-        # REQUIRED COLUMN MUST HAVE A VALUE
-        if required_col_index is not None:
-            req_value = sheet.Cells(r, required_col_index).Value2
-            if req_value is None or req_value == "":
-                # skip row entirely
-                continue
-
-        # normal reading of row
-        row_data = []
-        for c in range(1, effective_max_col + 1):
-            val = sheet.Cells(r, c).Value2
-            row_data.append(val)
-
-        data.append(row_data)
-
-    wb.Close(False)
-    excel.Quit()
-
-    return data
-
 def list_to_dict_excel(data, key_col_index=0, keyword=None):
     """
     Converts a 2D list (such as data read from Excel) into a dictionary
@@ -196,7 +122,7 @@ def get_parameter_by_name(element, param_name):
 
 # 1️⃣ EXTRACTING THE DATA FROM THE EXCEL
 # Conver to a LIST the Excel
-table = read_excel_via_com(PATH_EXCEL, sheet_name="Sheet1", required_col_index=1, stop_on_empty_first_row_col=True)
+table = excel_read(PATH_EXCEL, sheet_name="Sheet1", required_col_index=1, stop_on_empty_first_row_col=True)
 
 # Conver the LIST to a Dict with subDict
 data_dict = list_to_dict_excel(table, key_col_index=0, keyword=None)
@@ -253,7 +179,11 @@ for elem_type in collector:
             parameter_value_from_excel = data_dict[model_value][parameter]
             if parameter_storage_type == StorageType.Integer:
                 try:
-                    parameter_value = int(parameter_value_from_excel)
+                    # excel_read returns cell text: '12' or '12.0' are integers, '12.5' is an error
+                    number = float(parameter_value_from_excel)
+                    if not number.is_integer():
+                        raise ValueError(parameter_value_from_excel)
+                    parameter_value = int(number)
                 except:
                     storage_type = "INTEGER"
                     error = True
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the collection stage of Delete 2D Hidden on a synthetic model.
+
+Before, the button collected each category separately and tested every element
+against a Python list of ElementIds (the detail group members, found with
+collect_all_group_members), a linear scan per element. Now it builds one set of
+integer ids with GroupHierarchyIndex and buckets every category in a single
+pass with classify_view_specific_elements.
+
+Both stages run here against a stub Revit API: a fake document with detail
+lines, text notes, dimensions and detail groups (10% of the elements grouped,
+every fifth group nested in another one). Both must collect the same elements.
+
+Runs on plain CPython 2.7 or 3, without Revit:
+
+    python dev/bench_delete_2d_hidden_exclusions.py
+    python dev/bench_delete_2d_hidden_exclusions.py 5000 10000 20000 100000
+"""
+
+# Imports
+#==================================================
+from __future__ import print_function
+
+import os
+import sys
+import time
+import types
+
+try:
+    import builtins
+except ImportError:  # Python 2
+    import __builtin__ as builtins
+
+# Variables
+#==================================================
+LIB_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "lib")
+
+DEFAULT_SIZES = [5000, 10000, 20000, 40000, 200000]
+
+# The old stage is quadratic: skip it above this size
+OLD_STAGE_MAX_SIZE = 40000
+
+GROUPED_SHARE = 0.1     # share of the elements that are members of a detail group
+GROUP_SIZE = 10         # members per detail group
+NESTED_GROUP_EVERY = 5  # every fifth group is nested in the previous one
+
+# Category ids of the fake model (negative, like BuiltInCategory values)
+OST_IOS_DETAIL_GROUPS = -2000095
+OST_LINES = -2000051
+OST_TEXT_NOTES = -2000300
+OST_DIMENSIONS = -2000260
+CATEGORY_CYCLE = [OST_LINES, OST_TEXT_NOTES, OST_DIMENSIONS]
+
+# Classes
+#==================================================
+
+class ElementId(object):
+    """Stand-in for Autodesk.Revit.DB.ElementId: compared by value, like the .NET one."""
+
+    def __init__(self, value):
+        self.IntegerValue = value
+
+    def __eq__(self, other):
+        return isinstance(other, ElementId) and other.IntegerValue == self.IntegerValue
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.IntegerValue)
+
+class Category(object):
+    def __init__(self, category_id):
+        self.Id = ElementId(category_id)
+        self.Name = str(category_id)
+
+class Element(object):
+    def __init__(self, element_id, category_id):
+        self.Id = ElementId(element_id)
+        self.Category = Category(category_id)
+        self.ViewSpecific = True
+        self.member_ids = []
+
+    def GetMemberIds(self):
+        return self.member_ids
+
+class Document(object):
+    def __init__(self, elements):
+        self.elements = elements
+        self._by_id = dict((element.Id.IntegerValue, element) for element in elements)
+
+    def GetElement(self, element_id):
+        return self._by_id.get(element_id.IntegerValue)
+
+class ElementMulticategoryFilter(object):
+    def __init__(self, categories):
+        self.categories = set(int(category) for category in categories)
+
+class FilteredElementCollector(object):
+    """Only the calls made by the code under test: category filters, instances and iteration."""
+
+    def __init__(self, doc, view_id=None):
+        self._elements = doc.elements
+
+    def _where(self, keep):
+        collector = FilteredElementCollector.__new__(FilteredElementCollector)
+        collector._elements = [element for element in self._elements if keep(element)]
+        return collector
+
+    def OfCategory(self, category):
+        return self._where(lambda element: element.Category.Id.IntegerValue == int(category))
+
+    def WherePasses(self, element_filter):
+        return self._where(lambda element: element.Category.Id.IntegerValue in element_filter.categories)
+
+    def WhereElementIsNotElementType(self):
+        return self
+
+    def ToElements(self):
+        return list(self._elements)
+
+    def __iter__(self):
+        return iter(self._elements)
+
+class NetList(list):
+    """Stand-in for System.Collections.Generic.List[T]."""
+
+    def Add(self, item):
+        self.append(item)
+
+    @property
+    def Count(self):
+        return len(self)
+
+class GenericList(object):
+    def __getitem__(self, item_type):
+        return NetList
+
+# Functions
+#==================================================
+
+def install_stubs():
+    """Registers stub Revit/.NET modules so the Snippets modules import outside Revit."""
+    built_in_category = types.ModuleType("BuiltInCategory")
+    for name in ("OST_DetailComponents", "OST_CLines", "OST_InsulationLines", "OST_GenericAnnotation",
+                 "OST_RevisionClouds", "OST_SpotElevations", "OST_SpotCoordinates", "OST_SpotSlopes"):
+        setattr(built_in_category, name, -2100000 - len(vars(built_in_category)))
+    built_in_category.OST_IOSDetailGroups = OST_IOS_DETAIL_GROUPS
+    built_in_category.OST_Lines = OST_LINES
+    built_in_category.OST_TextNotes = OST_TEXT_NOTES
+    built_in_category.OST_Dimensions = OST_DIMENSIONS
+
+    revit_db = types.ModuleType("Autodesk.Revit.DB")
+    revit_db.BuiltInCategory = built_in_category
+    revit_db.ElementId = ElementId
+    revit_db.ElementMulticategoryFilter = ElementMulticategoryFilter
+    revit_db.FilteredElementCollector = FilteredElementCollector
+    revit_db.__all__ = ["BuiltInCategory", "ElementId", "ElementMulticategoryFilter", "FilteredElementCollector"]
+
+    generic = types.ModuleType("System.Collections.Generic")
+    generic.List = GenericList()
+
+    scope_boxes = types.ModuleType("Snippets._bimcore_scope_boxes")
+    scope_boxes.ScopeBoxUsageIndex = object
+
+    revit = types.ModuleType("__revit__")
+    revit.Application = types.ModuleType("Application")
+    revit.Application.VersionNumber = "2024"
+    revit.ActiveUIDocument = types.ModuleType("ActiveUIDocument")
+    revit.ActiveUIDocument.Document = None
+    builtins.__revit__ = revit
+
+    for name in ("Autodesk", "Autodesk.Revit", "System", "System.Collections"):
+        sys.modules.setdefault(name, types.ModuleType(name))
+    sys.modules["Autodesk.Revit.DB"] = revit_db
+    sys.modules["System.Collections.Generic"] = generic
+    sys.modules["Snippets._bimcore_scope_boxes"] = scope_boxes
+    sys.path.insert(0, os.path.abspath(LIB_FOLDER))
+
+def make_document(n):
+    """
+    Returns:
+        Document: n annotation elements; GROUPED_SHARE of them sit in detail groups of GROUP_SIZE.
+    """
+    elements = [Element(i + 1, CATEGORY_CYCLE[i % len(CATEGORY_CYCLE)]) for i in range(n)]
+    next_id = n + 1
+
+    groups = []
+    grouped = int(n * GROUPED_SHARE)
+    for start in range(0, grouped, GROUP_SIZE):
+        group = Element(next_id, OST_IOS_DETAIL_GROUPS)
+        next_id += 1
+        group.member_ids = [element.Id for element in elements[start:start + GROUP_SIZE]]
+        if groups and len(groups) % NESTED_GROUP_EVERY == 0:
+            groups[-1].member_ids.append(group.Id)
+        groups.append(group)
+
+    return Document(elements + groups)
+
+def old_collection(doc, categories, collect_all_group_members):
+    """The button before: one collector per category and `not in` a list of ElementIds."""
+    exclusion_list_groups_members = []
+    detail_groups = FilteredElementCollector(doc).OfCategory(OST_IOS_DETAIL_GROUPS).WhereElementIsNotElementType().ToElements()
+    for detail_group in detail_groups:
+        for member in collect_all_group_members(doc, detail_group):
+            exclusion_list_groups_members.append(member.Id)
+
+    collected = []
+    for category in categories:
+        elements = FilteredElementCollector(doc).OfCategory(category).WhereElementIsNotElementType().ToElements()
+        collected.extend(e for e in elements if e.Id not in exclusion_list_groups_members)
+    return collected
+
+def new_collection(doc, categories, GroupHierarchyIndex, classify_view_specific_elements):
+    """The button now: integer-id set from GroupHierarchyIndex and a single classified pass."""
+    exclusion_ids = GroupHierarchyIndex(doc).grouped_ids()
+    buckets = classify_view_specific_elements(doc, [(category, [category]) for category in categories], exclusion_ids)
+    collected = []
+    for category in categories:
+        collected.extend(buckets[category])
+    return collected
+
+def timed(function, *args):
+    start = time.time()
+    result = function(*args)
+    return result, time.time() - start
+
+def main(sizes):
+    install_stubs()
+    from Snippets._bimcore_groups import GroupHierarchyIndex, collect_all_group_members
+    from Snippets._bimcore_collect import classify_view_specific_elements
+
+    categories = CATEGORY_CYCLE + [OST_IOS_DETAIL_GROUPS]
+
+    print("{:>9}  {:>10}  {:>10}  {:>14}".format("n", "old stage", "new stage", "new us/element"))
+    for n in sizes:
+        doc = make_document(n)
+
+        new, new_time = timed(new_collection, doc, categories, GroupHierarchyIndex, classify_view_specific_elements)
+        if n <= OLD_STAGE_MAX_SIZE:
+            old, old_time = timed(old_collection, doc, categories, collect_all_group_members)
+            assert sorted(e.Id.IntegerValue for e in old) == sorted(e.Id.IntegerValue for e in new), \
+                "both stages must collect the same elements"
+            old_text = "{:.3f} s".format(old_time)
+        else:
+            old_text = "-"
+
+        print("{:>9,}  {:>10}  {:>10}  {:>14.2f}".format(
+            n, old_text, "{:.3f} s".format(new_time), new_time / n * 1e6))
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Golden check of Snippets._bimcore_directions against the splashers' old algorithm.
+
+The splashers used to read AngleTo(X axis), quantize it with Decimal at the
+chosen number of decimals, format it with '%.12f' and fold it into the first
+quadrant with a quadrant switch. canonical_angle / direction_key replace that
+with float math. This script builds directions in every quadrant (axis aligned,
+common angles, tiny perturbations and random ones) and checks that both
+algorithms group them the same way at every tolerance from 1 to 11 decimals.
+
+Runs on plain CPython 2.7 or 3, without Revit: the Revit API and
+Snippets._bimcore_vectors are replaced by stub modules.
+
+    python dev/check_direction_golden.py
+"""
+
+# Imports
+#==================================================
+from __future__ import print_function
+
+import math
+import os
+import random
+import sys
+import time
+import types
+from decimal import Decimal, ROUND_HALF_UP, getcontext
+
+# Variables
+#==================================================
+LIB_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "lib")
+
+DECIMALS = range(1, 12)
+BASE_ANGLES = [0, 15, 30, 33.3333, 45, 60, 72.5, 89.9]
+PERTURBATIONS = [0, 1e-13, -1e-13, 1e-9, -1e-9, 1e-6]
+RANDOM_DIRECTIONS = 3000
+TIMING_SAMPLES = 20000
+
+# Classes
+#==================================================
+
+class XYZ(object):
+    """Minimal stand-in for Autodesk.Revit.DB.XYZ."""
+
+    def __init__(self, x, y, z=0.0):
+        self.X, self.Y, self.Z = x, y, z
+
+# Functions
+#==================================================
+
+def install_stubs():
+    """Registers stub modules so Snippets._bimcore_directions imports outside Revit."""
+    view_type = types.ModuleType("ViewType")
+    for name in ("FloorPlan", "CeilingPlan", "EngineeringPlan", "AreaPlan"):
+        setattr(view_type, name, name)
+
+    revit_db = types.ModuleType("Autodesk.Revit.DB")
+    revit_db.ViewType = view_type
+    revit_db.XYZ = XYZ
+    revit_db.__all__ = ["ViewType", "XYZ"]
+
+    vectors = types.ModuleType("Snippets._bimcore_vectors")
+    vectors.get_direction = lambda element: element  # the "elements" are the directions themselves
+
+    sys.modules.setdefault("Autodesk", types.ModuleType("Autodesk"))
+    sys.modules.setdefault("Autodesk.Revit", types.ModuleType("Autodesk.Revit"))
+    sys.modules["Autodesk.Revit.DB"] = revit_db
+    sys.modules["Snippets._bimcore_vectors"] = vectors
+    sys.path.insert(0, os.path.abspath(LIB_FOLDER))
+
+def old_angle(direction, decimals):
+    """The splashers' old canonical angle: AngleTo + Decimal quantize + '%.12f' + quadrant switch."""
+    angle = math.degrees(math.atan2(abs(direction.Y), direction.X))  # AngleTo(X axis), 0..180
+    getcontext().prec = 50
+    step = Decimal(1) / (Decimal(10) ** decimals)
+    rounded = (Decimal(angle) / step).quantize(Decimal("1"), ROUND_HALF_UP) * step
+    text = "%.12f" % rounded
+    value = Decimal(text)
+
+    x, y = direction.X, direction.Y
+    if value == 0 or value == 90 or value == 180:
+        return "%.12f" % 0
+    if x > 0 and y > 0:
+        return text
+    if x < 0 and y > 0:
+        return "%.12f" % (value - 90)
+    if x < 0 and y < 0:
+        return "%.12f" % (180 - value)
+    if x > 0 and y < 0:
+        return "%.12f" % (90 - value)
+    return text
+
+def golden_directions(seed=1):
+    """
+    Returns:
+        list[XYZ]: Common angles in the four quadrants, both senses and perturbed, plus random directions.
+    """
+    rng = random.Random(seed)
+    directions = []
+    for base in BASE_ANGLES:
+        for quadrant in range(4):
+            for eps in PERTURBATIONS:
+                t = math.radians(base + 90 * quadrant + eps)
+                for sense in (1, -1):
+                    directions.append(XYZ(sense * math.cos(t), sense * math.sin(t)))
+    for _ in range(RANDOM_DIRECTIONS):
+        t = rng.uniform(-math.pi, math.pi)
+        directions.append(XYZ(math.cos(t), math.sin(t)))
+    directions += [XYZ(1, 0), XYZ(-1, 0), XYZ(0, 1), XYZ(0, -1)]
+    return directions
+
+def partition(keys):
+    """Groups indices by key, so two algorithms can be compared whatever their key values."""
+    groups = {}
+    for i, key in enumerate(keys):
+        groups.setdefault(key, []).append(i)
+    return sorted(tuple(group) for group in groups.values())
+
+def main():
+    install_stubs()
+    from Snippets._bimcore_directions import canonical_angle, direction_key
+
+    directions = golden_directions()
+    mismatches = 0
+    for decimals in DECIMALS:
+        old_groups = partition([old_angle(d, decimals) for d in directions])
+        new_groups = partition([direction_key(d, decimals) for d in directions])
+        if old_groups != new_groups:
+            mismatches += 1
+            print("{} decimals: {} old groups, {} new groups".format(decimals, len(old_groups), len(new_groups)))
+            for group in sorted(set(old_groups) ^ set(new_groups))[:3]:
+                print("    ", [round(canonical_angle(directions[i]), 12) for i in group[:4]])
+
+    print("{} directions, {} of {} tolerances differ".format(len(directions), mismatches, len(DECIMALS)))
+
+    sample = (directions * (TIMING_SAMPLES // len(directions) + 1))[:TIMING_SAMPLES]
+    start = time.time()
+    for d in sample:
+        old_angle(d, 11)
+    old_time = time.time() - start
+    start = time.time()
+    for d in sample:
+        direction_key(d, 11)
+    new_time = time.time() - start
+    print("{} directions at 11 decimals: old {:.3f} s, new {:.3f} s".format(len(sample), old_time, new_time))
+
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
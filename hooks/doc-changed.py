@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""Drops the element index of Snippets._bimcore_index when its document changes."""
+
+# IMPORTS
+#==================================================
+from System import AppDomain
+from pyrevit import EXEC_PARAMS
+
+# MAIN
+#==================================================
+# Runs after every transaction: do nothing unless an index has been built in this session
+if AppDomain.CurrentDomain.GetData("Bimming.ElementIndex"):
+    from Snippets._bimcore_index import drop_element_index
+    drop_element_index(EXEC_PARAMS.event_args.GetDocument())
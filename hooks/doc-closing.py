@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+"""Drops the element index of Snippets._bimcore_index when its document closes."""
+
+# IMPORTS
+#==================================================
+from System import AppDomain
+from pyrevit import EXEC_PARAMS
+
+# MAIN
+#==================================================
+if AppDomain.CurrentDomain.GetData("Bimming.ElementIndex"):
+    from Snippets._bimcore_index import drop_element_index
+    drop_element_index(EXEC_PARAMS.event_args.Document)
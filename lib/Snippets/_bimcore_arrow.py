@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+
+# Imports
+#==================================================
+# Pure Python on purpose: no Revit API and no third-party packages, so it runs in
+# IronPython and its files can be checked with pyarrow outside Revit.
+import struct
+
+# Variables
+#==================================================
+try:
+    text_type = unicode  # IronPython / Python 2
+    integer_types = (int, long)
+except NameError:
+    text_type = str
+    integer_types = (int,)
+
+# Arrow IPC (Schema.fbs / Message.fbs)
+METADATA_V5 = 4
+HEADER_SCHEMA, HEADER_DICTIONARY_BATCH, HEADER_RECORD_BATCH = 1, 2, 3
+TYPE_INT, TYPE_FLOATING_POINT, TYPE_UTF8, TYPE_BOOL = 2, 3, 5, 6
+PRECISION_DOUBLE = 2
+CONTINUATION = b"\xff\xff\xff\xff"
+
+# Column kinds accepted by write_arrow_stream
+COLUMN_KINDS = ("bool", "int64", "double", "string")
+
+# Classes
+#==================================================
+
+class _Table(object):
+    """A flatbuffer table: [(slot, kind, value)], kind is a struct format or "offset"."""
+
+    def __init__(self, fields=()):
+        self.fields = [field for field in fields if field[2] is not None]
+
+class _String(object):
+    def __init__(self, text):
+        self.data = _utf8(text)
+
+class _TableVector(object):
+    def __init__(self, tables):
+        self.tables = list(tables)
+
+class _StructVector(object):
+    """A vector of structs made of 8-byte fields (FieldNode, Buffer)."""
+
+    def __init__(self, structs):
+        self.structs = list(structs)
+
+class _FlatBufferWriter(object):
+    """
+    Serializes _Table trees as a flatbuffer, parents first.
+
+    Offsets to children must point forward, so every child is written after the
+    object that refers to it and the placeholder offset is patched afterwards.
+    """
+
+    def __init__(self):
+        self.buf = bytearray()
+
+    def _pad_to(self, alignment, extra=0):
+        while (len(self.buf) + extra) % alignment:
+            self.buf.append(0)
+
+    def _patch_offsets(self, pending):
+        for position, child in pending:
+            self.buf[position:position + 4] = struct.pack("<I", self.write(child) - position)
+
+    def write(self, obj):
+        """Writes an object and its children. Returns: int: Position of the object."""
+        if isinstance(obj, _Table):
+            return self._write_table(obj)
+        if isinstance(obj, _String):
+            self._pad_to(4)
+            position = len(self.buf)
+            self.buf += struct.pack("<I", len(obj.data)) + obj.data + b"\x00"
+            return position
+        if isinstance(obj, _TableVector):
+            self._pad_to(4)
+            position = len(self.buf)
+            self.buf += struct.pack("<I", len(obj.tables))
+            pending = []
+            for table in obj.tables:
+                pending.append((len(self.buf), table))
+                self.buf += b"\x00\x00\x00\x00"
+            self._patch_offsets(pending)
+            return position
+        if isinstance(obj, _StructVector):
+            self._pad_to(8, extra=4)  # the elements, after the length, are 8-byte aligned
+            position = len(self.buf)
+            self.buf += struct.pack("<I", len(obj.structs))
+            for values in obj.structs:
+                self.buf += struct.pack("<%dq" % len(values), *values)
+            return position
+        raise TypeError("Cannot serialize {!r}".format(obj))
+
+    def _write_table(self, table):
+        # Inline layout: soffset to the vtable, then the fields, each aligned to its size
+        layout, size, alignment = [], 4, 4
+        for slot, kind, value in table.fields:
+            width = 4 if kind == "offset" else struct.calcsize("<" + kind)
+            size += -size % width
+            layout.append((slot, kind, value, size))
+            size += width
+            alignment = max(alignment, width)
+        size += -size % alignment
+
+        slots = max([field[0] for field in table.fields] or [-1]) + 1
+        vtable = [4 + 2 * slots, size] + [0] * slots
+        for slot, _, _, offset in layout:
+            vtable[2 + slot] = offset
+
+        self._pad_to(2)
+        vtable_position = len(self.buf)
+        self.buf += struct.pack("<%dH" % len(vtable), *vtable)
+        self._pad_to(alignment)
+
+        position = len(self.buf)
+        self.buf += bytearray(size)
+        self.buf[position:position + 4] = struct.pack("<i", position - vtable_position)
+        pending = []
+        for slot, kind, value, offset in layout:
+            if kind == "offset":
+                pending.append((position + offset, value))
+            else:
+                data = struct.pack("<" + kind, value)
+                self.buf[position + offset:position + offset + len(data)] = data
+        self._patch_offsets(pending)
+        return position
+
+# Functions
+#==================================================
+
+def _utf8(value):
+    if isinstance(value, bytes) and not isinstance(value, text_type):
+        return bytes(value)  # Python 2 str: already encoded
+    return text_type(value).encode("utf-8")
+
+def _flatbuffer(root):
+    writer = _FlatBufferWriter()
+    writer.buf += b"\x00\x00\x00\x00"
+    writer._patch_offsets([(0, root)])
+    writer._pad_to(8)
+    return bytes(writer.buf)
+
+def _message(header_type, header, body_length):
+    return _flatbuffer(_Table([
+        (0, "h", METADATA_V5),
+        (1, "B", header_type),
+        (2, "offset", header),
+        (3, "q", body_length),
+    ]))
+
+def _encapsulate(metadata, body=b""):
+    """Frames a message as in the IPC stream: continuation, metadata size, metadata, body."""
+    return CONTINUATION + struct.pack("<i", len(metadata)) + metadata + body
+
+def _padded(data):
+    return data + b"\x00" * (-len(data) % 8)
+
+def _bitmap(flags):
+    """Packs booleans LSB first, as Arrow validity and boolean buffers."""
+    out = bytearray((len(flags) + 7) // 8)
+    for i, flag in enumerate(flags):
+        if flag:
+            out[i >> 3] |= 1 << (i & 7)
+    return bytes(out)
+
+def _column_buffers(name, kind, values):
+    """
+    Returns:
+        tuple: (null count, [buffers]) of one column, validity bitmap first.
+    """
+    valid = [value is not None for value in values]
+    null_count = valid.count(False)
+    validity = _bitmap(valid) if null_count else b""
+
+    if kind == "string":
+        offsets, data, end = [0], [], 0
+        for value in values:
+            if value is not None:
+                encoded = _utf8(value)
+                data.append(encoded)
+                end += len(encoded)
+            offsets.append(end)
+        return null_count, [validity, struct.pack("<%di" % len(offsets), *offsets), b"".join(data)]
+
+    if kind == "bool":
+        for value in values:
+            if value is not None and not isinstance(value, bool):
+                raise ValueError("Column '{}' expects True/False, got {!r}".format(name, value))
+        return null_count, [validity, _bitmap([bool(value) for value in values])]
+
+    if kind == "int64":
+        numbers = []
+        for value in values:
+            if value is None:
+                numbers.append(0)
+            elif isinstance(value, bool) or not isinstance(value, integer_types):
+                raise ValueError("Column '{}' expects integers, got {!r}".format(name, value))
+            else:
+                numbers.append(value)
+        return null_count, [validity, struct.pack("<%dq" % len(numbers), *numbers)]
+
+    if kind == "double":
+        numbers = []
+        for value in values:
+            if value is None:
+                numbers.append(0.0)
+            elif isinstance(value, bool) or not isinstance(value, integer_types + (float,)):
+                raise ValueError("Column '{}' expects numbers, got {!r}".format(name, value))
+            else:
+                numbers.append(float(value))
+        return null_count, [validity, struct.pack("<%dd" % len(numbers), *numbers)]
+
+    raise ValueError("Unknown column kind '{}' (expected one of {})".format(kind, ", ".join(COLUMN_KINDS)))
+
+def _record_batch(length, columns):
+    """
+    Args:
+        length (int): Number of rows.
+        columns (list[tuple]): (null count, [buffers]) per column.
+
+    Returns:
+        tuple: (RecordBatch table, body bytes)
+    """
+    nodes, buffers, body = [], [], []
+    offset = 0
+    for null_count, column_buffers in columns:
+        nodes.append((length, null_count))
+        for data in column_buffers:
+            buffers.append((offset, len(data)))
+            data = _padded(data)
+            body.append(data)
+            offset += len(data)
+    table = _Table([
+        (0, "q", length),
+        (1, "offset", _StructVector(nodes)),
+        (2, "offset", _StructVector(buffers)),
+    ])
+    return table, b"".join(body)
+
+def _field(name, kind, dictionary_id=None):
+    if kind == "int64":
+        type_id, type_table = TYPE_INT, _Table([(0, "i", 64), (1, "?", True)])
+    elif kind == "double":
+        type_id, type_table = TYPE_FLOATING_POINT, _Table([(0, "h", PRECISION_DOUBLE)])
+    elif kind == "bool":
+        type_id, type_table = TYPE_BOOL, _Table()
+    else:
+        type_id, type_table = TYPE_UTF8, _Table()
+
+    dictionary = None
+    if dictionary_id is not None:
+        dictionary = _Table([
+            (0, "q", dictionary_id),
+            (1, "offset", _Table([(0, "i", 32), (1, "?", True)])),  # int32 indices
+        ])
+
+    return _Table([
+        (0, "offset", _String(name)),
+        (1, "?", True),                      # every column is nullable
+        (2, "B", type_id),
+        (3, "offset", type_table),
+        (4, "offset", dictionary),
+        (5, "offset", _TableVector([])),     # children
+    ])
+
+def write_arrow_stream(path, header, rows, column_kinds, dictionary_columns=()):
+    """
+    Writes rows as an Arrow IPC stream (.arrows): one schema, the dictionaries
+    and a single record batch, uncompressed.
+
+    Every column is nullable: None is written as null, never as "" or 0.
+    Values of the wrong type raise ValueError instead of being converted.
+
+    Args:
+        path (str): Full path of the file.
+        header (list[str]): Column names.
+        rows (list[list]): Data rows, one value per column.
+        column_kinds (list[str]): "bool", "int64", "double" or "string", per column.
+        dictionary_columns (iterable[str], optional): String columns to dictionary-encode
+                                                      (repeated values, loaded as categories).
+    """
+    if len(header) != len(column_kinds):
+        raise ValueError("{} columns but {} column kinds".format(len(header), len(column_kinds)))
+    for row in rows:
+        if len(row) != len(header):
+            raise ValueError("Row with {} values, expected {}: {!r}".format(len(row), len(header), row))
+
+    dictionary_columns = set(dictionary_columns)
+    fields, dictionaries, columns = [], [], []
+    for i, (name, kind) in enumerate(zip(header, column_kinds)):
+        values = [row[i] for row in rows]
+        if kind == "string" and name in dictionary_columns:
+            dictionary_id = len(dictionaries)
+            entries, indices = {}, []
+            for value in values:
+                if value is None:
+                    indices.append(None)
+                else:
+                    indices.append(entries.setdefault(_utf8(value), len(entries)))
+            words = sorted(entries, key=entries.get)
+            dictionaries.append((dictionary_id, _column_buffers(name, "string", words), len(words)))
+
+            valid = [index is not None for index in indices]
+            null_count = valid.count(False)
+            numbers = [0 if index is None else index for index in indices]
+            columns.append((null_count, [_bitmap(valid) if null_count else b"",
+                                         struct.pack("<%di" % len(numbers), *numbers)]))
+            fields.append(_field(name, kind, dictionary_id))
+        else:
+            columns.append(_column_buffers(name, kind, values))
+            fields.append(_field(name, kind))
+
+    with open(path, "wb") as f:
+        schema = _Table([(0, "h", 0), (1, "offset", _TableVector(fields))])  # little endian
+        f.write(_encapsulate(_message(HEADER_SCHEMA, schema, 0)))
+
+        for dictionary_id, column, length in dictionaries:
+            batch, body = _record_batch(length, [column])
+            dictionary_batch = _Table([(0, "q", dictionary_id), (1, "offset", batch)])
+            f.write(_encapsulate(_message(HEADER_DICTIONARY_BATCH, dictionary_batch, len(body)), body))
+
+        batch, body = _record_batch(len(rows), columns)
+        f.write(_encapsulate(_message(HEADER_RECORD_BATCH, batch, len(body)), body))
+
+        f.write(CONTINUATION + struct.pack("<i", 0))  # end of stream
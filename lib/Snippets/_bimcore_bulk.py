@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+
+# Imports
+#==================================================
+from Autodesk.Revit.DB import *
+from pyrevit import forms
+from System.Collections.Generic import List
+
+# Variables
+#==================================================
+app   = __revit__.Application
+uidoc = __revit__.ActiveUIDocument
+doc   = __revit__.ActiveUIDocument.Document #type:Document
+
+DELETE_CHUNK_SIZE = 500    # ids per doc.Delete call
+ACTION_CHUNK_SIZE = 100    # items per progress update / cancel check in run_in_batches
+COMMIT_SIZE       = 5000   # items per committed transaction
+
+# Classes
+#==================================================
+
+class BulkResult(object):
+    """
+    Outcome of a bulk operation.
+
+    Attributes:
+        done (list): Items processed successfully (for deletions, the requested ElementIds deleted).
+        failed (list[tuple]): (item, error message) for every item that could not be processed.
+        cascaded (list[ElementId]): Elements Revit deleted as a consequence (e.g. hosted or dependent elements).
+        cancelled (bool): True if the user cancelled before every item was processed.
+    """
+
+    def __init__(self):
+        self.done = []
+        self.failed = []
+        self.cascaded = []
+        self.cancelled = False
+
+    @property
+    def deleted(self):
+        """list[ElementId]: Alias of done for deletions."""
+        return self.done
+
+class _NoProgressBar(object):
+    """Stand-in for forms.ProgressBar when no progress is shown."""
+    cancelled = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def update_progress(self, new_value, max_value=1):
+        pass
+
+# Functions
+#==================================================
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+def _delete_chunk(doc, chunk, requested, result, before_delete=None):
+    """
+    Deletes a chunk of ids with one doc.Delete call inside a SubTransaction.
+
+    If the call fails, the chunk is rolled back and split in halves until the
+    failing ids are isolated; healthy halves are still deleted in one call.
+    """
+    pending = [chunk]
+    while pending:
+        ids = pending.pop()
+
+        # Elements already removed by a previous cascade
+        ids = [i for i in ids if doc.GetElement(i) is not None]
+        if not ids:
+            continue
+
+        st = SubTransaction(doc)
+        st.Start()
+        try:
+            if before_delete:
+                before_delete(doc, ids)
+            deleted_ids = doc.Delete(List[ElementId](ids))
+            st.Commit()
+        except Exception as e:
+            st.RollBack()
+            if len(ids) == 1:
+                result.failed.append((ids[0], str(e)))
+            else:
+                middle = len(ids) // 2
+                pending.append(ids[middle:])
+                pending.append(ids[:middle])
+            continue
+
+        for deleted_id in deleted_ids:
+            if deleted_id.IntegerValue in requested:
+                result.done.append(deleted_id)
+            else:
+                result.cascaded.append(deleted_id)
+
+def delete_elements(doc, element_ids, transaction_name="Bimming-Delete Elements",
+                    chunk_size=DELETE_CHUNK_SIZE, commit_size=COMMIT_SIZE,
+                    before_delete=None, show_progress=True):
+    """
+    Deletes elements in bulk.
+
+    Ids are deleted with doc.Delete(ICollection[ElementId]) in chunks; a chunk
+    is only bisected when it fails. Every commit_size ids are committed in
+    their own transaction, all grouped in a single undo entry. The progress
+    bar is updated and can be cancelled between chunks: the chunks already
+    deleted are kept.
+
+    Args:
+        doc (Document): Revit document.
+        element_ids (iterable[ElementId]): Ids to delete.
+        transaction_name (str, optional): Name of the undo entry.
+        chunk_size (int, optional): Ids per doc.Delete call (and per progress update).
+        commit_size (int, optional): Ids per committed transaction.
+        before_delete (function, optional): Called as before_delete(doc, ids) inside the
+                                            transaction, right before deleting, e.g. to unpin.
+        show_progress (bool, optional): Show a cancellable progress bar.
+
+    Returns:
+        BulkResult: deleted, failed, cascaded ids and whether it was cancelled.
+    """
+    element_ids = list(element_ids)
+    requested = set(i.IntegerValue for i in element_ids)
+    result = BulkResult()
+
+    def process_chunk(chunk):
+        _delete_chunk(doc, chunk, requested, result, before_delete)
+
+    _run_batches(doc, element_ids, process_chunk, transaction_name, commit_size, chunk_size, show_progress, result)
+    return result
+
+def run_in_batches(doc, items, action, transaction_name="Bimming-Bulk Operation",
+                   commit_size=COMMIT_SIZE, chunk_size=ACTION_CHUNK_SIZE, show_progress=True):
+    """
+    Applies an action to many items, committing every commit_size items.
+
+    For operations that have no bulk API (e.g. View.RemoveFilter). Each item
+    is isolated: a failing item is reported and the rest carry on. The progress
+    bar is updated and can be cancelled every chunk_size items.
+
+    Args:
+        doc (Document): Revit document.
+        items (iterable): Items to process.
+        action (function): Called as action(item). Any exception marks the item as failed.
+        transaction_name (str, optional): Name of the undo entry.
+        commit_size (int, optional): Items per committed transaction.
+        chunk_size (int, optional): Items per progress update / cancel check.
+        show_progress (bool, optional): Show a cancellable progress bar.
+
+    Returns:
+        BulkResult: done and failed items and whether it was cancelled.
+    """
+    result = BulkResult()
+
+    def process_chunk(chunk):
+        for item in chunk:
+            try:
+                action(item)
+                result.done.append(item)
+            except Exception as e:
+                result.failed.append((item, str(e)))
+
+    _run_batches(doc, list(items), process_chunk, transaction_name, commit_size, chunk_size, show_progress, result)
+    return result
+
+def _mark_rolled_back(result, done_start, cascaded_start, message):
+    """Moves the items done since done_start to failed: their transaction did not commit."""
+    for item in result.done[done_start:]:
+        result.failed.append((item, message))
+    del result.done[done_start:]
+    del result.cascaded[cascaded_start:]
+
+def _run_batches(doc, items, process_chunk, transaction_name, commit_size, chunk_size, show_progress, result):
+    """
+    Runs process_chunk on the items chunk by chunk, committing a transaction every
+    commit_size items, all inside one TransactionGroup.
+
+    Progress and cancellation are checked between chunks: on cancel, the chunks
+    already processed in the current batch are committed and the rest are skipped.
+
+    If Revit does not commit a batch (e.g. a failure the user chose to cancel),
+    the items of that batch are moved from done to failed; if the group cannot
+    be assimilated, every item is.
+    """
+    if not items:
+        return
+
+    total = len(items)
+    progress_bar = forms.ProgressBar(title=transaction_name + " ({value} of {max_value})", cancellable=True) \
+        if show_progress else _NoProgressBar()
+
+    with progress_bar as progress:
+        tg = TransactionGroup(doc, transaction_name)
+        tg.Start()
+        processed = 0
+        for batch in _chunks(items, commit_size):
+            if progress.cancelled:
+                result.cancelled = True
+                break
+
+            done_start, cascaded_start = len(result.done), len(result.cascaded)
+            t = Transaction(doc, transaction_name)
+            t.Start()
+            try:
+                for chunk in _chunks(batch, chunk_size):
+                    if progress.cancelled:
+                        result.cancelled = True
+                        break
+                    process_chunk(chunk)
+                    processed += len(chunk)
+                    progress.update_progress(processed, total)
+                status = t.Commit()
+            except Exception:
+                t.RollBack()
+                tg.RollBack()
+                raise
+
+            if status != TransactionStatus.Committed:
+                _mark_rolled_back(result, done_start, cascaded_start,
+                                  "The transaction was not committed ({})".format(status))
+
+            if result.cancelled:
+                break
+
+        # One undo entry for all the committed batches
+        status = tg.Assimilate()
+        if status != TransactionStatus.Committed:
+            _mark_rolled_back(result, 0, 0, "The transaction group was not committed ({})".format(status))
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+# Imports
+#==================================================
+from Autodesk.Revit.DB import *
+import json
+import os
+import System
+from System.Collections.Generic import List
+from Snippets._bimcore_export import create_report_directory
+
+# Variables
+#==================================================
+app   = __revit__.Application
+uidoc = __revit__.ActiveUIDocument
+doc   = __revit__.ActiveUIDocument.Document #type:Document
+
+# The category sets only change between Revit versions, so they are cached as
+# ~/Documents/PyRevit_Exports/<CATEGORY_CACHE_FOLDER>/categories_<version>.json
+CATEGORY_CACHE_FOLDER = "Bimming_Category_Cache"
+CATEGORY_CACHE_VERSION = 1
+
+CATEGORY_SET_NAMES = ("tag", "annotation", "model")
+
+# Category sets already loaded in this session: {Revit version: {set name: [BuiltInCategory]}}
+_category_sets = {}
+_category_filters = {}
+
+# Functions
+#==================================================
+
+def compute_category_sets(doc):
+    """
+    Computes the tag, annotation and model built-in category sets.
+
+    - tag: every BuiltInCategory whose name contains "tag" (e.g. OST_DoorTags).
+    - annotation / model: built-in categories of the document settings by CategoryType.
+
+    Args:
+        doc (Document): Any open document, used to read the category types.
+
+    Returns:
+        dict: {set name: [int]} with the integer values of the built-in categories.
+    """
+    tag = sorted(set(int(bic) for bic in System.Enum.GetValues(BuiltInCategory)
+                     if 'tag' in str(bic).lower()))
+
+    annotation, model = set(), set()
+    for cat in doc.Settings.Categories:
+        cat_id = cat.Id.IntegerValue
+        if cat_id >= 0: continue  # user-defined categories are not built-in
+        if   cat.CategoryType == CategoryType.Annotation: annotation.add(cat_id)
+        elif cat.CategoryType == CategoryType.Model:      model.add(cat_id)
+
+    return {"tag": tag, "annotation": sorted(annotation), "model": sorted(model)}
+
+def category_cache_path(version_number):
+    """Returns the cache file of the category sets of a Revit version.
+
+    Args:
+        version_number (str): Revit version, e.g. app.VersionNumber -> "2024".
+
+    Returns:
+        str: Full path of the cache file (it may not exist yet).
+    """
+    file_name = "categories_{}.json".format(version_number)
+    return os.path.join(create_report_directory(CATEGORY_CACHE_FOLDER, open_directory=False), file_name)
+
+def write_category_cache(cache_path, version_number, values):
+    """Writes the category sets of a Revit version through a temporary file, replacing any previous cache.
+
+    Args:
+        cache_path (str): Full path of the cache file.
+        version_number (str): Revit version, e.g. "2024".
+        values (dict): {set name: [int]} from compute_category_sets.
+    """
+    temp_path = cache_path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump({"version": CATEGORY_CACHE_VERSION, "revit_version": version_number, "categories": values}, f)
+    if os.path.exists(cache_path):
+        os.remove(cache_path)
+    os.rename(temp_path, cache_path)
+
+def warn_category_cache(cache_path, error):
+    """Prints a non-fatal warning when the category cache cannot be used: the sets are still returned.
+
+    Args:
+        cache_path (str): Cache file (or folder) that failed.
+        error (Exception): The error raised.
+    """
+    print("Warning: the category cache could not be written, the categories will be computed again next time.\n"
+          "{} ({})".format(cache_path, error))
+
+def get_category_sets(doc=doc, app=app):
+    """
+    Returns the tag, annotation and model category sets of the running Revit version.
+
+    They are computed once per Revit version and stored in a cache file, then
+    kept in memory for the rest of the session. If the cache folder or file
+    cannot be written, a warning is printed and the computed sets are returned.
+
+    Args:
+        doc (Document, optional): Document used if the sets have to be computed.
+        app (Application, optional): Revit application, for the version number.
+
+    Returns:
+        dict: {set name: [BuiltInCategory]} for "tag", "annotation" and "model".
+    """
+    version_number = app.VersionNumber
+    if version_number in _category_sets:
+        return _category_sets[version_number]
+
+    # The cache is best-effort: a read-only or redirected Documents folder only prints a warning
+    try:
+        cache_path = category_cache_path(version_number)
+    except (IOError, OSError) as e:
+        warn_category_cache(CATEGORY_CACHE_FOLDER, e)
+        cache_path = None
+
+    values = None
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path) as f:
+                cached = json.load(f)
+            if cached.get("version") == CATEGORY_CACHE_VERSION and cached.get("revit_version") == version_number:
+                values = cached["categories"]
+        except (IOError, OSError, ValueError, KeyError):
+            values = None
+
+    if values is None:
+        values = compute_category_sets(doc)
+        if cache_path:
+            try:
+                write_category_cache(cache_path, version_number, values)
+            except (IOError, OSError) as e:
+                warn_category_cache(cache_path, e)
+
+    category_sets = {}
+    for set_name in CATEGORY_SET_NAMES:
+        category_sets[set_name] = [System.Enum.ToObject(BuiltInCategory, value) for value in values[set_name]]
+
+    _category_sets[version_number] = category_sets
+    return category_sets
+
+def get_tag_categories():
+    """Returns: list[BuiltInCategory]: Every tag category (e.g. OST_DoorTags, OST_RoomTags)."""
+    return get_category_sets()["tag"]
+
+def get_annotation_categories():
+    """Returns: list[BuiltInCategory]: Built-in categories of type Annotation."""
+    return get_category_sets()["annotation"]
+
+def get_model_categories():
+    """Returns: list[BuiltInCategory]: Built-in categories of type Model."""
+    return get_category_sets()["model"]
+
+def get_category_filter(set_name):
+    """
+    Returns a ready-made ElementMulticategoryFilter for a category set.
+
+    Args:
+        set_name (str): "tag", "annotation" or "model".
+
+    Returns:
+        ElementMulticategoryFilter: Filter passing the elements of any category of the set.
+    """
+    key = (app.VersionNumber, set_name)
+    if key not in _category_filters:
+        _category_filters[key] = ElementMulticategoryFilter(List[BuiltInCategory](get_category_sets()[set_name]))
+    return _category_filters[key]
+
+def get_tag_filter():
+    """Returns: ElementMulticategoryFilter: Passes tags of any category."""
+    return get_category_filter("tag")
+
+def get_annotation_filter():
+    """Returns: ElementMulticategoryFilter: Passes elements of any annotation category."""
+    return get_category_filter("annotation")
+
+def get_model_filter():
+    """Returns: ElementMulticategoryFilter: Passes elements of any model category."""
+    return get_category_filter("model")
@@ -3,6 +3,9 @@
 # Imports
 #==================================================
 from Autodesk.Revit.DB import *
+from System.Collections.Generic import List
+from Snippets._bimcore_scope_boxes import ScopeBoxUsageIndex
+from Snippets._bimcore_index import get_element_index
 
 # Variables
 #==================================================
@@ -35,6 +38,47 @@ def get_nested_detail_items(doc):
 
     return nested_items
 
+def classify_view_specific_elements(doc, category_buckets, exclusion_ids=None):
+    """
+    Collects the view-specific elements of several categories in a single pass and buckets them.
+
+    Args:
+        doc: The current Revit document.
+        category_buckets (list[tuple]): (bucket name, [BuiltInCategory]) pairs. If a category
+                                        appears in several buckets, the first one wins.
+        exclusion_ids (set[int], optional): Integer ids of elements to leave out.
+
+    Returns:
+        dict: {bucket name: [Element]}, with an entry (possibly empty) for every bucket.
+    """
+    exclusion_ids = exclusion_ids or set()
+
+    category_to_bucket = {}
+    categories = List[BuiltInCategory]()
+    for bucket_name, bics in category_buckets:
+        for bic in bics:
+            if int(bic) not in category_to_bucket:
+                category_to_bucket[int(bic)] = bucket_name
+                categories.Add(bic)
+
+    buckets = dict((bucket_name, []) for bucket_name, _ in category_buckets)
+    if not categories.Count:
+        return buckets
+
+    collector = (FilteredElementCollector(doc)
+                 .WherePasses(ElementMulticategoryFilter(categories))
+                 .WhereElementIsNotElementType())
+
+    for e in collector:
+        if not e.ViewSpecific: continue
+        if e.Category is None: continue
+        if e.Id.IntegerValue in exclusion_ids: continue
+        bucket_name = category_to_bucket.get(e.Category.Id.IntegerValue)
+        if bucket_name is not None:
+            buckets[bucket_name].append(e)
+
+    return buckets
+
 def get_bounding_box_points(bounding_box):
     """
     Retrieves the 8 corner points of a bounding box.
@@ -65,10 +109,41 @@ def get_bounding_box_points(bounding_box):
     else:
         return None
 
+def get_view_ids_with_name_prefix(doc, prefix):
+    """
+    Returns the ids of the views whose name (VIEW_NAME) starts with a prefix, case-sensitive.
+
+    Revit matches the start of the name natively; from Revit 2023 string rules
+    ignore their caseSensitive argument, so the few views it returns are
+    narrowed down to the exact case in Python. Sheets have no VIEW_NAME and
+    are never returned.
+
+    Args:
+        doc: Revit document
+        prefix (str): Text the view name starts with.
+
+    Returns:
+        List[ElementId]: Ids of the matching views (empty if the rule cannot be created).
+    """
+    view_ids = List[ElementId]()
+    try:
+        rule = ParameterFilterRuleFactory.CreateBeginsWithRule(ElementId(BuiltInParameter.VIEW_NAME), prefix, True)
+    except Exception:
+        return view_ids
+
+    for v in FilteredElementCollector(doc).OfClass(View).WherePasses(ElementParameterFilter(rule)):
+        if v.Name.startswith(prefix):
+            view_ids.Add(v.Id)
+    return view_ids
+
 def get_views_to_delete(doc, prefix_to_keep="MX_", view_types_to_keep=None):
     """
     Returns a list of View Ids that are safe to delete based on multiple filters.
 
+    The views come from the element index of the document (collected once until
+    the document changes). The views with the name prefix are found by Revit and
+    skipped by id before any of their properties is read.
+
     Args:
         doc: Revit document
         prefix_to_keep (str): Views starting with this prefix will NOT be deleted
@@ -82,10 +157,20 @@ def get_views_to_delete(doc, prefix_to_keep="MX_", view_types_to_keep=None):
     if view_types_to_keep is None:
         view_types_to_keep = set()
 
-    views = FilteredElementCollector(doc).OfClass(View).ToElements()
-    views_to_delete = []
+    view_types_to_skip = set(view_types_to_keep)
+    view_types_to_skip.update([ViewType.ProjectBrowser, ViewType.SystemBrowser])  # system/internal browser views
+
+    # Skip views with protected prefix (matched natively, exact case checked on the matches only)
+    excluded_ids = set()
+    if prefix_to_keep:
+        excluded_ids.update(i.IntegerValue for i in get_view_ids_with_name_prefix(doc, prefix_to_keep))
 
-    for v in views:
+    dependent_views, primary_views = [], []
+
+    for v in get_element_index(doc).views():
+
+        if v.Id.IntegerValue in excluded_ids:
+            continue
 
         # Skip splash screen sheet (special case)
         if isinstance(v, ViewSheet) and v.Name.strip().replace(" ", "").lower() == "splashscreen":
@@ -95,47 +180,45 @@ def get_views_to_delete(doc, prefix_to_keep="MX_", view_types_to_keep=None):
         if v.IsTemplate:
             continue
 
-        # Skip revision schedules inside titleblocks
-        if hasattr(v, "IsTitleblockRevisionSchedule") and v.IsTitleblockRevisionSchedule:
-            continue
+        view_type = v.ViewType
 
-        # Skip key schedules
-        try:
-            if v.ViewType == ViewType.Schedule and v.Definition.IsKeySchedule:
-                continue
-        except:
-            pass
-
-        # Skip views whose type is explicitly protected (custom view types)
-        if v.ViewType in view_types_to_keep:
+        # Skip views whose type is explicitly protected (custom view types) and browser views
+        if view_type in view_types_to_skip:
             continue
 
-        # Skip views with protected prefix
+        # Skip sheets with protected prefix (sheets have no VIEW_NAME, so they are not excluded above)
         if prefix_to_keep and v.Name.startswith(prefix_to_keep):
             continue
 
-        # Skip system/internal browser views
-        if v.ViewType in (ViewType.ProjectBrowser, ViewType.SystemBrowser):
-            continue
+        if isinstance(v, ViewSchedule):
+            # Skip revision schedules inside titleblocks
+            if v.IsTitleblockRevisionSchedule:
+                continue
+
+            # Skip key schedules
+            try:
+                if view_type == ViewType.Schedule and v.Definition.IsKeySchedule:
+                    continue
+            except:
+                pass
 
         # Skip views that cannot be printed (except schedules)
-        if v.ViewType != ViewType.Schedule and not v.CanBePrinted:
+        if view_type != ViewType.Schedule and not v.CanBePrinted:
             continue
 
         # If none of the "keep" conditions matched → mark for deletion
-        views_to_delete.append(v)
-
-    # ✅ Sort: dependent views first
-    # Dependent views must be deleted before their parent views
-    def is_dependent(v):
+        # ✅ Dependent views first: they must be deleted before their parent views
         try:
-            return v.GetPrimaryViewId() != ElementId.InvalidElementId
+            is_dependent = v.GetPrimaryViewId() != ElementId.InvalidElementId
         except:
-            return False
+            is_dependent = False
 
-    views_sorted = sorted(views_to_delete, key=lambda v: is_dependent(v), reverse=True)
+        if is_dependent:
+            dependent_views.append(v.Id)
+        else:
+            primary_views.append(v.Id)
 
-    return [v.Id for v in views_sorted]
+    return dependent_views + primary_views
 
 def get_cad_links_to_delete(doc):
     """Collect all ImportInstance (CAD links) to delete."""
@@ -164,59 +247,16 @@ def get_unused_scope_boxes(doc):
     Returns a list of unused ScopeBox ElementIds.
     Checks Views, Levels, Grids, and Reference Planes.
     """
-    # Collect all scope boxes
-    scope_boxes = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_VolumeOfInterest).WhereElementIsNotElementType().ToElements()
+    # Collect all scope boxes (from the element index of the document)
+    scope_boxes = get_element_index(doc).scope_boxes()
     if not scope_boxes:
         return []
 
-    used_scope_box_ids = set()
-
-    # --- Collect all related elements ---
-    views = FilteredElementCollector(doc).OfClass(View).ToElements()
-    levels = FilteredElementCollector(doc).OfClass(Level).ToElements()
-    grids = FilteredElementCollector(doc).OfClass(Grid).ToElements()
-    reference_planes = FilteredElementCollector(doc).OfClass(ReferencePlane).ToElements()
-
-    # --- Views ---
-    for v in views:
-        if v.IsTemplate:
-            continue
-        try:
-            sb_id = v.get_Parameter(BuiltInParameter.VIEWER_VOLUME_OF_INTEREST_CROP).AsElementId()
-            if sb_id != ElementId.InvalidElementId:
-                used_scope_box_ids.add(sb_id)
-        except:
-            continue
-
-    # --- Levels ---
-    for level in levels:
-        try:
-            sb_id = level.get_Parameter(BuiltInParameter.DATUM_VOLUME_OF_INTEREST).AsElementId()
-            if sb_id != ElementId.InvalidElementId:
-                used_scope_box_ids.add(sb_id)
-        except:
-            continue
-
-    # --- Grids ---
-    for grid in grids:
-        try:
-            sb_id = grid.get_Parameter(BuiltInParameter.DATUM_VOLUME_OF_INTEREST).AsElementId()
-            if sb_id != ElementId.InvalidElementId:
-                used_scope_box_ids.add(sb_id)
-        except:
-            continue
-
-    # --- Reference Planes ---
-    for rp in reference_planes:
-        try:
-            sb_id = rp.get_Parameter(BuiltInParameter.DATUM_VOLUME_OF_INTEREST).AsElementId()
-            if sb_id != ElementId.InvalidElementId:
-                used_scope_box_ids.add(sb_id)
-        except:
-            continue
+    # Views, levels, grids and reference planes using a scope box (native filters)
+    usage = ScopeBoxUsageIndex(doc)
 
     # --- Determine unused scope boxes ---
-    unused_scope_boxes = [sb for sb in scope_boxes if sb.Id not in used_scope_box_ids]
+    unused_scope_boxes = [sb for sb in scope_boxes if not usage.is_used(sb)]
     unused_scope_boxes_sorted = sorted(unused_scope_boxes, key=lambda sb: sb.Name)
 
     return [sb.Id for sb in unused_scope_boxes_sorted]
@@ -2,11 +2,15 @@
 
 # Imports
 #==================================================
+import os
 import sys
+from itertools import chain
 from pyrevit import forms
 from Snippets._bimcore_export import *
 from Snippets._bimcore_import import *
 from Snippets._bimcore_functions import *
+from Snippets._bimcore_convert import convert_internal_units
+from Snippets._bimcore_pyrevit import dump2
 from pyrevit import EXEC_PARAMS
 
 from System.Collections.Generic import List
@@ -17,6 +21,8 @@ app   = __revit__.Application
 uidoc = __revit__.ActiveUIDocument
 doc   = __revit__.ActiveUIDocument.Document #type:Document
 
+PARAMETER_DOUBLE_TOLERANCE = 1e-9  # internal units (feet, sq feet); below Revit's own precision
+
 
 def rename_types(category):
 
@@ -56,8 +62,8 @@ def rename_types(category):
         excel_path = forms.pick_file(title="Select Excel file with new wall names", file_ext='xlsx',init_dir=directory)
         if not(excel_path):
             sys.exit()
-        data = excel_read_via_com(excel_path, required_col_index=1, stop_on_empty_first_row_col=False)
-        dic_excel = excel_rows_to_dict(data,7) # to skip all the project info data from the Excel
+        rows = excel_iter_rows(excel_path, required_col_index=1, stop_on_empty_first_row_col=False)
+        dic_excel = excel_rows_to_dict(rows,7) # to skip all the project info data from the Excel
 
         # Check whether there are duplicates values for different keys to avoid to have different families with the same name
         duplicated_values = list(set([x for x in dic_excel.values() if dic_excel.values().count(x) > 1]))
@@ -110,8 +116,7 @@ def rename_types(category):
 
             header = [[], ["ERROR REPORT", 'The following families/types were not found in the Excel']]
 
-            data = project_info + header + element_not_in_dic
-            export_to_csv(csv_file_path, data, open_file=True)
+            export_to_csv(csv_file_path, chain(project_info, header, element_not_in_dic), open_file=True)
 
             if res == "Stop, and export an Excel Report":
                 sys.exit()
@@ -166,8 +171,7 @@ def rename_types(category):
         # Create the full file path with the .csv extension
         csv_file_path = os.path.join(directory, report_name[0] + ".csv")
 
-        data = project_info + output_data
-        export_to_csv(csv_file_path, data)
+        export_to_csv(csv_file_path, chain(project_info, output_data))
 
 def create_folder_dictionary(directory_path):
     folder_dict = {}
@@ -190,8 +194,196 @@ def create_folder_dictionary(directory_path):
 
     return folder_dict
 
-def parameter_type_updater(category, excel_file_path):
-    # type: (str, str) -> tuple
+def build_parameter_converter(storage_type, data_type):
+    """
+    Builds the function that turns an Excel cell text into the value expected by
+    Parameter.Set, for one storage type / data type combination.
+
+    Unit factors are resolved here once, not per cell.
+
+    Args:
+        storage_type (StorageType): Storage type of the parameter.
+        data_type (ForgeTypeId): Data type of the parameter definition (None before Revit 2022).
+
+    Returns:
+        function: converter(raw_value) -> value. Raises ValueError with an error
+                  message template containing {parameter} and {value} placeholders.
+    """
+    if storage_type == StorageType.Integer:
+        if data_type == SpecTypeId.Boolean.YesNo:
+            def convert(raw_value):
+                val = str(raw_value).upper()
+                if   val == 'TRUE':  return 1
+                elif val == 'FALSE': return 0
+                raise ValueError("'{parameter}' is YES/NO — value '{value}' invalid. Use TRUE or FALSE.")
+            return convert
+
+        def convert(raw_value):
+            # Cells are read as text: '12' and '12.0' are accepted, '12.5' is an error (never truncated)
+            try:    number = float(raw_value)
+            except: number = None
+            if number is None or not number.is_integer():
+                raise ValueError("'{parameter}' is INTEGER — '{value}' could not be converted.")
+            return int(number)
+        return convert
+
+    if storage_type == StorageType.Double:
+        if   data_type == SpecTypeId.Length: factor = convert_internal_units(1.0, get_internal=True, units='mm')
+        elif data_type == SpecTypeId.Area:   factor = convert_internal_units(1.0, get_internal=True, units='m2')
+        elif data_type == SpecTypeId.Number: factor = 1.0
+        else:                                factor = None
+
+        def convert(raw_value):
+            try:    fval = float(raw_value)
+            except: raise ValueError("'{parameter}' is DOUBLE — '{value}' could not be converted.")
+            if factor is None:
+                raise ValueError("'{{parameter}}' is DOUBLE (DataType={}) — unsupported spec type.".format(getattr(data_type, "TypeId", data_type)))
+            return fval * factor
+        return convert
+
+    if storage_type == StorageType.String:
+        def convert(raw_value):
+            try:    return str(raw_value)
+            except: raise ValueError("'{parameter}' is STRING — '{value}' could not be converted.")
+        return convert
+
+    def convert(raw_value):
+        raise ValueError("'{{parameter}}' is {} — storage type not supported.".format(storage_type))
+    return convert
+
+def plan_parameter_writes(elem_type, headers, converters):
+    """
+    Resolves every Excel column header to the type's parameter and its converter.
+
+    The parameters of the type are indexed once (instead of one linear
+    LookupParameter-style search per column) and converters are shared across
+    types through `converters`, keyed by what the converter depends on:
+    (StorageType, data type id). Before Revit 2022 the ParameterType name
+    replaces the data type id.
+
+    Args:
+        elem_type (ElementType): The family type to write to.
+        headers (list[str]): Excel column headers (parameter names).
+        converters (dict): Converter cache, reused across all types of a run.
+
+    Returns:
+        list[tuple]: (header, Parameter or None, converter or None) per header, in order.
+    """
+    parameters_by_name = get_parameters_by_name(elem_type)
+
+    plan = []
+    for header in headers:
+        revit_parameter = parameters_by_name.get(header)
+        if revit_parameter is None:
+            plan.append((header, None, None))
+            continue
+
+        storage_type = revit_parameter.StorageType
+        definition = revit_parameter.Definition
+        if hasattr(definition, "GetDataType"):  # Revit 2022+
+            data_type = definition.GetDataType()
+            key = (storage_type, data_type.TypeId)
+        else:
+            data_type = None
+            key = (storage_type, str(definition.ParameterType))
+
+        converter = converters.get(key)
+        if converter is None:
+            converter = converters[key] = build_parameter_converter(storage_type, data_type)
+        plan.append((header, revit_parameter, converter))
+
+    return plan
+
+def read_parameter_value(revit_parameter):
+    """
+    Returns the value stored in a parameter, in the same form Parameter.Set takes.
+
+    Args:
+        revit_parameter (Parameter): The parameter to read.
+
+    Returns:
+        int, float, str, ElementId or None: The stored value. Empty strings are returned as "".
+    """
+    storage_type = revit_parameter.StorageType
+    if storage_type == StorageType.Integer:   return revit_parameter.AsInteger()
+    if storage_type == StorageType.Double:    return revit_parameter.AsDouble()
+    if storage_type == StorageType.String:    return revit_parameter.AsString() or ""
+    if storage_type == StorageType.ElementId: return revit_parameter.AsElementId()
+    return None
+
+def parameter_value_changed(current_value, new_value, tolerance=PARAMETER_DOUBLE_TOLERANCE):
+    """
+    Checks whether writing new_value would change the parameter.
+
+    Args:
+        current_value: Value returned by read_parameter_value.
+        new_value: Value about to be passed to Parameter.Set.
+        tolerance (float, optional): Allowed difference between doubles, in internal units.
+
+    Returns:
+        bool: True if the values differ.
+    """
+    if isinstance(new_value, float) and current_value is not None:
+        return abs(current_value - new_value) > tolerance
+    return current_value != new_value
+
+def diff_parameter_writes(elem_type, headers, row, converters):
+    """
+    Compares one Excel row against the current values of a type.
+
+    The planned parameters are read first, then each Excel value is converted and
+    only the ones that differ from the model are returned.
+
+    Args:
+        elem_type (ElementType): The family type to compare.
+        headers (list[str]): Excel column headers (parameter names).
+        row (dict): {header: cell text} for the type's MODEL value.
+        converters (dict): Converter cache, see plan_parameter_writes.
+
+    Returns:
+        tuple:
+            list[tuple]: Changes as (parameter name, Parameter, current text, new value, cell text).
+            list[tuple]: Errors as (parameter name, error description).
+    """
+    plan = plan_parameter_writes(elem_type, headers, converters)
+    current_values = dict((header, read_parameter_value(param)) for header, param, _ in plan if param is not None)
+
+    changes = []
+    errors  = []
+    for parameter, revit_parameter, converter in plan:
+
+        if revit_parameter is None:
+            errors.append((parameter,
+                "Parameter not found. Check: A) exists in project  B) linked to category  C) is a Type parameter."))
+            continue
+
+        raw_value = row[parameter]
+
+        if raw_value is None or raw_value == "":
+            errors.append((parameter,
+                "Excel cell is EMPTY. Use 'TBC', 'N/A', '-' for text or '0' for numeric."))
+            continue
+
+        try:
+            parameter_value = converter(raw_value)
+        except ValueError as e:
+            errors.append((parameter, e.args[0].format(parameter=parameter, value=raw_value)))
+            continue
+
+        if not parameter_value_changed(current_values[parameter], parameter_value):
+            continue
+
+        if revit_parameter.StorageType == StorageType.String:
+            current_text = revit_parameter.AsString() or ""
+        else:
+            current_text = revit_parameter.AsValueString() or ""
+
+        changes.append((parameter, revit_parameter, current_text, parameter_value, raw_value))
+
+    return changes, errors
+
+def parameter_type_updater(category, excel_file_path, dry_run=False, diff_file_path=None, return_diff=False):
+    # type: (str, str, bool, str, bool) -> tuple
     """
     Reads an Excel Type Parameter Table for the given category,
     matches element types in the model by their MODEL parameter,
@@ -203,6 +395,20 @@ def parameter_type_updater(category, excel_file_path):
                                "FLOOR & ROOF TYPES", "METALWORK TYPES", "PRECAST ELEMENTS", "WALL TYPES", "WINDOW TYPES"
         excel_file_path (str): Full path to the Excel file.
                                e.g. r"C:\Projects\123_ProjectName\...\123-WALL TYPES.xlsx"
+        dry_run         (bool): If True, nothing is written to the model and the
+                               differences are exported to an .xlsx report instead.
+        diff_file_path  (str):  Full path of the dry-run report. Defaults to a timestamped
+                               file in PyRevit_Exports\Parameter Type Updater.
+        return_diff     (bool): If True, the diff table is returned as a third item.
+
+    Only parameters whose value differs from the Excel table are set, so unchanged
+    types do not end up in the transaction. If no value changed at all, the
+    transaction is rolled back instead of committed, so no empty undo entry is left.
+    A dry run never opens a transaction: nothing is set and there is nothing to roll back.
+
+    Returns:
+        tuple: (errors_1, errors_2) tables, each with a header row.
+               (errors_1, errors_2, diff) if return_diff is True.
     """
 
     # MAPPING
@@ -234,9 +440,7 @@ def parameter_type_updater(category, excel_file_path):
 
     # 1️⃣ READ EXCEL
     #==================================================
-    try:
-        table = excel_read_via_com(excel_file_path, sheet_name="Sheet1", required_col_index=1, stop_on_empty_first_row_col=True)
-    except:
+    if not os.path.isfile(excel_file_path):
         forms.alert(
             "The Excel document could not be found:\n\n{}".format(excel_file_path),
             "Warning - Excel Path",
@@ -244,8 +448,21 @@ def parameter_type_updater(category, excel_file_path):
             exitscript=True
         )
 
-    data_dict  = list_to_dict_excel(table, key_col_index=0, keyword=None)
-    parameters = table[0][1:]
+    # Rows come from the on-disk cache when the file has not changed since the last run
+    # (a cache that cannot be written only prints a warning)
+    try:
+        rows = excel_read_cached(excel_file_path, sheet_name="Sheet1", required_col_index=1, stop_on_empty_first_row_col=True)
+        headers, records = excel_bind_headers(rows, key_col_index=0, keyword=None)
+        data_dict = excel_keyed_dict(records)
+    except Exception as e:
+        forms.alert(
+            "The Excel document could not be read:\n\n{}\n\n{}".format(excel_file_path, e),
+            "Warning - Excel Read",
+            sub_msg="Close the file in Excel if it is open, or talk to the BIM Team for support",
+            exitscript=True
+        )
+
+    parameters = headers[1:]
 
     # 2️⃣ COLLECT ELEMENTS
     #==================================================
@@ -285,9 +502,13 @@ def parameter_type_updater(category, excel_file_path):
     #==================================================
     errors_1 = [['ID', 'Family Name', 'Type', 'Model', 'Error/Warning Description']]
     errors_2 = [['Model', 'Parameter', 'Error Description']]
+    diff     = [['ID', 'Family Name', 'Type', 'Model', 'Parameter', 'Current Value', 'New Value']]
+
+    converters = {}  # shared by all types: one converter per (storage type, data type)
 
-    t = Transaction(doc, "KCA-Parameter Types Update-{}".format(category))
-    t.Start()
+    if not dry_run:
+        t = Transaction(doc, "KCA-Parameter Types Update-{}".format(category))
+        t.Start()
 
     for elem_type in collector:
         elem_id     = str(elem_type.Id)
@@ -310,62 +531,31 @@ def parameter_type_updater(category, excel_file_path):
             errors_1.append([elem_id, family_name, type_name, model_value, error_description_1])
             continue
 
-        for parameter in parameters:
-            revit_parameter = get_parameter_by_name(elem_type, parameter)
+        # Compare the whole row first, then only write what changed
+        changes, type_errors = diff_parameter_writes(elem_type, parameters, data_dict[model_value], converters)
 
-            if not revit_parameter:
-                errors_2.append([model_value, parameter,
-                    "Parameter not found. Check: A) exists in project  B) linked to category  C) is a Type parameter."])
-                continue
+        for parameter, error_description_2 in type_errors:
+            errors_2.append([model_value, parameter, error_description_2])
 
-            parameter_storage_type = revit_parameter.StorageType
-            data_type              = revit_parameter.Definition.GetDataType()
-            raw_value              = data_dict[model_value][parameter]
+        for parameter, revit_parameter, current_text, parameter_value, raw_value in changes:
+            diff.append([elem_id, family_name, type_name, model_value, parameter, current_text, raw_value])
+            if not dry_run:
+                revit_parameter.Set(parameter_value)
 
-            if raw_value is None or raw_value == "":
-                errors_2.append([model_value, parameter,
-                    "Excel cell is EMPTY. Use 'TBC', 'N/A', '-' for text or '0' for numeric."])
-                continue
+    # 4️⃣ COMMIT OR REPORT
+    #==================================================
+    if dry_run:
+        if not diff_file_path:
+            report_name, _, _ = generate_report_name("Parameter Type Updater_{}".format(category.replace("&", "and")))
+            diff_file_path = os.path.join(create_report_directory("Parameter Type Updater", open_directory=False),
+                                          report_name + ".xlsx")
+        dump2(diff_file_path, {"Diff": diff})
+    elif len(diff) > 1:
+        t.Commit()
+    else:
+        # Nothing changed: keep the undo stack clean
+        t.RollBack()
 
-            if parameter_storage_type == StorageType.Integer:
-                if data_type == SpecTypeId.Boolean.YesNo:
-                    val = str(raw_value).upper()
-                    if   val == 'TRUE':  parameter_value = 1
-                    elif val == 'FALSE': parameter_value = 0
-                    else:
-                        errors_2.append([model_value, parameter,
-                            "'{}' is YES/NO — value '{}' invalid. Use TRUE or FALSE.".format(parameter, raw_value)])
-                        continue
-                else:
-                    try:    parameter_value = int(raw_value)
-                    except:
-                        errors_2.append([model_value, parameter,
-                            "'{}' is INTEGER — '{}' could not be converted.".format(parameter, raw_value)])
-                        continue
-
-            elif parameter_storage_type == StorageType.Double:
-                try:
-                    fval = float(raw_value)
-                    if   data_type == SpecTypeId.Length: parameter_value = convert_internal_units(fval, get_internal=True, units='mm')
-                    elif data_type == SpecTypeId.Area:   parameter_value = convert_internal_units(fval, get_internal=True, units='m2')
-                    elif data_type == SpecTypeId.Number: parameter_value = fval
-                    else:
-                        errors_2.append([model_value, parameter,
-                            "'{}' is DOUBLE (DataType={}) — unsupported spec type.".format(parameter, data_type.TypeId)])
-                        continue
-                except:
-                    errors_2.append([model_value, parameter,
-                        "'{}' is DOUBLE — '{}' could not be converted.".format(parameter, raw_value)])
-                    continue
-
-            elif parameter_storage_type == StorageType.String:
-                try:    parameter_value = str(raw_value)
-                except:
-                    errors_2.append([model_value, parameter,
-                        "'{}' is STRING — '{}' could not be converted.".format(parameter, raw_value)])
-                    continue
-
-            revit_parameter.Set(parameter_value)
-
-    t.Commit()
+    if return_diff:
+        return errors_1, errors_2, diff
     return errors_1, errors_2
\ No newline at end of file
@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+
+# Imports
+#==================================================
+import math
+from Autodesk.Revit.DB import *
+from Snippets._bimcore_vectors import get_direction
+
+# Variables
+#==================================================
+# Parallel and perpendicular directions are the same "direction" for the splashers,
+# so every direction is folded into [0, DIRECTION_FOLD_DEGREES).
+DIRECTION_FOLD_DEGREES = 90.0
+
+# Views where the directions can be splashed in batch
+DIRECTION_PLAN_VIEW_TYPES = (ViewType.FloorPlan, ViewType.CeilingPlan, ViewType.EngineeringPlan, ViewType.AreaPlan)
+
+# Classes
+#==================================================
+
+class DirectionCluster(object):
+    """
+    Elements whose canonical angles are all within a tolerance of the first
+    (smallest) angle of the cluster (see cluster_directions).
+
+    Attributes:
+        reference (float): Canonical angle shared by most elements of the cluster, in degrees.
+        decimals (int): Decimals the reference angle was rounded to.
+        members (list[tuple]): (element, deviation) for every element; deviation is the signed
+                               angle to the reference in degrees.
+        spread (float): Largest minus smallest deviation, in degrees (never above the tolerance).
+        outliers (list[tuple]): (element, deviation) of the members that do not round to the
+                                reference, sorted by the absolute deviation, largest first.
+    """
+
+    def __init__(self, reference, decimals, members, outliers):
+        self.reference = reference
+        self.decimals = decimals
+        self.members = members
+        deviations = [deviation for _, deviation in members]
+        self.spread = max(deviations) - min(deviations) if deviations else 0.0
+        self.outliers = sorted(outliers, key=lambda m: abs(m[1]), reverse=True)
+
+    @property
+    def elements(self):
+        """list[Element]: Every element of the cluster."""
+        return [element for element, _ in self.members]
+
+    @property
+    def max_deviation(self):
+        """float: Largest absolute deviation of an outlier from the reference, in degrees."""
+        return abs(self.outliers[0][1]) if self.outliers else 0.0
+
+    def __len__(self):
+        return len(self.members)
+
+# Functions
+#==================================================
+
+def canonical_angle(direction):
+    """
+    Folds a direction into [0°, 90°): parallel and perpendicular directions give the same angle.
+
+    Plain float math (atan2 and modulo) on the XY components, which replaces
+    get_angle_to_vector + the quadrant switch of the splashers.
+
+    Args:
+        direction (XYZ): Direction vector (only X and Y are read).
+
+    Returns:
+        float: Angle in degrees, 0 <= angle < 90.
+    """
+    angle = math.degrees(math.atan2(direction.Y, direction.X)) % DIRECTION_FOLD_DEGREES
+    if angle >= DIRECTION_FOLD_DEGREES:  # e.g. -1e-20 % 90.0 == 90.0 in floating point
+        angle = 0.0
+    return angle
+
+def angle_step(decimals):
+    """
+    Args:
+        decimals (int): Number of decimals considered, e.g. 11.
+
+    Returns:
+        float: The angle tolerance, 10^-decimals degrees.
+    """
+    return 10.0 ** -decimals
+
+def tolerance_decimals(tolerance):
+    """
+    Args:
+        tolerance (float): Angle tolerance in degrees, e.g. angle_step(3) == 0.001.
+
+    Returns:
+        int: Fewest decimals whose step is not larger than the tolerance (3 for 0.001, 1 for 0.5).
+    """
+    return max(0, int(math.ceil(-math.log10(tolerance) - 1e-9)))
+
+def direction_key(direction, decimals):
+    """
+    Buckets a direction by its canonical angle rounded to the given decimals.
+
+    Directions are parallel/perpendicular (at that tolerance) when their keys are equal.
+    Angles that round up to 90° wrap around to the key of 0°.
+
+    Args:
+        direction (XYZ): Direction vector.
+        decimals (int): Number of decimals considered.
+
+    Returns:
+        int: Canonical angle in steps of 10^-decimals degrees, 0 <= key < 90 * 10^decimals.
+    """
+    step = angle_step(decimals)
+    buckets = int(round(DIRECTION_FOLD_DEGREES / step))
+    return int(math.floor(canonical_angle(direction) / step + 0.5)) % buckets
+
+def key_to_angle(key, decimals):
+    """
+    Args:
+        key (int): Key returned by direction_key.
+        decimals (int): Number of decimals used for the key.
+
+    Returns:
+        float: The canonical angle of the key, in degrees.
+    """
+    return key / (10.0 ** decimals)
+
+def element_direction_key(element, decimals):
+    """
+    Args:
+        element (Element): Wall, Grid or ReferencePlane.
+        decimals (int): Number of decimals considered.
+
+    Returns:
+        int: direction_key of the element, or None if it has no direction.
+    """
+    direction = get_direction(element)
+    if not direction:
+        return None
+    return direction_key(direction, decimals)
+
+def angle_difference(angle, reference):
+    """
+    Args:
+        angle (float): Canonical angle in degrees.
+        reference (float): Canonical angle in degrees.
+
+    Returns:
+        float: Signed difference angle - reference folded into [-45°, 45°),
+               so 89.9° and 0.1° are 0.2° apart.
+    """
+    half = DIRECTION_FOLD_DEGREES / 2
+    return (angle - reference + half) % DIRECTION_FOLD_DEGREES - half
+
+def cluster_directions(elements, tolerance, reference_decimals=None):
+    """
+    Groups elements whose directions are parallel or perpendicular within a tolerance.
+
+    The canonical angles are sorted and swept once (O(n log n)). Each cluster is
+    anchored on its first angle and takes every following angle up to anchor +
+    tolerance, so a cluster never spans more than the tolerance (no chaining of
+    small steps). Angles wrap around 90°/0°: the sweep starts after the widest
+    gap between neighbouring angles, so a cluster is not cut at 0°.
+
+    Args:
+        elements (iterable[Element]): Walls, grids and reference planes.
+        tolerance (float): Largest angle in degrees between the first and the last angle of a cluster.
+        reference_decimals (int, optional): Decimals used to find the reference angle
+                                            and to tell outliers from the reference.
+                                            Defaults to tolerance_decimals(tolerance).
+
+    Returns:
+        list[DirectionCluster]: Clusters, largest first. Elements without a direction are left out.
+    """
+    if reference_decimals is None:
+        reference_decimals = tolerance_decimals(tolerance)
+
+    angles = []
+    for element in elements:
+        direction = get_direction(element)
+        if direction:
+            angles.append((canonical_angle(direction), element))
+    if not angles:
+        return []
+    angles.sort(key=lambda item: item[0])
+
+    # Start after the widest gap (the one across 90°/0° included) and unwrap the angles after it
+    gaps = [angles[i][0] - angles[i - 1][0] for i in range(1, len(angles))]
+    gaps.insert(0, angles[0][0] + DIRECTION_FOLD_DEGREES - angles[-1][0])
+    start = max(range(len(angles)), key=lambda i: gaps[i])
+    swept = angles[start:] + [(angle + DIRECTION_FOLD_DEGREES, element) for angle, element in angles[:start]]
+
+    # Sweep: an angle further than the tolerance from the anchor opens a new cluster
+    groups = []
+    anchor = None
+    for angle, element in swept:
+        if anchor is None or angle - anchor > tolerance:
+            groups.append([])
+            anchor = angle
+        groups[-1].append((angle % DIRECTION_FOLD_DEGREES, element))
+
+    step = angle_step(reference_decimals)
+    buckets = int(round(DIRECTION_FOLD_DEGREES / step))
+    clusters = []
+    for group in groups:
+        # Reference: most repeated angle at reference_decimals (the first one found on ties)
+        keys = [int(math.floor(angle / step + 0.5)) % buckets for angle, _ in group]
+        counts = {}
+        for key in keys:
+            counts[key] = counts.get(key, 0) + 1
+        reference_key = max(keys, key=lambda k: counts[k])
+        reference = key_to_angle(reference_key, reference_decimals)
+
+        members, outliers = [], []
+        for (angle, element), key in zip(group, keys):
+            member = (element, angle_difference(angle, reference))
+            members.append(member)
+            if key != reference_key:
+                outliers.append(member)
+        clusters.append(DirectionCluster(reference, reference_decimals, members, outliers))
+
+    clusters.sort(key=len, reverse=True)
+    return clusters
+
+def collect_direction_element_ids(doc, view_id=None):
+    """
+    Args:
+        doc (Document): Revit document.
+        view_id (ElementId, optional): Only the elements visible in this view. Defaults to the whole document.
+
+    Returns:
+        list[ElementId]: Walls, grids and reference planes.
+    """
+    def collector():
+        return FilteredElementCollector(doc, view_id) if view_id else FilteredElementCollector(doc)
+
+    all_walls      = collector().OfClass(Wall).ToElementIds()
+    all_grids      = collector().OfCategory(BuiltInCategory.OST_Grids).WhereElementIsNotElementType().ToElementIds()
+    all_ref_planes = collector().OfClass(ReferencePlane).ToElementIds()
+    return list(all_walls) + list(all_grids) + list(all_ref_planes)
+
+def collect_direction_elements(doc, view_id=None):
+    """
+    Args:
+        doc (Document): Revit document.
+        view_id (ElementId, optional): Only the elements visible in this view. Defaults to the whole document.
+
+    Returns:
+        list[Element]: Walls, grids and reference planes.
+    """
+    return [doc.GetElement(element_id) for element_id in collect_direction_element_ids(doc, view_id)]
+
+def cluster_report_rows(clusters, colors=None):
+    """
+    Summary of the clusters, one row each, header included.
+
+    Args:
+        clusters (list[DirectionCluster]): Clusters from cluster_directions.
+        colors (list[Color], optional): Color used for each cluster.
+
+    Returns:
+        list[list]: Rows for dump2.
+    """
+    rows = [["Cluster", "Reference Angle (°)", "Elements", "Spread (°)", "Outliers", "Max Deviation (°)", "Color (RGB)"]]
+    for i, cluster in enumerate(clusters):
+        color = colors[i] if colors else None
+        rows.append([i + 1,
+                     round(cluster.reference, cluster.decimals),
+                     len(cluster),
+                     cluster.spread,
+                     len(cluster.outliers),
+                     cluster.max_deviation,
+                     "{}, {}, {}".format(color.Red, color.Green, color.Blue) if color else ""])
+    return rows
+
+def cluster_element_rows(clusters):
+    """
+    Every clustered element, one row each, header first. Rows are yielded, so
+    large models can be written with dump2(..., streaming=True).
+
+    Args:
+        clusters (list[DirectionCluster]): Clusters from cluster_directions.
+
+    Yields:
+        list: [cluster, element id, category, angle, deviation, is outlier]
+    """
+    yield ["Cluster", "Element Id", "Category", "Angle (°)", "Deviation (°)", "Outlier"]
+    for i, cluster in enumerate(clusters):
+        outlier_ids = set(element.Id.IntegerValue for element, _ in cluster.outliers)
+        for element, deviation in cluster.members:
+            element_id = element.Id.IntegerValue
+            category = element.Category.Name if element.Category else ""
+            yield [i + 1,
+                   element_id,
+                   category,
+                   (cluster.reference + deviation) % DIRECTION_FOLD_DEGREES,
+                   deviation,
+                   element_id in outlier_ids]
@@ -6,6 +6,7 @@
 from Autodesk.Revit.DB import *
 import csv
 import codecs
+import gzip
 import os
 from Snippets._bimcore_strings import *
 import datetime
@@ -17,27 +18,86 @@ app   = __revit__.Application
 uidoc = __revit__.ActiveUIDocument
 doc   = __revit__.ActiveUIDocument.Document #type:Document
 
+CSV_BUFFER_SIZE = 1024 * 1024  # bytes buffered before each write to disk
+
+# Classes
+#==================================================
+
+class CsvStreamWriter(object):
+    """Writes CSV rows to a UTF-8 file as they are produced, through a large write buffer.
+
+    Rows can come one by one or from any iterable (generators included), so a
+    report never has to be assembled as a single list before it is written.
+
+    Usage:
+        with CsvStreamWriter(file_path) as writer:
+            writer.writerows(project_info)
+            for row in rows():
+                writer.writerow(row)
+
+    Args:
+        file_path (str): The path where the CSV file will be saved.
+        compress (bool, optional): Write a gzip file. ".gz" is appended to the path if missing.
+        buffer_size (int, optional): Size of the write buffer in bytes.
+    """
+
+    def __init__(self, file_path, compress=False, buffer_size=CSV_BUFFER_SIZE):
+        if compress and not file_path.endswith(".gz"):
+            file_path += ".gz"
+        self.file_path = file_path
+        self.row_count = 0
+
+        self._raw = open(file_path, 'wb', buffer_size)
+        self._gzip = gzip.GzipFile(filename=os.path.basename(file_path)[:-3], mode='wb', fileobj=self._raw) if compress else None
+        self._stream = codecs.getwriter('utf-8')(self._gzip or self._raw)
+        self._writer = csv.writer(self._stream, lineterminator='\n')
+
+    def writerow(self, row):
+        """Writes one row (list of values)."""
+        self._writer.writerow(row)
+        self.row_count += 1
+
+    def writerows(self, rows):
+        """Writes every row of an iterable (list, generator, itertools.chain...)."""
+        for row in rows:
+            self._writer.writerow(row)
+            self.row_count += 1
+
+    def close(self):
+        """Flushes the buffer and closes the file."""
+        if self._gzip is not None:
+            self._gzip.close()  # does not close the file object it wraps
+        self._raw.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
 # Functions
 #==================================================
 
-def export_to_csv(file_path, data, open_file=False):
+def export_to_csv(file_path, data, open_file=False, compress=False):
     """Exports the given data to a CSV file at the specified file path.
 
     Args:
         file_path (str): The path where the CSV file will be saved.
-        data (list of lists): The data to write to the CSV file. Each inner list represents a row.
+        data (iterable of lists): The data to write to the CSV file. Each inner list represents a row.
+                                  Any iterable works, e.g. itertools.chain(project_info, rows).
+        open_file (bool, optional): Open the file once written (Windows only).
+        compress (bool, optional): Write a gzip file (".gz" is appended to the path).
 
     Returns:
         str: The file path where the CSV file was saved.
     """
-    # Open the file with codecs and utf-8 encoding
-    with codecs.open(file_path, 'w', 'utf-8') as file:
-        writer = csv.writer(file, lineterminator='\n')
+    with CsvStreamWriter(file_path, compress=compress) as writer:
         writer.writerows(data)
     # Optionally open file (Windows only)
     if open_file:
-        os.startfile(file_path)
-    return  file_path
+        os.startfile(writer.file_path)
+    return writer.file_path
 
 def create_report_directory(folder_name="NEW DIRECTORY", open_directory=True):
     """Creates a directory with the specified folder name in the user's Documents folder if it doesn't already exist.
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+# Imports
+#==================================================
+from Autodesk.Revit.DB import *
+import hashlib
+import json
+import os
+from Snippets._bimcore_graphics_override import FilterOverrideEvaluator
+
+# Variables
+#==================================================
+app   = __revit__.Application
+uidoc = __revit__.ActiveUIDocument
+doc   = __revit__.ActiveUIDocument.Document #type:Document
+
+FILTER_SNAPSHOT_VERSION = 1
+
+# Column kinds of the Usage Report rows for the Arrow export (see _bimcore_arrow.write_arrow_stream)
+FILTER_REPORT_COLUMN_KINDS = ["int64", "string", "bool", "bool", "string", "string", "bool", "string", "string"]
+# Repeated values, dictionary-encoded so they load as categories
+FILTER_REPORT_DICTIONARY_COLUMNS = ["Change", "Filter Name", "View Type", "View Template Name Applied"]
+
+# Classes
+#==================================================
+
+class FilterAudit(object):
+    """
+    Audits the V/G filters of many views, reading each controlling view only once.
+
+    A view whose filters are controlled by its view template shows exactly the
+    template's filters, so the filters, their enabled/visible state and their
+    overrides are read from the template once and reused for every view it controls.
+
+    Usage:
+        audit = FilterAudit(doc)
+        for view in views:
+            for state in audit.filter_states(view):
+                state["id"], state["name"], state["enabled"], state["visible"]
+            audit.is_overriding(view, filter_id)
+    """
+
+    def __init__(self, doc, evaluator=None):
+        self.doc = doc
+        self.evaluator = evaluator or FilterOverrideEvaluator(doc)
+        self._states = {}        # controlling view id -> [filter state]
+        self._filter_names = {}  # filter id -> name
+
+    def controlling_view(self, view):
+        """
+        Args:
+            view (View): View or view template.
+
+        Returns:
+            View: The view template that controls the V/G filters of the view, or the view itself.
+        """
+        return self.evaluator.controlling_view(view)
+
+    def controls_own_filters(self, view):
+        """
+        Args:
+            view (View): View or view template.
+
+        Returns:
+            bool: True if the filters are edited on the view itself (not through a template).
+        """
+        return self.controlling_view(view).Id == view.Id
+
+    def _filter_name(self, filter_id):
+        key = filter_id.IntegerValue
+        name = self._filter_names.get(key)
+        if name is None:
+            name = self._filter_names[key] = self.doc.GetElement(filter_id).Name
+        return name
+
+    def filter_states(self, view):
+        """
+        Returns the filters applied to a view, read from its controlling view.
+
+        Args:
+            view (View): View or view template.
+
+        Returns:
+            list[dict]: One dict per filter, in the view order: id (ElementId), name,
+                        enabled and visible. Empty if the view does not support filters.
+        """
+        controlling = self.controlling_view(view)
+        key = controlling.Id.IntegerValue
+
+        states = self._states.get(key)
+        if states is None:
+            states = self._states[key] = []
+            try:
+                filter_ids = controlling.GetFilters()
+            except Exception:
+                filter_ids = []
+            for filter_id in filter_ids:
+                states.append({
+                    "id":      filter_id,
+                    "name":    self._filter_name(filter_id),
+                    "enabled": controlling.GetIsFilterEnabled(filter_id),
+                    "visible": controlling.GetFilterVisibility(filter_id),
+                })
+        return states
+
+    def is_overriding(self, view, filter_id):
+        """
+        Args:
+            view (View): View or view template.
+            filter_id (ElementId): Filter applied to the view.
+
+        Returns:
+            bool: True if the filter hides elements or overrides any graphics (see FilterOverrideEvaluator).
+        """
+        return self.evaluator.is_overriding(view, filter_id)
+
+# Functions
+#==================================================
+
+def filter_rows_hash(rows):
+    """
+    Returns a hash of the report rows of one view, used to detect changes between exports.
+
+    Args:
+        rows (list[list]): Report rows of the view.
+
+    Returns:
+        str: SHA-1 hex digest.
+    """
+    return hashlib.sha1(json.dumps(rows, sort_keys=True).encode("utf-8")).hexdigest()
+
+def load_filter_snapshot(snapshot_path):
+    """
+    Reads the per-view snapshot of the previous export.
+
+    Args:
+        snapshot_path (str): Full path of the snapshot file.
+
+    Returns:
+        dict: {view id (str): {"hash": str, "rows": list}}. Empty if there is no valid snapshot.
+    """
+    if not os.path.exists(snapshot_path):
+        return {}
+    try:
+        with open(snapshot_path) as f:
+            snapshot = json.load(f)
+    except (IOError, ValueError):
+        return {}
+    if snapshot.get("version") != FILTER_SNAPSHOT_VERSION:
+        return {}
+    return snapshot.get("views", {})
+
+def save_filter_snapshot(snapshot_path, rows_by_view):
+    """
+    Writes the per-view snapshot of the current export, replacing the previous one.
+
+    Args:
+        snapshot_path (str): Full path of the snapshot file.
+        rows_by_view (dict): {view id (str): report rows of the view}.
+    """
+    views = dict((view_id, {"hash": filter_rows_hash(rows), "rows": rows})
+                 for view_id, rows in rows_by_view.items())
+    temp_path = snapshot_path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump({"version": FILTER_SNAPSHOT_VERSION, "views": views}, f, separators=(",", ":"))
+    if os.path.exists(snapshot_path):
+        os.remove(snapshot_path)
+    os.rename(temp_path, snapshot_path)
+
+def diff_filter_snapshot(previous_views, rows_by_view):
+    """
+    Compares the current report rows against the previous snapshot, view by view.
+
+    Args:
+        previous_views (dict): Snapshot from load_filter_snapshot.
+        rows_by_view (dict): {view id (str): current report rows of the view}.
+
+    Returns:
+        tuple:
+            list[list]: Delta rows as [change, view id] + row. change is "added" (new view),
+                        "changed" (replaces every previous row of the view) or "removed"
+                        (the previous rows of a view that no longer has filters).
+            dict: Number of views per change, plus "unchanged".
+    """
+    delta = []
+    counts = {"added": 0, "changed": 0, "removed": 0, "unchanged": 0}
+
+    for view_id, rows in rows_by_view.items():
+        previous = previous_views.get(view_id)
+        if previous is None:
+            change = "added"
+        elif previous["hash"] != filter_rows_hash(rows):
+            change = "changed"
+        else:
+            counts["unchanged"] += 1
+            continue
+        counts[change] += 1
+        delta.extend([change, view_id] + row for row in rows)
+
+    for view_id, previous in previous_views.items():
+        if view_id not in rows_by_view:
+            counts["removed"] += 1
+            delta.extend(["removed", view_id] + row for row in previous["rows"])
+
+    return delta, counts
+
+def append_filter_manifest(manifest_path, entry):
+    """
+    Adds an export to the manifest that lists every report written for a model.
+
+    The manifest is a JSON Lines file: each export appends one line, so the
+    previous entries are never read or rewritten.
+
+    Args:
+        manifest_path (str): Full path of the manifest file (.jsonl).
+        entry (dict): Export details (date, time, mode, file, counts).
+    """
+    line = dict(entry, version=FILTER_SNAPSHOT_VERSION)
+    with open(manifest_path, "a") as f:
+        f.write(json.dumps(line, sort_keys=True, separators=(",", ":")) + "\n")
@@ -82,4 +82,25 @@ def get_parameter_by_name(element, param_name):
     for param in element.Parameters:
         if param.Definition.Name == param_name:
             return param
-    return None
\ No newline at end of file
+    return None
+
+def get_parameters_by_name(element):
+    """
+    Returns all the parameters of an element keyed by name, in a single pass.
+
+    Use it instead of calling get_parameter_by_name in a loop when several
+    parameters of the same element are needed.
+
+    Args:
+        element: Revit element
+
+    Returns:
+        dict: {parameter name: Parameter}. If two parameters share a name,
+              the first one wins (same as get_parameter_by_name).
+    """
+    parameters = {}
+    for param in element.Parameters:
+        name = param.Definition.Name
+        if name not in parameters:
+            parameters[name] = param
+    return parameters
\ No newline at end of file
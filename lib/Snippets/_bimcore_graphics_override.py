@@ -111,4 +111,253 @@ def lighten_color(color, factor=0.2):
     new_b = min(int(b + (255 - b) * factor), 255)
 
     # Return the new lightened color
-    return Color(new_r, new_g, new_b)
\ No newline at end of file
+    return Color(new_r, new_g, new_b)
+
+
+# OVERRIDE SIGNATURES
+#==================================================
+# Every setting of an OverrideGraphicSettings, as (property, kind).
+# Ordered so the settings most often overridden by filters are compared first.
+OVERRIDE_FIELDS = [
+    ("ProjectionLineColor",               "color"),
+    ("SurfaceForegroundPatternColor",     "color"),
+    ("SurfaceForegroundPatternId",        "pattern"),
+    ("Halftone",                          "value"),
+    ("Transparency",                      "value"),
+    ("ProjectionLineWeight",              "value"),
+    ("ProjectionLinePatternId",           "pattern"),
+    ("CutLineColor",                      "color"),
+    ("CutForegroundPatternColor",         "color"),
+    ("CutForegroundPatternId",            "pattern"),
+    ("CutLineWeight",                     "value"),
+    ("CutLinePatternId",                  "pattern"),
+    ("IsSurfaceForegroundPatternVisible", "value"),
+    ("SurfaceBackgroundPatternColor",     "color"),
+    ("SurfaceBackgroundPatternId",        "pattern"),
+    ("IsSurfaceBackgroundPatternVisible", "value"),
+    ("IsCutForegroundPatternVisible",     "value"),
+    ("CutBackgroundPatternColor",         "color"),
+    ("CutBackgroundPatternId",            "pattern"),
+    ("IsCutBackgroundPatternVisible",     "value"),
+]
+
+# Detail level overrides exist from Revit 2022 (ViewDetailLevel, Undefined by default)
+if hasattr(OverrideGraphicSettings, "DetailLevel"):
+    OVERRIDE_FIELDS.append(("DetailLevel", "value"))
+
+class PatternLookup(object):
+    """
+    Memoised check of line/fill pattern ids for one document.
+
+    A pattern id only counts as an override if the element exists, and each id
+    is resolved with doc.GetElement once.
+    """
+
+    def __init__(self, doc):
+        self.doc = doc
+        self._patterns = {}  # int id -> int id, or -1 if there is no pattern
+
+    def key(self, pattern_id):
+        """
+        Args:
+            pattern_id (ElementId): Pattern id stored in an OverrideGraphicSettings.
+
+        Returns:
+            int: The id if the pattern exists, otherwise -1.
+        """
+        int_id = pattern_id.IntegerValue
+        if int_id == -1:
+            return -1
+        key = self._patterns.get(int_id)
+        if key is None:
+            key = self._patterns[int_id] = int_id if self.doc.GetElement(pattern_id) else -1
+        return key
+
+def override_field_value(overrides, field, kind, patterns):
+    """
+    Returns a comparable value for one setting of an OverrideGraphicSettings.
+
+    Args:
+        overrides (OverrideGraphicSettings): Settings to read.
+        field (str): Property name, see OVERRIDE_FIELDS.
+        kind (str): "color", "pattern" or "value".
+        patterns (PatternLookup): Pattern lookup of the document.
+
+    Returns:
+        Hashable value: (R, G, B) or None for colors, pattern id or -1 for patterns, the raw value otherwise.
+    """
+    value = getattr(overrides, field)
+    if kind == "color":
+        return (value.Red, value.Green, value.Blue) if value.IsValid else None
+    if kind == "pattern":
+        return patterns.key(value)
+    return value
+
+def override_signature(overrides, patterns):
+    """
+    Returns the full signature of an OverrideGraphicSettings.
+
+    Two settings with the same signature display the same way.
+
+    Args:
+        overrides (OverrideGraphicSettings): Settings to read.
+        patterns (PatternLookup): Pattern lookup of the document.
+
+    Returns:
+        tuple: One comparable value per OVERRIDE_FIELDS entry.
+    """
+    return tuple(override_field_value(overrides, field, kind, patterns) for field, kind in OVERRIDE_FIELDS)
+
+class FilterOverrideEvaluator(object):
+    """
+    Tells whether a view filter changes the graphics of a view.
+
+    - The overrides are compared setting by setting against the signature of a
+      default OverrideGraphicSettings, and the comparison stops at the first difference.
+    - Pattern elements are resolved once per document (PatternLookup).
+    - Results are cached per (controlling view id, filter id): views whose filters
+      are controlled by the same template are evaluated once.
+
+    Usage:
+        evaluator = FilterOverrideEvaluator(doc)
+        evaluator.is_overriding(view, filter_id)
+    """
+
+    def __init__(self, doc):
+        self.doc = doc
+        self.patterns = PatternLookup(doc)
+        self.default_signature = override_signature(OverrideGraphicSettings(), self.patterns)
+        self._results = {}             # (view id, filter id) -> bool
+        self._template_controls = {}   # template id -> bool (template controls V/G filters)
+        self._filters_parameter_id = ElementId(BuiltInParameter.VIS_GRAPHICS_FILTERS)
+
+    def controlling_view(self, view):
+        """
+        Returns the view whose filter settings apply to a view.
+
+        Args:
+            view (View): View or view template.
+
+        Returns:
+            View: The assigned view template if it controls the filters, otherwise the view itself.
+        """
+        if view.IsTemplate or view.ViewTemplateId == ElementId.InvalidElementId:
+            return view
+
+        template_key = view.ViewTemplateId.IntegerValue
+        controls = self._template_controls.get(template_key)
+        if controls is None:
+            template = self.doc.GetElement(view.ViewTemplateId)
+            controls = self._template_controls[template_key] = \
+                template is not None and self._filters_parameter_id not in template.GetNonControlledTemplateParameterIds()
+        return self.doc.GetElement(view.ViewTemplateId) if controls else view
+
+    def overrides_differ_from_default(self, overrides):
+        """
+        Args:
+            overrides (OverrideGraphicSettings): Settings to check.
+
+        Returns:
+            bool: True as soon as one setting differs from a default OverrideGraphicSettings.
+        """
+        for (field, kind), default_value in zip(OVERRIDE_FIELDS, self.default_signature):
+            if override_field_value(overrides, field, kind, self.patterns) != default_value:
+                return True
+        return False
+
+    def is_overriding(self, view, filter_id):
+        """
+        Checks whether a filter hides elements or overrides any graphics in a view.
+
+        Args:
+            view (View): View or view template where the filter is applied.
+            filter_id (ElementId): Id of the filter.
+
+        Returns:
+            bool: True if the filter hides elements or overrides at least one setting.
+        """
+        controlling = self.controlling_view(view)
+        key = (controlling.Id.IntegerValue, filter_id.IntegerValue)
+        result = self._results.get(key)
+        if result is None:
+            result = self._results[key] = \
+                not controlling.GetFilterVisibility(filter_id) or \
+                self.overrides_differ_from_default(controlling.GetFilterOverrides(filter_id))
+        return result
+
+def override_matches(overrides, signature, patterns):
+    """
+    Compares an OverrideGraphicSettings with a signature, stopping at the first difference.
+
+    Args:
+        overrides (OverrideGraphicSettings): Settings to check.
+        signature (tuple): Signature from override_signature.
+        patterns (PatternLookup): Pattern lookup of the document.
+
+    Returns:
+        bool: True if the settings display the same way as the signature.
+    """
+    for (field, kind), value in zip(OVERRIDE_FIELDS, signature):
+        if override_field_value(overrides, field, kind, patterns) != value:
+            return False
+    return True
+
+class OverrideApplier(object):
+    """
+    Applies element graphic overrides in a view, one OverrideGraphicSettings per style.
+
+    - Each style is built once and registered with its signature.
+    - Elements whose current overrides already match the style are skipped,
+      so re-running a command only touches the elements that change.
+
+    Must be used inside a transaction.
+
+    Usage:
+        applier = OverrideApplier(doc, view)
+        applier.add_style("green", set_graphics_override_direction(line_weight=5, color_lines=green))
+        applier.apply(element_ids, "green")
+        applier.applied, applier.skipped
+    """
+
+    def __init__(self, doc, view, patterns=None):
+        self.doc = doc
+        self.view = view
+        self.patterns = patterns or PatternLookup(doc)
+        self._styles = {}  # key -> (OverrideGraphicSettings, signature)
+        self.applied = 0
+        self.skipped = 0
+
+    def add_style(self, key, settings):
+        """
+        Args:
+            key (hashable): Name of the style, e.g. a color tuple.
+            settings (OverrideGraphicSettings): Overrides of the style.
+        """
+        self._styles[key] = (settings, override_signature(settings, self.patterns))
+
+    def has_style(self, key):
+        """Returns: bool: True if a style is registered under key."""
+        return key in self._styles
+
+    def apply(self, element_ids, key):
+        """
+        Applies a style to elements of the view.
+
+        Args:
+            element_ids (iterable[ElementId]): Elements to override.
+            key (hashable): Style registered with add_style.
+
+        Returns:
+            int: Number of elements whose overrides were changed.
+        """
+        settings, signature = self._styles[key]
+        view = self.view
+        applied = 0
+        for element_id in element_ids:
+            if override_matches(view.GetElementOverrides(element_id), signature, self.patterns):
+                self.skipped += 1
+                continue
+            view.SetElementOverrides(element_id, settings)
+            applied += 1
+        self.applied += applied
+        return applied
@@ -12,6 +12,19 @@ app   = __revit__.Application
 uidoc = __revit__.ActiveUIDocument
 doc   = __revit__.ActiveUIDocument.Document #type:Document
 
+# Categories kept as members of a detail group (nested detail groups included)
+DETAIL_GROUP_MEMBER_CATEGORIES = {
+    int(BuiltInCategory.OST_DetailComponents),
+    int(BuiltInCategory.OST_Lines),
+    int(BuiltInCategory.OST_CLines), # Reference Planes
+    int(BuiltInCategory.OST_TextNotes),
+    int(BuiltInCategory.OST_InsulationLines),
+    int(BuiltInCategory.OST_GenericAnnotation),
+    int(BuiltInCategory.OST_RevisionClouds),
+    int(BuiltInCategory.OST_IOSDetailGroups),  # Include detail groups
+    int(BuiltInCategory.OST_Dimensions)
+}
+
 # Functions
 #==================================================
 
@@ -27,17 +40,7 @@ def collect_all_group_members(doc, group):
     Returns:
         list: A list of elements in the group, including nested detail groups and specified categories.
     """
-    allowed_categories = {
-        int(BuiltInCategory.OST_DetailComponents),
-        int(BuiltInCategory.OST_Lines),
-        int(BuiltInCategory.OST_CLines), # Reference Planes
-        int(BuiltInCategory.OST_TextNotes),
-        int(BuiltInCategory.OST_InsulationLines),
-        int(BuiltInCategory.OST_GenericAnnotation),
-        int(BuiltInCategory.OST_RevisionClouds),
-        int(BuiltInCategory.OST_IOSDetailGroups),  # Include detail groups
-        int(BuiltInCategory.OST_Dimensions)
-    }
+    allowed_categories = DETAIL_GROUP_MEMBER_CATEGORIES
 
     all_members = []
     group_members = group.GetMemberIds()  # Get direct members of the group
@@ -54,3 +57,122 @@ def collect_all_group_members(doc, group):
             all_members.extend(collect_all_group_members(doc, member))
 
     return all_members
+
+
+class GroupHierarchyIndex(object):
+    """
+    Index of the detail group hierarchy of a document, built once.
+
+    Every group's members are read a single time and nested groups are flattened
+    with an explicit stack (no recursion), reusing the result of inner groups.
+    It returns the same members as collect_all_group_members.
+
+    Usage:
+        group_index = GroupHierarchyIndex(doc)
+        group_index.members(group)          # flattened member elements
+        group_index.parent_id(element_id)   # int id of the group that contains it, or None
+    """
+
+    def __init__(self, doc, group_category=BuiltInCategory.OST_IOSDetailGroups,
+                 allowed_categories=DETAIL_GROUP_MEMBER_CATEGORIES):
+        self.doc = doc
+        self.group_category_id = int(group_category)
+        self.allowed_categories = allowed_categories
+
+        self._elements = {}       # member id -> member element
+        self._direct_members = {} # group id -> [member id] (allowed categories only)
+        self._parents = {}        # member id -> group id
+        self._flat_members = {}   # group id -> [member id] including nested groups
+
+        groups = (FilteredElementCollector(doc)
+                  .OfCategory(group_category)
+                  .WhereElementIsNotElementType()
+                  .ToElements())
+        for group in groups:
+            self._read_group(group)
+
+        for group_id in list(self._direct_members):
+            self._flatten(group_id)
+
+    def _read_group(self, group):
+        group_id = group.Id.IntegerValue
+        direct_members = []
+        for member_id in group.GetMemberIds():
+            member = self.doc.GetElement(member_id)
+            if not member.Category or member.Category.Id.IntegerValue not in self.allowed_categories:
+                continue
+            member_int_id = member_id.IntegerValue
+            self._elements[member_int_id] = member
+            self._parents[member_int_id] = group_id
+            direct_members.append(member_int_id)
+        self._direct_members[group_id] = direct_members
+
+    def _is_group(self, element_id):
+        element = self._elements.get(element_id)
+        return element is not None and element.Category.Id.IntegerValue == self.group_category_id
+
+    def _flatten(self, root_id):
+        # Post-order walk: a group is flattened once all its nested groups are
+        stack = [(root_id, False)]
+        while stack:
+            group_id, children_done = stack.pop()
+            if group_id in self._flat_members:
+                continue
+
+            nested_groups = [m for m in self._direct_members.get(group_id, []) if self._is_group(m)]
+            if not children_done:
+                stack.append((group_id, True))
+                stack.extend((g, False) for g in nested_groups if g not in self._flat_members)
+                continue
+
+            flat_members = []
+            for member_id in self._direct_members.get(group_id, []):
+                flat_members.append(member_id)
+                if member_id in self._flat_members:
+                    flat_members.extend(self._flat_members[member_id])
+            self._flat_members[group_id] = flat_members
+
+    @staticmethod
+    def _int_id(element_or_id):
+        if isinstance(element_or_id, int):
+            return element_or_id
+        if isinstance(element_or_id, ElementId):
+            return element_or_id.IntegerValue
+        return element_or_id.Id.IntegerValue
+
+    def member_ids(self, group):
+        """
+        Args:
+            group (Group, ElementId or int): The detail group.
+
+        Returns:
+            list[int]: Ids of all members, nested groups and their members included.
+        """
+        return self._flat_members.get(self._int_id(group), [])
+
+    def members(self, group):
+        """
+        Args:
+            group (Group, ElementId or int): The detail group.
+
+        Returns:
+            list[Element]: All members, nested groups and their members included.
+        """
+        return [self._elements[member_id] for member_id in self.member_ids(group)]
+
+    def parent_id(self, element):
+        """
+        Args:
+            element (Element, ElementId or int): Any element.
+
+        Returns:
+            int or None: Id of the group that directly contains the element.
+        """
+        return self._parents.get(self._int_id(element))
+
+    def grouped_ids(self):
+        """
+        Returns:
+            set[int]: Ids of every element that belongs to a group (at any depth).
+        """
+        return set(self._parents)
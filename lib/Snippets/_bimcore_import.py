@@ -4,11 +4,22 @@
 # Imports
 #==================================================
 from Snippets._bimcore_strings import *
-
+from Snippets._bimcore_export import create_report_directory
+from Snippets._bimcore_xlsx import iter_xlsx_rows, number_to_text, xlsx_read
+
+import hashlib
+import itertools
+import json
+import os
+import time
 import clr
 
-clr.AddReference("Microsoft.Office.Interop.Excel")
-from Microsoft.Office.Interop import Excel
+# Office is optional: without it only the native .xlsx reader is available
+try:
+    clr.AddReference("Microsoft.Office.Interop.Excel")
+    from Microsoft.Office.Interop import Excel
+except Exception:
+    Excel = None
 
 clr.AddReference("RevitAPIUI")
 from Autodesk.Revit.UI import TaskDialog
@@ -20,10 +31,194 @@ app   = __revit__.Application
 uidoc = __revit__.ActiveUIDocument
 doc   = __revit__.ActiveUIDocument.Document #type:Document
 
+# Default reader used by excel_read: "xlsx" (native, no Office needed) or "com" (Excel via COM)
+EXCEL_READ_BACKEND = "xlsx"
+XLSX_EXTENSIONS = (".xlsx", ".xlsm")
+
+# Parsed workbook rows are cached as JSON-lines sidecars in ~/Documents/PyRevit_Exports/<EXCEL_CACHE_FOLDER>
+EXCEL_CACHE_FOLDER = "Bimming_Excel_Cache"
+EXCEL_CACHE_VERSION = 2
+
+# Bump the version of a reader whenever the rows it returns change, so older caches are re-read
+EXCEL_READER_VERSIONS = {
+    "xlsx": 1,
+    "com":  1,
+}
+
+# Value2 returns cell errors as Int32 codes, .Text shows the error literal
+EXCEL_ERROR_CODES = {
+    -2146826281: "#DIV/0!",
+    -2146826246: "#N/A",
+    -2146826259: "#NAME?",
+    -2146826288: "#NULL!",
+    -2146826252: "#NUM!",
+    -2146826265: "#REF!",
+    -2146826273: "#VALUE!",
+}
+
 # Functions
 #==================================================
 
-def excel_read_via_com(path, sheet_name="Sheet1", required_col_index=1, stop_on_empty_first_row_col=True):
+def excel_value_to_text(value):
+    """
+    Converts a raw Excel cell value (Range.Value2) into the text Excel displays
+    for a cell with the 'General' number format, i.e. the same result as
+    reading Range.Text cell by cell.
+
+    Args:
+        value: Raw cell value (None, float, bool, int error code or string).
+
+    Returns:
+        str: The cell text. Empty cells return "".
+
+    Notes:
+        - Whole numbers are returned without decimals (12.0 -> "12").
+        - Other numbers keep 15 significant digits, Excel's own precision.
+        - Custom number formats (dates, percentages, ...) are not applied.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float):
+        return number_to_text(value)
+    if isinstance(value, int) and value in EXCEL_ERROR_CODES:
+        return EXCEL_ERROR_CODES[value]
+    return "{}".format(value)
+
+def report_excel_read_timing(label, path, start, data, row_count=None):
+    """Prints how long an Excel read took, so the different readers can be compared.
+
+    Args:
+        label (str): Name of the reader used.
+        path (str): Excel file that was read.
+        start (float): time.time() taken before the read started.
+        data (list[list]): Rows returned by the reader (only the first one is needed with row_count).
+        row_count (int, optional): Number of rows read, for streamed reads. Defaults to len(data).
+    """
+    cols = len(data[0]) if data else 0
+    rows = len(data) if row_count is None else row_count
+    print("{}: {} rows x {} columns read in {:.2f} s ({})".format(
+        label, rows, cols, time.time() - start, path))
+
+def start_excel():
+    """Starts a hidden Excel instance through COM.
+
+    Returns:
+        Excel.ApplicationClass: The running Excel application.
+
+    Raises:
+        EnvironmentError: If Microsoft Excel is not installed on this machine.
+    """
+    if Excel is None:
+        raise EnvironmentError("Microsoft Excel is not installed. Use the native .xlsx reader instead.")
+    excel = Excel.ApplicationClass()
+    excel.Visible = False
+    return excel
+
+def excel_iter_rows_via_com(path, sheet_name="Sheet1", required_col_index=1, stop_on_empty_first_row_col=True):
+    """
+    Streams the rows of an Excel sheet read through COM with a single bulk
+    request (Range.Value2) instead of one COM round-trip per cell.
+
+    Excel is closed before the first row is yielded. Rows are converted to
+    Python lists one at a time, so only the raw COM array and the current row
+    are held in memory.
+
+    Args:
+        path (str): Full file path to the Excel file.
+        sheet_name (str, optional): Name of the sheet to read. Defaults to "Sheet1".
+        required_col_index (int, optional): Column index (1-based) that must have a
+                                            value for a row to be included. If None,
+                                            all rows are included. Defaults to 1.
+        stop_on_empty_first_row_col (bool, optional): If True, stops reading columns
+                                                      once an empty cell is found
+                                                      in the first row. Defaults to True.
+
+    Yields:
+        list[str]: The cell texts of each row.
+    """
+    excel = start_excel()
+    wb = excel.Workbooks.Open(path)
+
+    try:
+        try:
+            sheet = wb.Worksheets(sheet_name)
+        except:
+            sheet = wb.ActiveSheet
+
+        used = sheet.UsedRange
+        max_row = used.Rows.Count
+        max_col = used.Columns.Count
+
+        # Same A1-anchored block the cell-by-cell reader walks, in one COM call
+        block = sheet.Range(sheet.Cells(1, 1), sheet.Cells(max_row, max_col)).Value2
+    finally:
+        wb.Close(False)
+        excel.Quit()
+
+    # A single cell comes back as a scalar instead of a 2D array
+    if max_row == 1 and max_col == 1:
+        get_value = lambda r, c: block
+    else:
+        r0 = block.GetLowerBound(0) - 1
+        c0 = block.GetLowerBound(1) - 1
+        get_value = lambda r, c: block[r0 + r, c0 + c]
+
+    # Determine max column from first row
+    if stop_on_empty_first_row_col:
+        effective_max_col = 0
+        for c in range(1, max_col + 1):
+            v = get_value(1, c)
+            if v is None or v == "":
+                break
+            effective_max_col = c
+    else:
+        effective_max_col = max_col
+
+    for r in range(1, max_row + 1):
+
+        # REQUIRED COLUMN MUST HAVE A VALUE
+        if required_col_index is not None:
+            req_value = get_value(r, required_col_index) if required_col_index <= max_col else None
+            if req_value is None or req_value == "":
+                continue
+
+        yield [excel_value_to_text(get_value(r, c)) for c in range(1, effective_max_col + 1)]
+
+def excel_read_via_com_bulk(path, sheet_name="Sheet1", required_col_index=1, stop_on_empty_first_row_col=True, report_timing=False):
+    """
+    Reads data from an Excel sheet using the COM interface with a single bulk
+    request (Range.Value2) instead of one COM round-trip per cell.
+
+    Column trimming, required-column filtering and text conversion are done in
+    Python, so the result matches excel_read_via_com(..., bulk=False).
+
+    Args:
+        path (str): Full file path to the Excel file.
+        sheet_name (str, optional): Name of the sheet to read. Defaults to "Sheet1".
+        required_col_index (int, optional): Column index (1-based) that must have a
+                                            value for a row to be included. If None,
+                                            all rows are included. Defaults to 1.
+        stop_on_empty_first_row_col (bool, optional): If True, stops reading columns
+                                                      once an empty cell is found
+                                                      in the first row. Defaults to True.
+        report_timing (bool, optional): If True, prints the time spent reading.
+
+    Returns:
+        list[list]: A 2D list representing the sheet contents,
+                    where each inner list holds the cell texts of a row.
+    """
+    start = time.time()
+
+    data = list(excel_iter_rows_via_com(path, sheet_name, required_col_index, stop_on_empty_first_row_col))
+
+    if report_timing:
+        report_excel_read_timing("Excel read (COM bulk)", path, start, data)
+
+    return data
+
+def excel_read_via_com(path, sheet_name="Sheet1", required_col_index=1, stop_on_empty_first_row_col=True, bulk=True, report_timing=False):
     """
     Reads data from an Excel sheet using the COM interface, returning rows as lists.
     Allows restricting the number of read columns based on the first row and skipping
@@ -40,14 +235,22 @@ def excel_read_via_com(path, sheet_name="Sheet1", required_col_index=1, stop_on_
                                                       in the first row. Determines
                                                       the effective max column count.
                                                       Defaults to True.
+        bulk (bool, optional): If True, reads the whole range in one request via
+                               excel_read_via_com_bulk. Set to False to use the
+                               original cell-by-cell reader. Defaults to True.
+        report_timing (bool, optional): If True, prints the time spent reading.
 
     Returns:
         list[list]: A 2D list representing the sheet contents,
                     where each inner list holds the cell values of a row.
     """
+    if bulk:
+        return excel_read_via_com_bulk(path, sheet_name, required_col_index,
+                                       stop_on_empty_first_row_col, report_timing)
 
-    excel = Excel.ApplicationClass()
-    excel.Visible = False
+    start = time.time()
+
+    excel = start_excel()
     wb = excel.Workbooks.Open(path)
 
     try:
@@ -92,127 +295,388 @@ def excel_read_via_com(path, sheet_name="Sheet1", required_col_index=1, stop_on_
     wb.Close(False)
     excel.Quit()
 
+    if report_timing:
+        report_excel_read_timing("Excel read (COM cell by cell)", path, start, data)
+
     return data
 
-def excel_rows_to_dict(data, start_row, key_col=0, value_col=1, stop_on_empty=True):
+def excel_read(path, sheet_name="Sheet1", required_col_index=1, stop_on_empty_first_row_col=True, backend=None, report_timing=False):
     """
-    Converts a 2D list into a simple dictionary {key: value}.
+    Reads data from an Excel sheet with the selected reader, returning rows as lists.
+
+    The native reader parses .xlsx/.xlsm files directly (no Office, no Excel start-up).
+    Other formats (e.g. legacy .xls) always go through COM.
 
     Args:
-        data (list[list]): Full dataset from Excel.
-        start_row (int): Row index where data begins (0-based).
-        key_col (int): Column index for dictionary key.
-        value_col (int): Column index for dictionary value.
-        stop_on_empty (bool): Stop reading when key cell is empty.
+        path (str): Full file path to the Excel file.
+        sheet_name (str, optional): Name of the sheet to read. Defaults to "Sheet1".
+        required_col_index (int, optional): Column index (1-based) that must have a
+                                            value for a row to be included. If None,
+                                            all rows are included. Defaults to 1.
+        stop_on_empty_first_row_col (bool, optional): If True, stops reading columns
+                                                      once an empty cell is found
+                                                      in the first row. Defaults to True.
+        backend (str, optional): "xlsx" or "com". Defaults to EXCEL_READ_BACKEND.
+        report_timing (bool, optional): If True, prints the time spent reading.
 
     Returns:
-        dict
+        list[list]: A 2D list representing the sheet contents,
+                    where each inner list holds the cell texts of a row.
+    """
+    backend = backend or EXCEL_READ_BACKEND
+
+    if backend == "xlsx" and os.path.splitext(path)[1].lower() in XLSX_EXTENSIONS:
+        start = time.time()
+        data = xlsx_read(path, sheet_name, required_col_index, stop_on_empty_first_row_col)
+        if report_timing:
+            report_excel_read_timing("Excel read (native xlsx)", path, start, data)
+        return data
+
+    return excel_read_via_com(path, sheet_name, required_col_index, stop_on_empty_first_row_col,
+                              report_timing=report_timing)
+
+def file_sha1(path, block_size=1 << 20):
+    """Returns the SHA-1 hex digest of a file's contents, read in blocks.
+
+    Args:
+        path (str): Full file path.
+        block_size (int, optional): Bytes read per block. Defaults to 1 MB.
+
+    Returns:
+        str: The hex digest.
+    """
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        block = f.read(block_size)
+        while block:
+            digest.update(block)
+            block = f.read(block_size)
+    return digest.hexdigest()
+
+def excel_effective_backend(path, backend=None):
+    """Returns the reader actually used for a file: .xlsx/.xlsm only go native when backend is "xlsx".
+
+    Args:
+        path (str): Full file path to the Excel file.
+        backend (str, optional): "xlsx" or "com". Defaults to EXCEL_READ_BACKEND.
+
+    Returns:
+        str: "xlsx" or "com".
+    """
+    backend = backend or EXCEL_READ_BACKEND
+    if backend == "xlsx" and os.path.splitext(path)[1].lower() in XLSX_EXTENSIONS:
+        return "xlsx"
+    return "com"
+
+def excel_cache_path(path, sheet_name, required_col_index, stop_on_empty_first_row_col, backend=None):
+    """Returns the sidecar file used to cache a workbook read with the given options and reader.
+
+    Args:
+        path (str): Full file path to the Excel file.
+        sheet_name (str): Name of the sheet read.
+        required_col_index (int): Required column used for the read.
+        stop_on_empty_first_row_col (bool): Column trimming used for the read.
+        backend (str, optional): "xlsx" or "com". Defaults to EXCEL_READ_BACKEND.
+
+    Returns:
+        str: Full path of the cache file (it may not exist yet).
 
     Raises:
-        ValueError: If duplicate keys are found.
+        IOError, OSError: If the cache folder cannot be created.
     """
+    backend = excel_effective_backend(path, backend)
+    key = "|".join([os.path.normcase(os.path.abspath(path)), str(sheet_name),
+                    str(required_col_index), str(bool(stop_on_empty_first_row_col)),
+                    backend, str(EXCEL_READER_VERSIONS[backend])])
+    key_hash = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    file_name = "{}_{}.jsonl".format(sanitize_filename(os.path.splitext(os.path.basename(path))[0]), key_hash)
+    return os.path.join(create_report_directory(EXCEL_CACHE_FOLDER, open_directory=False), file_name)
 
-    result = {}
-    duplicates = []
+def warn_excel_cache(cache_path, error):
+    """Prints a non-fatal warning when the Excel cache cannot be used: the read goes on without it.
 
-    for row in data[start_row:]:
+    Args:
+        cache_path (str): Cache file (or folder) that failed.
+        error (Exception): The error raised.
+    """
+    print("Warning: the Excel cache could not be written, the workbook will be read again next time.\n"
+          "{} ({})".format(cache_path, error))
 
-        if not row or len(row) <= key_col:
-            continue
+def read_excel_cache_meta(cache_path):
+    """Reads the first line of a cache file, which describes the workbook it was built from.
 
-        key = row[key_col]
+    Args:
+        cache_path (str): Full path of the cache file.
 
-        if key is None or key == "":
-            if stop_on_empty:
-                break
-            continue
+    Returns:
+        dict: The metadata, or None if the file is missing, unreadable or from another cache version.
+    """
+    try:
+        with open(cache_path, "r") as f:
+            meta = json.loads(f.readline())
+    except (IOError, OSError, ValueError):
+        return None
+    if not isinstance(meta, dict) or meta.get("version") != EXCEL_CACHE_VERSION:
+        return None
+    return meta
 
-        value = None
-        if len(row) > value_col:
-            value = row[value_col]
+def iter_excel_cache_rows(cache_path):
+    """Streams the rows stored in a cache file, one JSON line each.
 
-        if key in result:
-            duplicates.append(key)
-            continue
+    Args:
+        cache_path (str): Full path of the cache file.
 
-        result[str(key)] = str(value) if value is not None else None
+    Yields:
+        list[str]: The cell texts of each row.
+    """
+    with open(cache_path, "r") as f:
+        f.readline()  # metadata
+        for line in f:
+            yield json.loads(line)
 
-    # if duplicates:
-    #     raise ValueError(
-    #         "Duplicate keys found: {}".format(", ".join(map(str, duplicates)))
-    #     )
+def write_excel_cache(cache_path, meta, rows):
+    """Streams rows through while writing them to a cache file.
 
-    # ---------------------------------------
-    # POP-UP WARNING AND STOP SCRIPT
-    # ---------------------------------------
-    if duplicates:
-        message = (
-            "Duplicate keys were found:\n\n{}\n\n"
-            "Please fix the data and run the script again."
-        ).format(", ".join(map(str, duplicates)))
+    Rows are written to a temporary file as they are yielded, and the file only
+    replaces the previous cache once every row has gone through, so an interrupted
+    or partially consumed read never leaves a truncated cache behind.
+    Write errors are reported with warn_excel_cache and never stop the read.
 
-        TaskDialog.Show("Duplicate Keys Found", message)
-        raise SystemExit("Duplicate keys detected")
+    Args:
+        cache_path (str): Full path of the cache file.
+        meta (dict): JSON-serialisable metadata, stored on the first line.
+        rows (iterable[list]): Rows to cache.
 
-    return result
+    Yields:
+        list: The same rows, unchanged.
+    """
+    temp_path = cache_path + ".tmp"
+    f = None
+    try:
+        f = open(temp_path, "w")
+        f.write(json.dumps(meta, separators=(",", ":")) + "\n")
+    except (IOError, OSError) as e:
+        warn_excel_cache(cache_path, e)
+        f = discard_excel_cache(f, temp_path)
 
-    return result
+    try:
+        for row in rows:
+            if f is not None:
+                try:
+                    f.write(json.dumps(row, separators=(",", ":")) + "\n")
+                except (IOError, OSError) as e:
+                    warn_excel_cache(cache_path, e)
+                    f = discard_excel_cache(f, temp_path)
+            yield row
+
+        if f is not None:
+            try:
+                f.close()
+                f = None
+                if os.path.exists(cache_path):
+                    os.remove(cache_path)
+                os.rename(temp_path, cache_path)
+            except (IOError, OSError) as e:
+                warn_excel_cache(cache_path, e)
+    finally:
+        # Not fully consumed (or failed): drop the partial file
+        discard_excel_cache(f, temp_path)
+
+def discard_excel_cache(f, temp_path):
+    """Closes and removes a partial cache file, ignoring errors.
 
-def list_to_dict_excel(data, key_col_index=0, keyword=None):
+    Returns:
+        None: So callers can write f = discard_excel_cache(f, temp_path).
     """
-    Converts a 2D list (such as data read from Excel) into a dictionary
-    keyed by a specified column, optionally filtering out headers
-    containing a keyword, and detecting duplicate keys.
+    if f is not None:
+        try:
+            f.close()
+            os.remove(temp_path)
+        except (IOError, OSError):
+            pass
+    return None
+
+def timed_excel_rows(label, path, start, rows):
+    """Streams rows and reports the read time with report_excel_read_timing once they have all been consumed."""
+    first, count = [], 0
+    for row in rows:
+        if not count:
+            first = [row]
+        count += 1
+        yield row
+    report_excel_read_timing(label, path, start, first, row_count=count)
+
+def excel_read_cached(path, sheet_name="Sheet1", required_col_index=1, stop_on_empty_first_row_col=True, backend=None, report_timing=False):
+    """
+    Streams the rows of an Excel sheet like excel_iter_rows, reusing the rows
+    parsed on a previous run when the file has not changed.
+
+    The cache is a JSON-lines sidecar per file, read options and reader
+    (backend + EXCEL_READER_VERSIONS), validated with:
+        - modification time and size: unchanged -> cached rows are streamed
+          without opening the workbook.
+        - SHA-1 of the contents: if the time changed but the size did not
+          (file copied or re-saved without edits), the hash decides.
+    Anything else streams the workbook and refreshes the cache as the rows go by;
+    the new cache is only kept once every row has been consumed.
+
+    The cache is best-effort: if it cannot be written (read-only or full disk,
+    no permission on the folder...) a warning is printed and the rows are still returned.
 
     Args:
-        data (list[list]): The full dataset where data[0] contains headers.
-        key_col_index (int, optional): Index of the column used as the dictionary key.
-                                       Default is 0.
-        keyword (str, optional): If provided, any column whose header contains this keyword
-                                 (case-insensitive) will be skipped.
+        path (str): Full file path to the Excel file.
+        sheet_name (str, optional): Name of the sheet to read. Defaults to "Sheet1".
+        required_col_index (int, optional): Column index (1-based) that must have a
+                                            value for a row to be included. If None,
+                                            all rows are included. Defaults to 1.
+        stop_on_empty_first_row_col (bool, optional): If True, stops reading columns
+                                                      once an empty cell is found
+                                                      in the first row. Defaults to True.
+        backend (str, optional): "xlsx" or "com". Defaults to EXCEL_READ_BACKEND.
+        report_timing (bool, optional): If True, prints the time spent reading
+                                        once all rows have been consumed.
 
     Returns:
-        dict: A dictionary where each key is taken from key_col_index and maps to
-              a sub-dictionary of remaining header/value pairs.
+        generator: Yields list[str], the cell texts of each row.
 
     Raises:
-        SystemExit: If duplicate keys are found in key_col_index.
+        IOError, OSError: If the Excel file cannot be found or read.
     """
+    start = time.time()
+    backend = excel_effective_backend(path, backend)
 
-    headers = data[0]
-    result = {}
-    duplicates = []
+    stat = os.stat(path)
+    mtime, size = stat.st_mtime, stat.st_size
 
-    for row in data[1:]:
-        # Skip empty or insufficient rows
-        if not row or len(row) <= key_col_index:
-            continue
+    try:
+        cache_path = excel_cache_path(path, sheet_name, required_col_index, stop_on_empty_first_row_col, backend)
+    except (IOError, OSError) as e:
+        warn_excel_cache(EXCEL_CACHE_FOLDER, e)
+        cache_path = None
+
+    cached = read_excel_cache_meta(cache_path) if cache_path else None
+    if cached and (cached.get("backend") != backend
+                   or cached.get("reader_version") != EXCEL_READER_VERSIONS[backend]):
+        cached = None
+
+    label, rows, sha1 = None, None, None
+    if cached and cached["size"] == size:
+        if cached["mtime"] == mtime:
+            label, rows = "Excel read (cache)", iter_excel_cache_rows(cache_path)
+        else:
+            sha1 = file_sha1(path)
+            if cached["sha1"] == sha1:
+                # Same contents: rewrite the cache with the new time while streaming it
+                cached["mtime"] = mtime
+                label = "Excel read (cache, hash match)"
+                rows = write_excel_cache(cache_path, cached, iter_excel_cache_rows(cache_path))
+
+    if rows is None:
+        label = "Excel read ({})".format("native xlsx" if backend == "xlsx" else "COM bulk")
+        rows = excel_iter_rows(path, sheet_name, required_col_index, stop_on_empty_first_row_col, backend)
+        if cache_path:
+            rows = write_excel_cache(cache_path, {
+                "version": EXCEL_CACHE_VERSION,
+                "backend": backend,
+                "reader_version": EXCEL_READER_VERSIONS[backend],
+                "path": path,
+                "mtime": mtime,
+                "size": size,
+                "sha1": sha1 or file_sha1(path),
+            }, rows)
+
+    if report_timing:
+        rows = timed_excel_rows(label, path, start, rows)
+    return rows
+
+def excel_iter_rows(path, sheet_name="Sheet1", required_col_index=1, stop_on_empty_first_row_col=True, backend=None):
+    """
+    Streams the rows of an Excel sheet with the selected reader.
 
-        key = row[key_col_index]
-        if key is None:
-            continue
+    Same rows as excel_read, but yielded one at a time so callers can chain
+    excel_bind_headers / excel_keyed_dict without materialising the sheet.
 
-        # Detect duplicates
-        if key in result:
-            duplicates.append(key)
-            continue
+    Args:
+        path (str): Full file path to the Excel file.
+        sheet_name (str, optional): Name of the sheet to read. Defaults to "Sheet1".
+        required_col_index (int, optional): Column index (1-based) that must have a
+                                            value for a row to be included. If None,
+                                            all rows are included. Defaults to 1.
+        stop_on_empty_first_row_col (bool, optional): If True, stops reading columns
+                                                      once an empty cell is found
+                                                      in the first row. Defaults to True.
+        backend (str, optional): "xlsx" or "com". Defaults to EXCEL_READ_BACKEND.
+
+    Returns:
+        generator: Yields list[str], the cell texts of each row.
+    """
+    if excel_effective_backend(path, backend) == "xlsx":
+        return iter_xlsx_rows(path, sheet_name, required_col_index, stop_on_empty_first_row_col)
 
-        item = {}
-        for i, value in enumerate(row):
-            if i < len(headers):
-                header = headers[i]
+    return excel_iter_rows_via_com(path, sheet_name, required_col_index, stop_on_empty_first_row_col)
 
-                # Skip the key column
-                if i == key_col_index:
-                    continue
+def excel_bind_headers(rows, key_col_index=0, keyword=None):
+    """
+    Binds the data rows of a table to its header row.
 
-                # Skip fields whose header contains the keyword
-                if keyword and keyword.lower() in str(header).lower():
-                    continue
+    The first row is consumed as the header; the remaining rows are bound lazily,
+    one at a time, as the returned generator is consumed.
 
-                item[header] = value
+    Args:
+        rows (iterable[list]): Table rows (list or generator); the first row holds the headers.
+        key_col_index (int, optional): Index of the column used as the key. Default is 0.
+        keyword (str, optional): If provided, any column whose header contains this keyword
+                                 (case-insensitive) will be skipped.
+
+    Returns:
+        tuple(list, generator): The header row, and a generator of (key, {header: value})
+                                pairs. Rows that are empty, too short or have no key are skipped.
+    """
+    rows = iter(rows)
+    headers = next(rows, [])
+
+    # Columns to keep, resolved once instead of per row
+    columns = [(i, header) for i, header in enumerate(headers)
+               if i != key_col_index
+               and not (keyword and keyword.lower() in str(header).lower())]
+
+    def records():
+        for row in rows:
+            # Skip empty or insufficient rows
+            if not row or len(row) <= key_col_index:
+                continue
+
+            key = row[key_col_index]
+            if key is None:
+                continue
 
-        result[key] = item
+            n = len(row)
+            yield key, dict((header, row[i]) for i, header in columns if i < n)
+
+    return headers, records()
+
+def excel_keyed_dict(records):
+    """
+    Builds a dictionary from (key, value) pairs, detecting duplicate keys as they stream by.
+
+    Args:
+        records (iterable[tuple]): (key, value) pairs, e.g. from excel_bind_headers.
+
+    Returns:
+        dict: {key: value}. The first occurrence of a key wins.
+
+    Raises:
+        SystemExit: If duplicate keys are found (after listing all of them in a pop-up).
+    """
+    result = {}
+    duplicates = []
+
+    for key, value in records:
+        # Detect duplicates
+        if key in result:
+            duplicates.append(key)
+            continue
+        result[key] = value
 
     # ---------------------------------------
     # POP-UP WARNING AND STOP SCRIPT
@@ -227,3 +691,66 @@ def list_to_dict_excel(data, key_col_index=0, keyword=None):
         raise SystemExit("Duplicate keys detected")
 
     return result
+
+def excel_rows_to_dict(data, start_row, key_col=0, value_col=1, stop_on_empty=True):
+    """
+    Converts a 2D list into a simple dictionary {key: value}.
+
+    Args:
+        data (iterable[list]): Full dataset from Excel (list or row generator).
+        start_row (int): Row index where data begins (0-based).
+        key_col (int): Column index for dictionary key.
+        value_col (int): Column index for dictionary value.
+        stop_on_empty (bool): Stop reading when key cell is empty.
+
+    Returns:
+        dict
+
+    Raises:
+        SystemExit: If duplicate keys are found.
+    """
+
+    def records():
+        for row in itertools.islice(data, start_row, None):
+
+            if not row or len(row) <= key_col:
+                continue
+
+            key = row[key_col]
+
+            if key is None or key == "":
+                if stop_on_empty:
+                    break
+                continue
+
+            value = None
+            if len(row) > value_col:
+                value = row[value_col]
+
+            yield str(key), str(value) if value is not None else None
+
+    return excel_keyed_dict(records())
+
+def list_to_dict_excel(data, key_col_index=0, keyword=None):
+    """
+    Converts a 2D list (such as data read from Excel) into a dictionary
+    keyed by a specified column, optionally filtering out headers
+    containing a keyword, and detecting duplicate keys.
+
+    Args:
+        data (iterable[list]): The full dataset where the first row contains headers
+                               (list or row generator, e.g. from excel_iter_rows).
+        key_col_index (int, optional): Index of the column used as the dictionary key.
+                                       Default is 0.
+        keyword (str, optional): If provided, any column whose header contains this keyword
+                                 (case-insensitive) will be skipped.
+
+    Returns:
+        dict: A dictionary where each key is taken from key_col_index and maps to
+              a sub-dictionary of remaining header/value pairs.
+
+    Raises:
+        SystemExit: If duplicate keys are found in key_col_index.
+    """
+    headers, records = excel_bind_headers(data, key_col_index, keyword)
+    return excel_keyed_dict(records)
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+# Imports
+#==================================================
+from Autodesk.Revit.DB import *
+from System import AppDomain
+
+# Variables
+#==================================================
+app   = __revit__.Application
+uidoc = __revit__.ActiveUIDocument
+doc   = uidoc.Document if uidoc else None #type:Document  (hooks can run with no active document)
+
+# pyRevit imports the lib modules again on every command, so the indexes are kept
+# in the AppDomain data of the Revit process: {document key: ElementIndex}
+ELEMENT_INDEX_STORE_KEY = "Bimming.ElementIndex"
+
+# Classes
+#==================================================
+
+class ElementIndex(object):
+    """
+    Views and scope boxes of a document, each collected on first use and kept
+    until the document changes: hooks/doc-changed.py drops the whole index after
+    any transaction, so it is never updated, only rebuilt.
+
+    Get it with get_element_index(doc) rather than creating it directly.
+
+    Usage:
+        index = get_element_index(doc)
+        views = index.views()
+    """
+
+    def __init__(self, doc):
+        self.doc = doc
+        self._views = None
+        self._scope_boxes = None
+
+    def views(self):
+        """Returns: list[View]: Every view, templates and sheets included (same as OfClass(View))."""
+        if self._views is None:
+            self._views = list(FilteredElementCollector(self.doc).OfClass(View))
+        return self._views
+
+    def scope_boxes(self):
+        """Returns: list[Element]: Every scope box instance."""
+        if self._scope_boxes is None:
+            self._scope_boxes = list(FilteredElementCollector(self.doc)
+                                     .OfCategory(BuiltInCategory.OST_VolumeOfInterest)
+                                     .WhereElementIsNotElementType())
+        return self._scope_boxes
+
+# Functions
+#==================================================
+
+def document_key(doc):
+    """
+    Returns the key identifying an open document in the index store.
+
+    Args:
+        doc (Document): Revit document.
+
+    Returns:
+        str: The document path, or its title if it has not been saved yet.
+    """
+    return doc.PathName or doc.Title
+
+def _index_store(create=False):
+    store = AppDomain.CurrentDomain.GetData(ELEMENT_INDEX_STORE_KEY)
+    if store is None and create:
+        store = {}
+        AppDomain.CurrentDomain.SetData(ELEMENT_INDEX_STORE_KEY, store)
+    return store
+
+def get_element_index(doc):
+    """
+    Returns the element index of a document, creating it on first use.
+
+    Args:
+        doc (Document): Revit document.
+
+    Returns:
+        ElementIndex: The index, valid until the document changes.
+    """
+    store = _index_store(create=True)
+    index = store.get(document_key(doc))
+    if index is None or not index.doc.IsValidObject or not index.doc.Equals(doc):
+        index = ElementIndex(doc)
+        store[document_key(doc)] = index
+    return index
+
+def drop_element_index(doc):
+    """
+    Forgets the index of a document (when it changes or is closed).
+
+    Args:
+        doc (Document): Revit document.
+    """
+    store = _index_store()
+    if store:
+        store.pop(document_key(doc), None)
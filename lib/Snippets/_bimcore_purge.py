@@ -6,6 +6,7 @@ from Autodesk.Revit.DB import *
 
 from pyrevit import revit, DB
 from pyrevit import script
+from Snippets._bimcore_bulk import delete_elements
 
 # Variables
 #==================================================
@@ -75,17 +76,9 @@ def delete_unused_view_templates(doc):
     #       [doc.GetElement(tid).Name for tid in unused_template_ids])
 
     # --- DELETE ---
-    t = Transaction(doc, "KCA-Delete unused view templates")
-    t.Start()
+    result = delete_elements(doc, unused_template_ids, transaction_name="KCA-Delete unused view templates")
 
-    deleted = 0
-    for tid in unused_template_ids:
-        try:
-            doc.Delete(tid)
-            deleted += 1
-        except Exception as e:
-            print("Failed to delete {}: {}".format(tid, e))
+    for tid, e in result.failed:
+        print("Failed to delete {}: {}".format(tid, e))
 
-    t.Commit()
-
-    return deleted
\ No newline at end of file
+    return len(result.deleted)
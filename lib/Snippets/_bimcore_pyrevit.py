@@ -11,10 +11,50 @@ app   = __revit__.Application
 uidoc = __revit__.ActiveUIDocument
 doc   = __revit__.ActiveUIDocument.Document #type:Document
 
+XLSX_WIDTH_SAMPLE_ROWS = 1000  # rows measured to estimate the column widths in streaming mode
+
 # Functions
 #==================================================
 
-def dump(xlfile, datadict, bold_header=False): # last update to make the header bold and auto-adjust the column width
+def _write_rows(xlsheet, rows, header_format=None, max_width=50, sample_rows=None):
+    """Writes rows to a worksheet in order and sets the column widths.
+
+    Column widths are fitted to the content of the first sample_rows rows
+    (all rows if None), with a 2-character padding margin, capped at max_width.
+
+    Returns:
+        tuple(int, int): Number of rows written and number of columns of the first row.
+    """
+    col_widths = {}
+    row_count, col_count = 0, 0
+
+    for row_idx, data in enumerate(rows):
+        if not isinstance(data, (list, tuple)):
+            data = [data]
+
+        fmt = header_format if row_idx == 0 else None
+        xlsheet.write_row(row_idx, 0, data, fmt)
+
+        if row_idx == 0:
+            col_count = len(data)
+        if sample_rows is None or row_idx < sample_rows:
+            for col_idx, cell in enumerate(data):
+                cell_len = len(str(cell))
+                col_widths[col_idx] = max(col_widths.get(col_idx, 0), cell_len)
+        row_count += 1
+
+    # Column widths are stored apart from the cells, so they can be set after writing
+    for col_idx, width in col_widths.items():
+        xlsheet.set_column(col_idx, col_idx, min(width + 2, max_width))
+
+    return row_count, col_count
+
+def _workbook(xlfile, streaming):
+    """Returns a new workbook. In streaming mode each row is flushed to disk as soon as
+    the next one is written (xlsxwriter constant_memory), so rows must be written in order."""
+    return xlsxwriter.Workbook(xlfile, {'constant_memory': True} if streaming else {})
+
+def dump(xlfile, datadict, bold_header=False, streaming=False, sample_rows=XLSX_WIDTH_SAMPLE_ROWS): # last update to make the header bold and auto-adjust the column width
     """Write structured data to an Excel workbook.
 
     Behavior:
@@ -27,8 +67,8 @@ def dump(xlfile, datadict, bold_header=False): # last update to make the header
         xlfile (str):
             Full file path of the target Excel file.
 
-        datadict (dict[str, list[list]]):
-            Dictionary mapping worksheet names to tabular data.
+        datadict (dict[str, iterable[list]]):
+            Dictionary mapping worksheet names to tabular data (lists or row iterators).
             Example:
                 {
                     "SheetA": [
@@ -46,6 +86,15 @@ def dump(xlfile, datadict, bold_header=False): # last update to make the header
             If True, the first row of each sheet is written in bold.
             Defaults to False.
 
+        streaming (bool):
+            If True, rows are written to disk as they come (xlsxwriter
+            constant_memory mode) instead of being kept in memory, and column
+            widths are estimated from the first `sample_rows` rows.
+            Use it for very large exports. Defaults to False.
+
+        sample_rows (int):
+            Rows measured to fit the column widths in streaming mode.
+
     Notes:
         - Worksheet names are automatically set to "Sheet1" when only one
           dataset is provided, to match Excel defaults.
@@ -54,7 +103,7 @@ def dump(xlfile, datadict, bold_header=False): # last update to make the header
         - Column widths are auto-fitted based on cell content, capped at 50
           characters, with a 2-character padding margin.
     """
-    xlwb = xlsxwriter.Workbook(xlfile)
+    xlwb = _workbook(xlfile, streaming)
     header_format = xlwb.add_format({'bold': True}) if bold_header else None
 
     single_sheet = len(datadict) == 1
@@ -63,26 +112,12 @@ def dump(xlfile, datadict, bold_header=False): # last update to make the header
         sheet_name = "Sheet1" if single_sheet else xlsheetname
         xlsheet = xlwb.add_worksheet(sheet_name)
 
-        col_widths = {}
-        max_width = 80
-
-        for idx, data in enumerate(xlsheetdata):
-            if not isinstance(data, (list, tuple)):
-                data = [data]
-
-            fmt = header_format if (bold_header and idx == 0) else None
-            xlsheet.write_row(idx, 0, data, fmt)
-
-            for col_idx, cell in enumerate(data):
-                cell_len = len(str(cell))
-                col_widths[col_idx] = max(col_widths.get(col_idx, 0), cell_len)
-
-        for col_idx, width in col_widths.items():
-            xlsheet.set_column(col_idx, col_idx, min(width + 2, max_width))
+        _write_rows(xlsheet, xlsheetdata, header_format, max_width=80,
+                    sample_rows=sample_rows if streaming else None)
 
     xlwb.close()
 
-def dump2(xlfile, datadict):
+def dump2(xlfile, datadict, streaming=False, sample_rows=XLSX_WIDTH_SAMPLE_ROWS):
     """Write structured data to an Excel workbook with basic formatting.
 
     Features:
@@ -92,12 +127,16 @@ def dump2(xlfile, datadict):
         - Bold header row (first row)
         - Freeze top row
         - Autofilter applied to header row
+        - Streaming mode for very large exports: rows are written to disk as
+          they come and column widths are estimated from the first rows
 
     Args:
         xlfile (str): Full file path of the target Excel file
-        datadict (dict[str, list[list]]): Sheet name → tabular data
+        datadict (dict[str, iterable[list]]): Sheet name → tabular data (lists or row iterators)
+        streaming (bool): Use xlsxwriter constant_memory mode. Defaults to False.
+        sample_rows (int): Rows measured to fit the column widths in streaming mode.
     """
-    xlwb = xlsxwriter.Workbook(xlfile)
+    xlwb = _workbook(xlfile, streaming)
     header_format = xlwb.add_format({'bold': True})
 
     single_sheet = len(datadict) == 1
@@ -106,34 +145,14 @@ def dump2(xlfile, datadict):
         sheet_name = "Sheet1" if single_sheet else xlsheetname
         xlsheet = xlwb.add_worksheet(sheet_name)
 
-        col_widths = {}
-        max_width = 50  # cap to avoid huge columns
-
-        for row_idx, data in enumerate(xlsheetdata):
-            if not isinstance(data, (list, tuple)):
-                data = [data]
-
-            # Apply header format to first row
-            fmt = header_format if row_idx == 0 else None
-            xlsheet.write_row(row_idx, 0, data, fmt)
-
-            # Track column widths
-            for col_idx, cell in enumerate(data):
-                cell_len = len(str(cell))
-                col_widths[col_idx] = max(col_widths.get(col_idx, 0), cell_len)
-
-        # Set column widths
-        for col_idx, width in col_widths.items():
-            width = min(width + 2, max_width)
-            xlsheet.set_column(col_idx, col_idx, width)
+        row_count, col_count = _write_rows(xlsheet, xlsheetdata, header_format, max_width=50,  # cap to avoid huge columns
+                                           sample_rows=sample_rows if streaming else None)
 
         # Freeze top row
         xlsheet.freeze_panes(1, 0)
 
         # Apply autofilter (only if there's at least 1 data row)
-        if xlsheetdata:
-            last_col = len(xlsheetdata[0]) - 1
-            last_row = len(xlsheetdata) - 1
-            xlsheet.autofilter(0, 0, last_row, last_col)
+        if row_count:
+            xlsheet.autofilter(0, 0, row_count - 1, col_count - 1)
 
-    xlwb.close()
\ No newline at end of file
+    xlwb.close()
@@ -3,6 +3,10 @@
 # Imports
 #==================================================
 from Snippets._bimcore_vectors import  *
+from Autodesk.Revit.DB import *
+import clr
+import System
+from System.Collections.Generic import List
 
 # Variables
 #==================================================
@@ -65,4 +69,82 @@ def rotate_scope_box(scope_box, angle_degrees):
     angle_radians = math.radians(angle_degrees)
 
     # Rotate the scope box
-    ElementTransformUtils.RotateElement(doc, scope_box.Id, axis, angle_radians)
\ No newline at end of file
+    ElementTransformUtils.RotateElement(doc, scope_box.Id, axis, angle_radians)
+
+
+def scope_box_assigned_filter(built_in_parameter):
+    """
+    Returns a collector filter passing only elements whose scope box parameter is set.
+
+    The rule is evaluated natively by Revit (ParameterValueProvider on the
+    parameter id), so elements without a scope box are never returned to Python.
+
+    Args:
+        built_in_parameter (BuiltInParameter): VIEWER_VOLUME_OF_INTEREST_CROP (views)
+                                               or DATUM_VOLUME_OF_INTEREST (datums).
+
+    Returns:
+        ElementParameterFilter
+    """
+    rule = ParameterFilterRuleFactory.CreateNotEqualsRule(ElementId(built_in_parameter), ElementId.InvalidElementId)
+    return ElementParameterFilter(rule)
+
+
+class ScopeBoxUsageIndex(object):
+    """
+    Maps every scope box to the views and datums (levels, grids, reference planes) that use it.
+
+    Built with two native filtered collectors: one for views with a scope box and
+    one for datums with a scope box. Only the matching elements are read.
+
+    Usage:
+        usage = ScopeBoxUsageIndex(doc)
+        usage.users(scope_box)    # [ElementId] of views / datums using it
+        usage.is_used(scope_box)
+    """
+
+    def __init__(self, doc):
+        self.doc = doc
+        self._users = {}  # scope box id (int) -> [ElementId]
+
+        # Views (templates skipped, as they are not a real use of the box)
+        views = (FilteredElementCollector(doc)
+                 .OfClass(View)
+                 .WherePasses(scope_box_assigned_filter(BuiltInParameter.VIEWER_VOLUME_OF_INTEREST_CROP)))
+        for view in views:
+            if view.IsTemplate:
+                continue
+            self._add(view, BuiltInParameter.VIEWER_VOLUME_OF_INTEREST_CROP)
+
+        # Levels, grids and reference planes
+        datum_classes = List[System.Type]([clr.GetClrType(Level), clr.GetClrType(Grid), clr.GetClrType(ReferencePlane)])
+        datums = (FilteredElementCollector(doc)
+                  .WherePasses(ElementMulticlassFilter(datum_classes))
+                  .WherePasses(scope_box_assigned_filter(BuiltInParameter.DATUM_VOLUME_OF_INTEREST)))
+        for datum in datums:
+            self._add(datum, BuiltInParameter.DATUM_VOLUME_OF_INTEREST)
+
+    def _add(self, element, built_in_parameter):
+        scope_box_id = element.get_Parameter(built_in_parameter).AsElementId()
+        self._users.setdefault(scope_box_id.IntegerValue, []).append(element.Id)
+
+    def users(self, scope_box):
+        """
+        Args:
+            scope_box (Element or ElementId): The scope box.
+
+        Returns:
+            list[ElementId]: Views and datums that use the scope box.
+        """
+        scope_box_id = scope_box if isinstance(scope_box, ElementId) else scope_box.Id
+        return self._users.get(scope_box_id.IntegerValue, [])
+
+    def is_used(self, scope_box):
+        """
+        Args:
+            scope_box (Element or ElementId): The scope box.
+
+        Returns:
+            bool: True if any view or datum uses the scope box.
+        """
+        return bool(self.users(scope_box))
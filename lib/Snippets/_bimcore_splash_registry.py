@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+# Imports
+#==================================================
+from Autodesk.Revit.DB import *
+from Autodesk.Revit.DB.ExtensibleStorage import AccessLevel, Entity, Schema, SchemaBuilder
+from System import Guid
+from System.Collections.Generic import IList, List
+
+# Variables
+#==================================================
+app   = __revit__.Application
+uidoc = __revit__.ActiveUIDocument
+doc   = __revit__.ActiveUIDocument.Document #type:Document
+
+# Extensible storage schema kept on each view colored by the splashers.
+# Never change the GUID or the fields of a released schema: create a new one instead.
+SPLASH_REGISTRY_SCHEMA_GUID = "156934ce-29b2-40b6-b367-d7d245a2df96"
+SPLASH_REGISTRY_SCHEMA_NAME = "BimmingSplashRegistry"
+SPLASH_REGISTRY_FIELD       = "ElementIds"
+
+# Functions
+#==================================================
+
+def get_splash_registry_schema():
+    """
+    Returns the schema of the splash registry, creating it the first time.
+
+    Returns:
+        Schema: Schema with one ElementId array field (SPLASH_REGISTRY_FIELD).
+    """
+    guid = Guid(SPLASH_REGISTRY_SCHEMA_GUID)
+    schema = Schema.Lookup(guid)
+    if schema is None:
+        builder = SchemaBuilder(guid)
+        builder.SetSchemaName(SPLASH_REGISTRY_SCHEMA_NAME)
+        builder.SetDocumentation("Elements whose graphics were overridden in the view by the Bimming splashers.")
+        builder.SetReadAccessLevel(AccessLevel.Public)
+        builder.SetWriteAccessLevel(AccessLevel.Public)
+        builder.AddArrayField(SPLASH_REGISTRY_FIELD, ElementId)
+        schema = builder.Finish()
+    return schema
+
+def read_splashed_ids(view):
+    """
+    Returns the elements the splashers have overridden in a view.
+
+    Args:
+        view (View): View to read.
+
+    Returns:
+        list[ElementId]: Registered ids that still exist in the document (empty if none).
+    """
+    schema = Schema.Lookup(Guid(SPLASH_REGISTRY_SCHEMA_GUID))
+    if schema is None:
+        return []
+    entity = view.GetEntity(schema)
+    if not entity.IsValid():
+        return []
+    element_ids = entity.Get[IList[ElementId]](SPLASH_REGISTRY_FIELD)
+    return [element_id for element_id in element_ids if view.Document.GetElement(element_id) is not None]
+
+def register_splashed_ids(view, element_ids):
+    """
+    Adds elements to the registry of a view. Must be called inside a transaction.
+
+    Args:
+        view (View): View where the elements were overridden.
+        element_ids (iterable[ElementId]): Elements overridden by a splasher.
+
+    Returns:
+        int: Number of elements registered in the view.
+    """
+    registered = {}
+    for element_id in list(read_splashed_ids(view)) + list(element_ids):
+        registered[element_id.IntegerValue] = element_id
+
+    entity = Entity(get_splash_registry_schema())
+    entity.Set[IList[ElementId]](SPLASH_REGISTRY_FIELD, List[ElementId](registered.values()))
+    view.SetEntity(entity)
+    return len(registered)
+
+def clear_splashed_ids(view):
+    """
+    Empties the registry of a view. Must be called inside a transaction.
+
+    Args:
+        view (View): View to clear.
+    """
+    schema = Schema.Lookup(Guid(SPLASH_REGISTRY_SCHEMA_GUID))
+    if schema is not None and view.GetEntity(schema).IsValid():
+        view.DeleteEntity(schema)
@@ -76,6 +76,44 @@ def get_view_type_name(doc, view):
         return view_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM).AsString()  # Get name
     return None
 
+class ViewInfoCache(object):
+    """
+    Resolves the owner view data of view-specific elements, once per view.
+
+    Usage:
+        view_cache = ViewInfoCache(doc)
+        info = view_cache.get(element.OwnerViewId)
+        info["view"], info["name"], info["view_type"], info["view_type_name"], info["sheet_info"]
+    """
+
+    def __init__(self, doc):
+        self.doc = doc
+        self._views = {}  # view id (int) -> info dict
+
+    def get(self, view_id):
+        """
+        Args:
+            view_id (ElementId): Id of the view, e.g. element.OwnerViewId.
+
+        Returns:
+            dict: view (View), name, view_type (family name of the view type, e.g. "Floor Plan"),
+                  view_type_name and sheet_info (VIEW_SHEET_VIEWPORT_INFO).
+        """
+        key = view_id.IntegerValue
+        info = self._views.get(key)
+        if info is None:
+            view = self.doc.GetElement(view_id)
+            view_type = self.doc.GetElement(view.GetTypeId())
+            sheet_info = view.get_Parameter(BuiltInParameter.VIEW_SHEET_VIEWPORT_INFO)
+            info = self._views[key] = {
+                "view":           view,
+                "name":           view.Name,
+                "view_type":      view_type.FamilyName if view_type else None,
+                "view_type_name": view_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM).AsString() if view_type else None,
+                "sheet_info":     sheet_info.AsString() if sheet_info else None,
+            }
+        return info
+
 def get_section_box(doc, view):
     """Collect all dependent elements of a view that belong to the OST_SectionBox category."""
     if isinstance(view, View):
@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+
+# Imports
+#==================================================
+# Pure Python on purpose: no Revit API and no Office, so it also runs (and can be tested) outside Revit.
+import posixpath
+import re
+import zipfile
+
+try:
+    from xml.etree import cElementTree as ElementTree
+except ImportError:
+    from xml.etree import ElementTree
+
+# Variables
+#==================================================
+NS_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+NS_DOC_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+NS_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+CELL_REF_PATTERN = re.compile(r"^([A-Z]+)(\d+)$")
+
+# Functions
+#==================================================
+
+def number_to_text(value):
+    """
+    Formats a number the way Excel displays it with the 'General' number format.
+
+    Args:
+        value (float or str): The number, or its text as stored in the .xlsx file.
+
+    Returns:
+        str: "12" for whole numbers, otherwise up to 15 significant digits.
+    """
+    value = float(value)
+    if value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return ("%.15g" % value).upper()
+
+def column_index(cell_ref):
+    """
+    Converts a cell reference into its 1-based column index.
+
+    Args:
+        cell_ref (str): Cell reference, e.g. "A1" or "AB12".
+
+    Returns:
+        int: The column index, e.g. "A1" -> 1, "AB12" -> 28.
+    """
+    letters = CELL_REF_PATTERN.match(cell_ref).group(1)
+    index = 0
+    for letter in letters:
+        index = index * 26 + (ord(letter) - 64)
+    return index
+
+def parse_range_ref(range_ref):
+    """
+    Returns the last row and column of a range reference.
+
+    Args:
+        range_ref (str): Range reference, e.g. "A1:K200" or "A1".
+
+    Returns:
+        tuple(int, int): (max_row, max_col), e.g. "A1:K200" -> (200, 11).
+    """
+    last = range_ref.split(":")[-1]
+    match = CELL_REF_PATTERN.match(last)
+    return int(match.group(2)), column_index(last)
+
+def _rich_text(element):
+    """Joins the text of a <si> or <is> element, including rich text runs and skipping phonetic hints."""
+    parts = []
+    for child in element:
+        if child.tag == NS_MAIN + "t":
+            parts.append(child.text or "")
+        elif child.tag == NS_MAIN + "r":
+            for run_child in child:
+                if run_child.tag == NS_MAIN + "t":
+                    parts.append(run_child.text or "")
+    return "".join(parts)
+
+
+class XlsxWorkbook(object):
+    """
+    Streaming reader for .xlsx / .xlsm workbooks that parses the zip/XML parts directly.
+
+    Worksheets are parsed row by row, shared strings are only loaded when the
+    first text cell needs them, and numbers are only formatted when a cell is read.
+
+    Usage:
+        with XlsxWorkbook(path) as wb:
+            for row_number, cells in wb.iter_rows("Sheet1"):
+                texts = [wb.cell_text(cell) for cell in cells]
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._zip = zipfile.ZipFile(path)
+        self._sheets = None          # [(sheet name, part path)] in workbook order
+        self._active_index = 0
+        self._shared_strings = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._zip.close()
+
+    # WORKBOOK STRUCTURE
+    def _load_workbook(self):
+        rels = ElementTree.fromstring(self._zip.read("xl/_rels/workbook.xml.rels"))
+        targets = {}
+        for rel in rels.iter(NS_PKG_REL + "Relationship"):
+            target = rel.get("Target")
+            if target.startswith("/"):
+                target = target[1:]
+            else:
+                target = posixpath.normpath(posixpath.join("xl", target))
+            targets[rel.get("Id")] = target
+
+        workbook = ElementTree.fromstring(self._zip.read("xl/workbook.xml"))
+        self._sheets = [(sheet.get("name"), targets[sheet.get(NS_DOC_REL + "id")])
+                        for sheet in workbook.iter(NS_MAIN + "sheet")]
+
+        view = workbook.find("{0}bookViews/{0}workbookView".format(NS_MAIN))
+        if view is not None:
+            self._active_index = int(view.get("activeTab", 0))
+
+    @property
+    def sheet_names(self):
+        """list[str]: Worksheet names in workbook order."""
+        if self._sheets is None:
+            self._load_workbook()
+        return [name for name, _ in self._sheets]
+
+    def sheet_part(self, sheet_name=None):
+        """
+        Returns the zip part of a worksheet.
+
+        Args:
+            sheet_name (str, optional): Worksheet name. If None or not found, the
+                                        active sheet is used (same fallback as the
+                                        COM reader).
+
+        Returns:
+            str: Zip member name, e.g. "xl/worksheets/sheet1.xml".
+        """
+        if self._sheets is None:
+            self._load_workbook()
+        for name, part in self._sheets:
+            if name == sheet_name:
+                return part
+        return self._sheets[min(self._active_index, len(self._sheets) - 1)][1]
+
+    def dimension(self, sheet_name=None):
+        """
+        Reads the <dimension> of a worksheet without parsing its rows.
+
+        Args:
+            sheet_name (str, optional): Worksheet name (see sheet_part).
+
+        Returns:
+            tuple(int, int) or None: (max_row, max_col), or None if the file does not store it.
+        """
+        source = self._zip.open(self.sheet_part(sheet_name))
+        try:
+            for event, element in ElementTree.iterparse(source, events=("start",)):
+                if element.tag == NS_MAIN + "dimension":
+                    return parse_range_ref(element.get("ref"))
+                if element.tag == NS_MAIN + "sheetData":
+                    return None
+        finally:
+            source.close()
+        return None
+
+    # CELLS
+    @property
+    def shared_strings(self):
+        """list[str]: Shared string table, parsed on first use."""
+        if self._shared_strings is None:
+            self._shared_strings = []
+            if "xl/sharedStrings.xml" in self._zip.namelist():
+                source = self._zip.open("xl/sharedStrings.xml")
+                try:
+                    table = None
+                    for event, element in ElementTree.iterparse(source, events=("start", "end")):
+                        if event == "start":
+                            if element.tag == NS_MAIN + "sst":
+                                table = element
+                        elif element.tag == NS_MAIN + "si":
+                            self._shared_strings.append(_rich_text(element))
+                            # Detach the parsed string, a cleared element still stays in the tree
+                            if table is not None:
+                                del table[:]
+                finally:
+                    source.close()
+        return self._shared_strings
+
+    def cell_text(self, cell):
+        """
+        Decodes a raw cell from iter_rows into the text Excel displays.
+
+        Args:
+            cell (tuple(str, str) or None): (cell type, raw value) as stored in the sheet XML.
+
+        Returns:
+            str: The cell text. Empty cells return "".
+        """
+        if cell is None:
+            return ""
+        cell_type, raw = cell
+        if raw is None or raw == "":
+            return ""
+        if cell_type == "s":
+            return self.shared_strings[int(raw)]
+        if cell_type == "b":
+            return "TRUE" if raw == "1" else "FALSE"
+        if cell_type in ("n", None):
+            return number_to_text(raw)
+        # "str" (formula text), "inlineStr", "e" (errors such as #N/A) and "d" (ISO dates) are stored as text
+        return raw
+
+    def iter_rows(self, sheet_name=None):
+        """
+        Streams the rows of a worksheet.
+
+        Only one row is held in memory at a time. Rows with no stored cells are
+        not yielded, so gaps can be detected through the row number.
+
+        Args:
+            sheet_name (str, optional): Worksheet name (see sheet_part).
+
+        Yields:
+            tuple(int, list): (1-based row number, raw cells). The cell list is dense up to
+                              the last stored cell; missing cells are None. Decode each cell
+                              with cell_text.
+        """
+        tag_sheet_data = NS_MAIN + "sheetData"
+        tag_row = NS_MAIN + "row"
+        tag_value = NS_MAIN + "v"
+        tag_inline = NS_MAIN + "is"
+        columns = {}  # column letters -> index, computed once per column
+
+        source = self._zip.open(self.sheet_part(sheet_name))
+        try:
+            last_row_number = 0
+            sheet_data = None
+            for event, element in ElementTree.iterparse(source, events=("start", "end")):
+                if event == "start":
+                    if element.tag == tag_sheet_data:
+                        sheet_data = element
+                    continue
+                if element.tag != tag_row:
+                    continue
+
+                cells = []
+                for cell in element:
+                    ref = cell.get("r")
+                    if ref:
+                        letters = ref.rstrip("0123456789")
+                        col = columns.get(letters)
+                        if col is None:
+                            col = columns[letters] = column_index(ref)
+                    else:
+                        col = len(cells) + 1
+
+                    cell_type = cell.get("t")
+                    if cell_type == "inlineStr":
+                        inline = cell.find(tag_inline)
+                        raw = _rich_text(inline) if inline is not None else None
+                    else:
+                        raw = cell.findtext(tag_value)
+
+                    if raw is not None:
+                        if col > len(cells):
+                            cells.extend([None] * (col - len(cells)))
+                        cells[col - 1] = (cell_type, raw)
+
+                number = element.get("r")
+                row_number = int(number) if number else last_row_number + 1
+                last_row_number = row_number
+
+                # Detach the parsed row from <sheetData> so memory stays flat on large sheets
+                # (clear() alone would leave one empty element per row in the tree)
+                element.clear()
+                if sheet_data is not None:
+                    del sheet_data[:]
+
+                if cells:
+                    yield row_number, cells
+        finally:
+            source.close()
+
+
+def iter_xlsx_rows(path, sheet_name="Sheet1", required_col_index=1, stop_on_empty_first_row_col=True):
+    """
+    Streams an .xlsx sheet without Excel, yielding the same rows as excel_read_via_com.
+
+    Only the current row is held in memory.
+
+    Args:
+        path (str): Full file path to the .xlsx file.
+        sheet_name (str, optional): Name of the sheet to read. Falls back to the
+                                    active sheet. Defaults to "Sheet1".
+        required_col_index (int, optional): Column index (1-based) that must have a
+                                            value for a row to be included. If None,
+                                            all rows are included. Defaults to 1.
+        stop_on_empty_first_row_col (bool, optional): If True, stops reading columns
+                                                      once an empty cell is found
+                                                      in the first row. Defaults to True.
+
+    Yields:
+        list[str]: The cell texts of each row. With stop_on_empty_first_row_col=False
+                   and no <dimension> stored in the file, rows are not padded to a
+                   common width.
+    """
+    with XlsxWorkbook(path) as wb:
+        dimension = wb.dimension(sheet_name)
+        max_row, max_col = dimension if dimension else (0, 0)
+
+        effective_max_col = None if stop_on_empty_first_row_col else max_col
+        expected_row = 1
+
+        for row_number, cells in wb.iter_rows(sheet_name):
+
+            # Determine max column from first row
+            if effective_max_col is None:
+                effective_max_col = 0
+                if row_number == 1:
+                    for cell in cells:
+                        if wb.cell_text(cell) == "":
+                            break
+                        effective_max_col += 1
+
+            width = effective_max_col if stop_on_empty_first_row_col else max(max_col, len(cells))
+
+            # Rows without stored cells only show up when no column is required
+            if required_col_index is None:
+                for _ in range(row_number - expected_row):
+                    yield [""] * width
+            expected_row = row_number + 1
+
+            # REQUIRED COLUMN MUST HAVE A VALUE
+            if required_col_index is not None:
+                if required_col_index > len(cells) or wb.cell_text(cells[required_col_index - 1]) == "":
+                    continue
+
+            row = [wb.cell_text(cell) for cell in cells[:width]]
+            if len(row) < width:
+                row.extend([""] * (width - len(row)))
+            yield row
+
+        if required_col_index is None:
+            for _ in range(max_row - expected_row + 1):
+                yield [""] * (effective_max_col or 0)
+
+def xlsx_read(path, sheet_name="Sheet1", required_col_index=1, stop_on_empty_first_row_col=True):
+    """
+    Reads an .xlsx sheet without Excel, returning the same rows as excel_read_via_com.
+
+    Args:
+        path (str): Full file path to the .xlsx file.
+        sheet_name (str, optional): Name of the sheet to read. Falls back to the
+                                    active sheet. Defaults to "Sheet1".
+        required_col_index (int, optional): Column index (1-based) that must have a
+                                            value for a row to be included. If None,
+                                            all rows are included. Defaults to 1.
+        stop_on_empty_first_row_col (bool, optional): If True, stops reading columns
+                                                      once an empty cell is found
+                                                      in the first row. Defaults to True.
+
+    Returns:
+        list[list]: A 2D list representing the sheet contents,
+                    where each inner list holds the cell texts of a row.
+    """
+    data = list(iter_xlsx_rows(path, sheet_name, required_col_index, stop_on_empty_first_row_col))
+
+    # Pad every row to the same width, as the COM reader does
+    width = max([len(row) for row in data] or [0])
+    for row in data:
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))
+
+    return data